@@ -0,0 +1 @@
+"""파서/파이프라인 성능 측정 도구"""
@@ -0,0 +1,104 @@
+import random
+from datetime import date, timedelta
+from typing import List, Optional
+
+# 실제 보고서에 등장하는 병원 이름과 가끔 섞여 들어오는 이름
+HOSPITALS = ['온리프', '르샤인', '오블리브', '심플']
+EXTRA_HOSPITALS = ['심플치과', '리엔장', '바노바기']
+AUTHORS = ['홍길동', '이은상', '김철수', '박영희', '최민수', '정다은']
+
+# 일부러 깨뜨리는 섹션 종류
+MALFORMED_KINDS = ['no_period', 'no_total', 'no_time_header', 'bad_hours', 'repeated_header', 'empty']
+
+def _week_of_month(day: date) -> int:
+    """해당 월의 몇 번째 주인지 계산 (README의 주차 계산과 동일)"""
+    first_weekday = day.replace(day=1).weekday()
+    return ((day.day - 1 + first_weekday) // 7) + 1
+
+def _hours(rng: random.Random) -> float:
+    """소요시간 값 (0, 정수, 소수 0.5 단위가 섞이도록)"""
+    roll = rng.random()
+    if roll < 0.15:
+        return 0
+    if roll < 0.55:
+        return rng.randint(1, 60)
+    return rng.randint(1, 120) / 2
+
+def _format_hours(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+def generate_report(rng: random.Random, malformed: Optional[str] = None) -> str:
+    """README 형식의 주간업무 현황 메시지 하나 생성
+
+    Args:
+        rng: 난수 생성기 (같은 시드면 같은 메시지)
+        malformed: MALFORMED_KINDS 중 하나를 지정하면 해당 섹션을 깨뜨림
+    """
+    if malformed == 'empty':
+        return ''
+
+    monday = date(2024, 1, 1) + timedelta(weeks=rng.randint(0, 150))
+    friday = monday + timedelta(days=4)
+
+    hospitals = [name for name in HOSPITALS if rng.random() > 0.1] or HOSPITALS[:1]
+    hospitals += rng.sample(EXTRA_HOSPITALS, rng.randint(0, 2))
+    rng.shuffle(hospitals)
+    hours = {name: _hours(rng) for name in hospitals}
+    total = sum(hours.values())
+
+    lines = [f"{monday.year}년 {monday.month}월 {_week_of_month(monday)}주차 주간업무 현황"]
+    if malformed != 'no_period':
+        lines.append(
+            f"기간 : {monday:%y}. {monday.month}. {monday.day} ~ {friday:%y}. {friday.month}. {friday.day}"
+        )
+    lines.append("")
+
+    header = "금주 완료 작업 소요시간 합계(시간)"
+    if malformed != 'no_time_header':
+        lines.append(header)
+    if malformed == 'repeated_header':
+        lines.append(header)
+    for name in hospitals:
+        value = _format_hours(hours[name])
+        if malformed == 'bad_hours' and rng.random() < 0.5:
+            value = f"약 {value}h"
+        lines.append(f"{name} : {value}")
+    lines.append("")
+    if malformed != 'no_total':
+        lines.append(f"총합 : {_format_hours(total)} 시간")
+        lines.append("")
+
+    lines.append("금주 완료 작업 수가 산정(시간 당 24000원)")
+    for name in hospitals:
+        lines.append(f"{name} : {int(hours[name] * 24000):,}원")
+    lines.append("")
+    lines.append(f"총합 : {int(total * 24000):,}원")
+    lines.append("")
+
+    # 병원별 업무 현황 (메시지 길이를 다양하게)
+    lines.append("주간 병원별 업무 현황")
+    for name in hospitals:
+        lines.append(name)
+        lines.append(f"신규 작업 : {rng.randint(0, 5)}건")
+        lines.append(f"잔여(진행중) 작업 : {rng.randint(0, 5)}건")
+        lines.append(f"완료 : {rng.randint(0, 5)}건")
+        lines.append(f"홀딩 : {rng.randint(0, 5)}건")
+        for index in range(rng.choice([0, 0, 1, 3, 8])):
+            lines.append(f"- {name} 작업 메모 {index + 1}: 상세 페이지 수정 및 검수 요청 대응")
+        lines.append("")
+
+    return '\n'.join(lines).rstrip()
+
+def generate_corpus(count: int, seed: int = 0, malformed_ratio: float = 0.05) -> List[str]:
+    """주간업무 현황 메시지 count개 생성 (일부는 malformed_ratio 비율로 깨진 메시지)"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        malformed = rng.choice(MALFORMED_KINDS) if rng.random() < malformed_ratio else None
+        corpus.append(generate_report(rng, malformed))
+    return corpus
+
+def generate_authors(count: int, seed: int = 0) -> List[str]:
+    """메시지별 작성자 이름 (generate_corpus와 같은 길이)"""
+    rng = random.Random(seed + 1)
+    return [rng.choice(AUTHORS) for _ in range(count)]
@@ -0,0 +1,365 @@
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+@dataclass
+class FaultInjection:
+    """가짜 서버의 응답 지연과 오류 주입 설정
+
+    - latency + 0~jitter초 만큼 늦게 응답
+    - rate_limit_ratio 비율로 429(Retry-After: retry_after초) 응답
+    - error_ratio 비율로 500 응답
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_limit_ratio: float = 0.0
+    error_ratio: float = 0.0
+    retry_after: float = 1.0
+
+class FakeApiServer:
+    """백그라운드 스레드에서 도는 가짜 API 서버 공통 부분 (지연/오류 주입, 메서드별 요청 수)"""
+
+    def __init__(self, faults: Optional[FaultInjection] = None, seed: int = 0):
+        self.faults = faults or FaultInjection()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """서버를 시작하고 기본 주소 반환 (port=0이면 빈 포트 사용)"""
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name=type(self).__name__, daemon=True).start()
+        return self.url
+
+    def stop(self):
+        """서버 종료"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """메서드별 요청 수, 주입한 429/500 응답 수"""
+        with self._lock:
+            return {method: dict(values) for method, values in self._stats.items()}
+
+    def handle(self, http_method: str, path: str, params: Dict) -> Tuple[str, int, Dict]:
+        """(메서드 이름, 상태 코드, 응답 본문) 반환"""
+        raise NotImplementedError
+
+    def error_body(self, status: int) -> Dict:
+        """주입한 오류의 응답 본문"""
+        raise NotImplementedError
+
+    def method_name(self, http_method: str, path: str) -> str:
+        """통계와 오류 주입에 쓸 메서드 이름"""
+        raise NotImplementedError
+
+    def _inject(self, method: str) -> Optional[int]:
+        """지연을 적용하고, 오류를 주입할 차례면 상태 코드 반환"""
+        with self._lock:
+            delay = self.faults.latency + self._rng.random() * self.faults.jitter
+            roll = self._rng.random()
+            values = self._stats.setdefault(method, {'requests': 0, 'rate_limited': 0, 'errors': 0})
+            values['requests'] += 1
+            status = None
+            if roll < self.faults.rate_limit_ratio:
+                values['rate_limited'] += 1
+                status = 429
+            elif roll < self.faults.rate_limit_ratio + self.faults.error_ratio:
+                values['errors'] += 1
+                status = 500
+        if delay:
+            time.sleep(delay)
+        return status
+
+    def _make_handler(self):
+        server = self
+
+        class FakeApiHandler(BaseHTTPRequestHandler):
+            """JSON 요청/응답 처리 (keep-alive)"""
+
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                self._dispatch('GET')
+
+            def do_POST(self):
+                self._dispatch('POST')
+
+            def _dispatch(self, http_method: str):
+                url = urlsplit(self.path)
+                path = unquote(url.path)
+                query = parse_qs(url.query)
+                params = {key: values[-1] for key, values in query.items()}
+                if 'ranges' in query:
+                    # values:batchGet은 ranges를 여러 번 보냄
+                    params['ranges'] = query['ranges']
+
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length).decode('utf-8') if length else ''
+                if body:
+                    if 'json' in (self.headers.get('Content-Type') or ''):
+                        params.update(json.loads(body))
+                    else:
+                        params.update({key: values[-1] for key, values in parse_qs(body).items()})
+
+                method = server.method_name(http_method, path)
+                status = server._inject(method)
+                headers = {}
+                if status is not None:
+                    payload = server.error_body(status)
+                    if status == 429:
+                        headers['Retry-After'] = f"{server.faults.retry_after:g}"
+                else:
+                    _, status, payload = server.handle(http_method, path, params)
+
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return FakeApiHandler
+
+class FakeSlackServer(FakeApiServer):
+    """Slack Web API 흉내 서버 (SlackService(base_url=server.base_url)로 연결)
+
+    conversations.replies, conversations.history, users.info, users.list, chat.postMessage를 지원합니다.
+    """
+
+    def __init__(self, threads: Dict[Tuple[str, str], Dict], users: Dict[str, str],
+                 faults: Optional[FaultInjection] = None, seed: int = 0):
+        super().__init__(faults, seed)
+        self.threads = threads  # (채널, 스레드TS) → {'user': ..., 'text': ...}
+        self.users = users      # 사용자 ID → 실명
+        self.posted: List[Dict] = []
+
+    @property
+    def base_url(self) -> str:
+        return f"{self.url}/api/"
+
+    def method_name(self, http_method: str, path: str) -> str:
+        return path.rsplit('/', 1)[-1]
+
+    def error_body(self, status: int) -> Dict:
+        return {'ok': False, 'error': 'ratelimited' if status == 429 else 'internal_error'}
+
+    def handle(self, http_method: str, path: str, params: Dict) -> Tuple[str, int, Dict]:
+        method = self.method_name(http_method, path)
+        handler = {
+            'conversations.replies': self._replies,
+            'conversations.history': self._history,
+            'users.info': self._user_info,
+            'users.list': self._users_list,
+            'chat.postMessage': self._post_message,
+        }.get(method)
+        if handler is None:
+            return method, 200, {'ok': False, 'error': 'unknown_method'}
+        return method, 200, handler(params)
+
+    def _message(self, channel: str, ts: str) -> Dict:
+        thread = self.threads[(channel, ts)]
+        return {'type': 'message', 'ts': ts, 'thread_ts': ts, 'user': thread['user'], 'text': thread['text']}
+
+    def _replies(self, params: Dict) -> Dict:
+        key = (params.get('channel'), params.get('ts'))
+        if key not in self.threads:
+            return {'ok': False, 'error': 'thread_not_found'}
+        return {'ok': True, 'messages': [self._message(*key)], 'has_more': False}
+
+    def _history(self, params: Dict) -> Dict:
+        channel = params.get('channel')
+        oldest = float(params.get('oldest') or 0)
+        latest = float(params.get('latest') or 'inf')
+        messages = sorted(
+            (self._message(channel, ts) for thread_channel, ts in self.threads
+             if thread_channel == channel and oldest <= float(ts) <= latest),
+            key=lambda message: float(message['ts']),
+            reverse=True
+        )
+        return self._page(params, 'messages', messages)
+
+    def _user_info(self, params: Dict) -> Dict:
+        user_id = params.get('user')
+        if user_id not in self.users:
+            return {'ok': False, 'error': 'user_not_found'}
+        name = self.users[user_id]
+        return {'ok': True, 'user': {'id': user_id, 'name': user_id.lower(), 'real_name': name,
+                                     'profile': {'real_name': name}}}
+
+    def _users_list(self, params: Dict) -> Dict:
+        members = [{'id': user_id, 'real_name': name, 'profile': {'real_name': name}}
+                   for user_id, name in sorted(self.users.items())]
+        return self._page(params, 'members', members)
+
+    def _post_message(self, params: Dict) -> Dict:
+        with self._lock:
+            self.posted.append({'channel': params.get('channel'), 'text': params.get('text')})
+        return {'ok': True, 'channel': params.get('channel'), 'ts': f"{time.time():.6f}"}
+
+    @staticmethod
+    def _page(params: Dict, key: str, items: List[Dict]) -> Dict:
+        """cursor(시작 위치)와 limit으로 자른 한 페이지"""
+        start = int(params.get('cursor') or 0)
+        limit = int(params.get('limit') or 100)
+        end = start + limit
+        has_more = end < len(items)
+        return {
+            'ok': True,
+            key: items[start:end],
+            'has_more': has_more,
+            'response_metadata': {'next_cursor': str(end) if has_more else ''}
+        }
+
+# 'Sheet1'!A1:B2, A:A, A2:B 형식의 A1 범위
+A1_RANGE_PATTERN = re.compile(
+    r"^(?:(?:'((?:[^']|'')+)'|([^!]+))!)?([A-Z]*)(\d*)(?::([A-Z]*)(\d*))?$"
+)
+
+def column_index(letters: str) -> int:
+    """열 문자 → 1부터 시작하는 번호 (A → 1, AA → 27)"""
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return index
+
+class FakeSheetsServer(FakeApiServer):
+    """Google Sheets API v4 흉내 서버 (SheetsClientFactory(api_base_url=server.url)로 연결)
+
+    스프레드시트 메타데이터 조회, values.get, values.batchGet, values.batchUpdate를 지원하며 셀 값은 메모리에 저장합니다.
+    """
+
+    def __init__(self, spreadsheet_id: str = 'fake-spreadsheet', sheet_names: Tuple[str, ...] = ('Sheet1',),
+                 header: Tuple[str, ...] = ('이름',), faults: Optional[FaultInjection] = None, seed: int = 0):
+        super().__init__(faults, seed)
+        self.spreadsheet_id = spreadsheet_id
+        self.sheet_names = list(sheet_names)
+        self.cells: Dict[str, Dict[Tuple[int, int], str]] = {name: {} for name in self.sheet_names}
+        for name in self.sheet_names:
+            for column, value in enumerate(header, start=1):
+                self.cells[name][(1, column)] = value
+
+    def method_name(self, http_method: str, path: str) -> str:
+        if path.endswith('values:batchUpdate'):
+            return 'values.batchUpdate'
+        if path.endswith('values:batchGet'):
+            return 'values.batchGet'
+        if '/values/' in path:
+            return 'values.get'
+        return 'spreadsheets.get'
+
+    def error_body(self, status: int) -> Dict:
+        if status == 429:
+            return {'error': {'code': 429, 'message': 'Quota exceeded', 'status': 'RESOURCE_EXHAUSTED'}}
+        return {'error': {'code': 500, 'message': 'Internal error', 'status': 'INTERNAL'}}
+
+    def handle(self, http_method: str, path: str, params: Dict) -> Tuple[str, int, Dict]:
+        method = self.method_name(http_method, path)
+        prefix = f"/v4/spreadsheets/{self.spreadsheet_id}"
+        if not path.startswith(prefix):
+            return method, 404, {'error': {'code': 404, 'message': 'Requested entity was not found.',
+                                           'status': 'NOT_FOUND'}}
+
+        with self._lock:
+            if method == 'values.batchUpdate':
+                return method, 200, self._batch_update(params)
+            if method == 'values.batchGet':
+                value_ranges = [self._values_get(range_name, params) for range_name in params.get('ranges', [])]
+                return method, 200, {'spreadsheetId': self.spreadsheet_id, 'valueRanges': value_ranges}
+            if method == 'values.get':
+                return method, 200, self._values_get(path[len(prefix) + len('/values/'):], params)
+            return method, 200, self._metadata()
+
+    def values(self, sheet_name: Optional[str] = None) -> Dict[Tuple[int, int], str]:
+        """(행, 열) → 값 (테스트/검증용 복사본)"""
+        with self._lock:
+            return dict(self.cells[sheet_name or self.sheet_names[0]])
+
+    def _metadata(self) -> Dict:
+        return {
+            'spreadsheetId': self.spreadsheet_id,
+            'properties': {'title': 'Fake Spreadsheet', 'locale': 'ko_KR'},
+            'sheets': [
+                {'properties': {'sheetId': index, 'title': name, 'index': index, 'sheetType': 'GRID',
+                                'gridProperties': {'rowCount': 1000, 'columnCount': 26}}}
+                for index, name in enumerate(self.sheet_names)
+            ]
+        }
+
+    def _parse_range(self, range_name: str) -> Tuple[str, int, int, Optional[int], Optional[int]]:
+        """(시트 이름, 시작 행, 시작 열, 끝 행, 끝 열) — 끝이 None이면 값이 있는 마지막 행/열까지"""
+        match = A1_RANGE_PATTERN.match(range_name)
+        if not match:
+            raise ValueError(f"잘못된 범위입니다: {range_name}")
+        quoted, bare, start_col, start_row, end_col, end_row = match.groups()
+        sheet_name = quoted.replace("''", "'") if quoted else bare or self.sheet_names[0]
+
+        row1 = int(start_row) if start_row else 1
+        col1 = column_index(start_col) if start_col else 1
+        if end_col is None and end_row is None:
+            # 한 셀 또는 A:A처럼 끝이 없는 형식
+            row2 = row1 if start_row else None
+            col2 = col1 if start_col else None
+        else:
+            row2 = int(end_row) if end_row else None
+            col2 = column_index(end_col) if end_col else None
+        return sheet_name, row1, col1, row2, col2
+
+    def _values_get(self, range_name: str, params: Dict) -> Dict:
+        sheet_name, row1, col1, row2, col2 = self._parse_range(range_name)
+        cells = self.cells[sheet_name]
+        row2 = row2 or max((row for row, _ in cells), default=0)
+        col2 = col2 or max((col for _, col in cells), default=0)
+
+        by_columns = params.get('majorDimension') == 'COLUMNS'
+        outer, inner = ((range(col1, col2 + 1), range(row1, row2 + 1)) if by_columns
+                        else (range(row1, row2 + 1), range(col1, col2 + 1)))
+        values = []
+        for i in outer:
+            line = [cells.get((j, i) if by_columns else (i, j), '') for j in inner]
+            while line and line[-1] == '':
+                line.pop()
+            values.append(line)
+        while values and not values[-1]:
+            values.pop()
+
+        response = {'range': range_name, 'majorDimension': 'COLUMNS' if by_columns else 'ROWS'}
+        if values:
+            response['values'] = values
+        return response
+
+    def _batch_update(self, body: Dict) -> Dict:
+        updated = 0
+        for value_range in body.get('data', []):
+            sheet_name, row1, col1, _, _ = self._parse_range(value_range['range'])
+            cells = self.cells[sheet_name]
+            for row_offset, line in enumerate(value_range.get('values', [])):
+                for col_offset, value in enumerate(line):
+                    key = (row1 + row_offset, col1 + col_offset)
+                    if value in ('', None):
+                        cells.pop(key, None)
+                    else:
+                        cells[key] = str(value)
+                    updated += 1
+        return {'spreadsheetId': self.spreadsheet_id, 'totalUpdatedCells': updated}
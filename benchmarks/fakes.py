@@ -0,0 +1,63 @@
+import re
+from typing import Dict, List
+from services.rate_limiter import RateLimitScheduler
+from services.row_locator import RowLocator
+from services.sheets_service import SheetsService
+
+class FakeSlackService:
+    """메모리에 있는 메시지를 돌려주는 가짜 Slack 서비스"""
+
+    def __init__(self, messages: Dict[str, str], authors: Dict[str, str]):
+        self.messages = messages
+        self.authors = authors
+        self.api_calls = 0
+
+    def get_message_content(self, channel_id: str, thread_ts: str) -> str:
+        self.api_calls += 1
+        return self.messages.get(thread_ts, "")
+
+    def get_message_author(self, channel_id: str, thread_ts: str) -> str:
+        self.api_calls += 1
+        return self.authors.get(thread_ts, "홍길동")
+
+    def get_user_name(self, user_id: str) -> str:
+        self.api_calls += 1
+        return user_id
+
+class FakeWorksheet:
+    """gspread Worksheet의 col_values/get/batch_update만 흉내내는 메모리 워크시트"""
+
+    def __init__(self, header: List[str] = None):
+        self.cells: Dict[str, Dict[int, str]] = {'A': {}}
+        for index, value in enumerate(header or ['이름'], start=1):
+            self.cells['A'][index] = value
+        self.request_count = 0
+
+    def col_values(self, column: int) -> List[str]:
+        self.request_count += 1
+        column_a = self.cells['A']
+        if not column_a:
+            return []
+        return [column_a.get(row, '') for row in range(1, max(column_a) + 1)]
+
+    def get(self, range_name: str) -> List[List[str]]:
+        self.request_count += 1
+        start, end = (int(row) for row in re.findall(r'\d+', range_name))
+        return [[self.cells['A'].get(row, '')] for row in range(start, end + 1)]
+
+    def batch_update(self, value_ranges: List[dict]):
+        self.request_count += 1
+        for value_range in value_ranges:
+            column, row = re.match(r'([A-Z]+)(\d+)', value_range['range']).groups()
+            self.cells.setdefault(column, {})[int(row)] = value_range['values'][0][0]
+
+class InMemorySheetsService(SheetsService):
+    """인증 없이 FakeWorksheet에 기록하는 SheetsService (요청 한도 없음)"""
+
+    def __init__(self, worksheet: FakeWorksheet = None):
+        self._fake_worksheet = worksheet or FakeWorksheet()
+        super().__init__('', 'benchmark', 'benchmark', scheduler=RateLimitScheduler(limits={}))
+
+    def _setup_client(self):
+        self.worksheet = self._fake_worksheet
+        self.row_locator = RowLocator(self.worksheet, scheduler=self.scheduler)
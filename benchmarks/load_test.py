@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+가짜 Slack/Sheets 서버를 상대로 한 부하 시험 (실제 토큰 불필요)
+
+    python -m benchmarks.load_test --reports 2000 --workers 8 --slack-latency 0.05 --sheets-latency 0.1
+    python -m benchmarks.load_test --reports 5000 --spool --rate-limit-ratio 0.01 --output load_test.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import AUTHORS, generate_authors, generate_corpus
+from benchmarks.fake_servers import FakeSheetsServer, FakeSlackServer, FaultInjection
+from services.batch_processor import BatchProcessor, ThreadRef
+from services.instrumentation import get_instrumentation
+from services.rate_limiter import DEFAULT_LIMITS, RateLimitScheduler
+from services.report_daemon import ReportDaemon
+from services.sheets_client_factory import SheetsClientFactory
+from services.sheets_service import SheetsService
+from services.slack_service import SlackService
+from services.user_cache import UserDirectoryCache
+from services.write_spool import WriteSpool
+
+CHANNEL_ID = 'CLOADTEST'
+SHEET_NAME = '주간업무'
+
+def percentile(sorted_values: List[float], p: float) -> Optional[float]:
+    """정렬된 값의 p 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def build_threads(reports: int, seed: int, malformed_ratio: float):
+    """가짜 Slack 서버에 올릴 스레드와 사용자 목록"""
+    corpus = generate_corpus(reports, seed=seed, malformed_ratio=malformed_ratio)
+    authors = generate_authors(reports, seed=seed)
+    user_ids = {name: f"U{index:04d}" for index, name in enumerate(AUTHORS)}
+
+    threads = {}
+    refs = []
+    for index, (message, author) in enumerate(zip(corpus, authors)):
+        thread_ts = f"{1700000000 + index}.{index % 1000000:06d}"
+        threads[(CHANNEL_ID, thread_ts)] = {'user': user_ids[author], 'text': message}
+        refs.append(ThreadRef(CHANNEL_ID, thread_ts))
+    users = {user_id: name for name, user_id in user_ids.items()}
+    return threads, users, refs
+
+def run_load_test(reports: int = 1000, workers: int = 8, seed: int = 0, malformed_ratio: float = 0.02,
+                  slack_faults: Optional[FaultInjection] = None, sheets_faults: Optional[FaultInjection] = None,
+                  spool: bool = False, spool_batch: int = 50, limits: Optional[Dict[str, float]] = None,
+                  arrival_rate: Optional[float] = None, quiet: bool = True) -> Dict:
+    """보고서 reports건을 상주 서비스 경로(ReportDaemon)로 처리하고 처리량/지연 시간 측정
+
+    arrival_rate(건/초)를 지정하면 그 간격으로 보고서를 넣고, 지정하지 않으면 한꺼번에 넣습니다.
+    지연 시간은 넣은 시점부터 처리 완료까지입니다 (대기열 사용 시 대기열 저장까지).
+    limits를 지정하지 않으면 클라이언트 쪽 요청 한도 없이 서버가 주입한 429만 재시도합니다.
+    """
+    threads, users, refs = build_threads(reports, seed, malformed_ratio)
+    slack_server = FakeSlackServer(threads, users, faults=slack_faults, seed=seed)
+    sheets_server = FakeSheetsServer(sheet_names=(SHEET_NAME,), faults=sheets_faults, seed=seed)
+    slack_server.start()
+    sheets_server.start()
+
+    instrumentation = get_instrumentation()
+    instrumentation.reset()
+    scheduler = RateLimitScheduler(limits=limits or {}, base_delay=0.05, max_delay=2.0)
+    temp_dir = tempfile.TemporaryDirectory()
+    output = io.StringIO() if quiet else sys.stdout
+
+    try:
+        with contextlib.redirect_stdout(output):
+            slack_service = SlackService('xoxb-load-test', user_cache=UserDirectoryCache(),
+                                         scheduler=scheduler, base_url=slack_server.base_url)
+            client_factory = SheetsClientFactory(None, scheduler=scheduler, pool_maxsize=workers,
+                                                 api_base_url=sheets_server.url)
+            sheets_service = SheetsService(None, sheets_server.spreadsheet_id, SHEET_NAME,
+                                           scheduler=scheduler, client_factory=client_factory)
+            write_spool = None
+            if spool:
+                write_spool = WriteSpool(os.path.join(temp_dir.name, 'spool.db'), sheets_service,
+                                         max_batch=spool_batch, flush_interval=0.2)
+            daemon = ReportDaemon(BatchProcessor(slack_service, sheets_service, spool=write_spool), workers=workers)
+            if write_spool:
+                write_spool.start()
+
+            latencies: List[float] = []
+            errors = Counter()
+            lock = threading.Lock()
+
+            def record(future, submitted_at):
+                result = future.result()
+                with lock:
+                    latencies.append(time.perf_counter() - submitted_at)
+                    if not result.success:
+                        errors[result.error] += 1
+
+            start = time.perf_counter()
+            futures = []
+            for index, ref in enumerate(refs):
+                if arrival_rate:
+                    delay = start + index / arrival_rate - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                submitted_at = time.perf_counter()
+                future = daemon.submit(ref)
+                future.add_done_callback(lambda done, submitted_at=submitted_at: record(done, submitted_at))
+                futures.append(future)
+            for future in futures:
+                future.result()
+            processed = time.perf_counter() - start
+
+            daemon.stop()  # 대기열 사용 시 남은 행까지 기록
+            wall = time.perf_counter() - start
+            client_stats = client_factory.stats()
+            client_factory.close()
+    finally:
+        slack_server.stop()
+        sheets_server.stop()
+        temp_dir.cleanup()
+
+    latencies.sort()
+    succeeded = sum(1 for future in futures if future.result().success)
+    rows_written = len({row for row, column in sheets_server.values(SHEET_NAME) if row > 1 and column == 1})
+    summary = instrumentation.summary()
+    return {
+        'reports': reports,
+        'workers': workers,
+        'spool': spool,
+        'arrival_rate': arrival_rate,
+        'succeeded': succeeded,
+        'failed': reports - succeeded,
+        'rows_written': rows_written,
+        'processing_seconds': processed,
+        'wall_seconds': wall,
+        'throughput_per_second': reports / wall if wall else None,
+        'latency_ms': {
+            'mean': sum(latencies) / len(latencies) * 1000 if latencies else None,
+            **{f"p{p}": percentile(latencies, p) * 1000 for p in (50, 90, 95, 99) if latencies},
+            'max': latencies[-1] * 1000 if latencies else None,
+        },
+        'top_errors': errors.most_common(5),
+        'slack_server': slack_server.stats(),
+        'sheets_server': sheets_server.stats(),
+        'sheets_client': client_stats,
+        'api_totals': summary['totals'],
+        'stages': summary['stages'],
+    }
+
+def format_result(result: Dict) -> str:
+    """부하 시험 결과 요약"""
+    latency = result['latency_ms']
+    lines = [
+        f"보고서 {result['reports']}건 (워커 {result['workers']}개, 대기열 {'사용' if result['spool'] else '미사용'})",
+        f"  성공 {result['succeeded']} / 실패 {result['failed']} / 시트 기록 {result['rows_written']}행",
+        f"  처리량 {result['throughput_per_second']:.1f}건/초 (전체 {result['wall_seconds']:.2f}초)",
+        f"  지연 시간(ms) 평균 {latency['mean']:.1f} / p50 {latency['p50']:.1f} / p90 {latency['p90']:.1f} / "
+        f"p95 {latency['p95']:.1f} / p99 {latency['p99']:.1f} / 최대 {latency['max']:.1f}",
+        f"  API 호출 {result['api_totals']['calls']}회 / 재시도 {result['api_totals']['retries']}회 / "
+        f"오류 {result['api_totals']['errors']}회",
+    ]
+    for name, stats in (('Slack', result['slack_server']), ('Sheets', result['sheets_server'])):
+        for method, values in sorted(stats.items()):
+            lines.append(f"  {name} {method}: 요청 {values['requests']} / 429 {values['rate_limited']} / "
+                         f"500 {values['errors']}")
+    for error, count in result['top_errors']:
+        lines.append(f"  실패 {count}건: {error}")
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description='가짜 Slack/Sheets 서버를 상대로 한 부하 시험')
+    parser.add_argument('--reports', type=int, default=1000, help='처리할 보고서 수')
+    parser.add_argument('--workers', type=int, default=8, help='상주 서비스 워커 수')
+    parser.add_argument('--seed', type=int, default=0, help='말뭉치/오류 주입 시드')
+    parser.add_argument('--malformed-ratio', type=float, default=0.02, help='깨진 메시지 비율')
+    parser.add_argument('--slack-latency', type=float, default=0.02, help='Slack 응답 지연(초)')
+    parser.add_argument('--sheets-latency', type=float, default=0.05, help='Sheets 응답 지연(초)')
+    parser.add_argument('--jitter', type=float, default=0.01, help='응답 지연에 더할 최대 무작위 지연(초)')
+    parser.add_argument('--rate-limit-ratio', type=float, default=0.0, help='429 응답 비율')
+    parser.add_argument('--error-ratio', type=float, default=0.0, help='500 응답 비율')
+    parser.add_argument('--retry-after', type=float, default=0.1, help='429 응답의 Retry-After(초)')
+    parser.add_argument('--rate', type=float, help='초당 보고서 유입 수 (지정하지 않으면 한꺼번에 넣음)')
+    parser.add_argument('--spool', action='store_true', help='WriteSpool로 모아서 기록')
+    parser.add_argument('--spool-batch', type=int, default=50, help='대기열 한 번에 기록할 행 수')
+    parser.add_argument('--respect-limits', action='store_true',
+                        help='실제 Slack/Sheets 요청 한도(기본 설정값)를 클라이언트에서도 적용')
+    parser.add_argument('--verbose', action='store_true', help='서비스 로그 출력')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+
+    args = parser.parse_args()
+
+    def faults(latency):
+        return FaultInjection(latency=latency, jitter=args.jitter, rate_limit_ratio=args.rate_limit_ratio,
+                              error_ratio=args.error_ratio, retry_after=args.retry_after)
+
+    result = run_load_test(
+        reports=args.reports,
+        workers=args.workers,
+        seed=args.seed,
+        malformed_ratio=args.malformed_ratio,
+        slack_faults=faults(args.slack_latency),
+        sheets_faults=faults(args.sheets_latency),
+        spool=args.spool,
+        spool_batch=args.spool_batch,
+        limits=DEFAULT_LIMITS if args.respect_limits else None,
+        arrival_rate=args.rate,
+        quiet=not args.verbose
+    )
+    print(format_result(result))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"📄 결과 저장: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+파서/파이프라인 벤치마크
+
+    python -m benchmarks.run_benchmarks --sizes 1,100,10000 --output benchmark_results.json
+    python -m benchmarks.run_benchmarks --baseline benchmark_results.json   # 이전 결과와 비교
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import generate_authors, generate_corpus
+from benchmarks.fakes import FakeSlackService, InMemorySheetsService
+from models.spreadsheet_row import SpreadsheetRow
+from services.batch_processor import BatchProcessor, ThreadRef
+from services.message_parser import WeeklyReportParser
+from services.ratio_rollup import RatioBatch
+
+DEFAULT_SIZES = [1, 100, 1000, 10000]
+
+def _time(fn: Callable[[], int], repeat: int) -> Dict:
+    """fn을 repeat번 실행하여 소요 시간(초)과 처리 건수 측정"""
+    timings = []
+    items = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        items = fn()
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        'items': items,
+        'timings': timings,
+        'best_seconds': best,
+        'median_seconds': statistics.median(timings),
+        'per_item_us': best / items * 1e6 if items else None,
+        'items_per_second': items / best if best else None,
+    }
+
+def bench_parse(corpus: List[str], authors: List[str]) -> Callable[[], int]:
+    """WeeklyReportParser.parse_message"""
+    parser = WeeklyReportParser()
+
+    def run():
+        for message, author in zip(corpus, authors):
+            parser.parse_message(message, author)
+        return len(corpus)
+    return run
+
+def bench_row(corpus: List[str], authors: List[str]) -> Callable[[], int]:
+    """SpreadsheetRow.from_parsed_data (파싱 결과는 미리 준비)"""
+    parser = WeeklyReportParser()
+    parsed = [parser.parse_message(message, author) for message, author in zip(corpus, authors)]
+
+    def run():
+        for parsed_data in parsed:
+            SpreadsheetRow.from_parsed_data(parsed_data)
+        return len(parsed)
+    return run
+
+def bench_pipeline(corpus: List[str], authors: List[str]) -> Callable[[], int]:
+    """가짜 Slack/Sheets로 BatchProcessor.run 전체 (가져오기 → 파싱 → 행 생성 → 일괄 기록)"""
+    messages = {f"{index + 1}.000100": message for index, message in enumerate(corpus)}
+    author_by_ts = dict(zip(messages, authors))
+    refs = [ThreadRef('CBENCH', thread_ts) for thread_ts in messages]
+
+    def run():
+        # 반복마다 빈 시트에서 시작
+        processor = BatchProcessor(FakeSlackService(messages, author_by_ts), InMemorySheetsService())
+        with contextlib.redirect_stdout(io.StringIO()):  # 기록 완료 로그는 출력하지 않음
+            processor.run(refs)
+        return len(refs)
+    return run
+
+def bench_ratios_scalar(corpus: List[str], authors: List[str]) -> Callable[[], int]:
+    """보고서별 _calculate_ratios (문자열까지 생성)"""
+    parser = WeeklyReportParser()
+    time_data = [parser.parse_message(message, author)['time_data'] for message, author in zip(corpus, authors)]
+
+    def run():
+        for data in time_data:
+            parser._calculate_ratios(data)
+        return len(time_data)
+    return run
+
+def bench_ratios_batch(corpus: List[str], authors: List[str]) -> Callable[[], int]:
+    """RatioBatch로 비율 계산과 작성자·월별 집계 (문자열은 집계 결과만 생성)"""
+    parser = WeeklyReportParser()
+    parsed = [parser.parse_message(message, author) for message, author in zip(corpus, authors)]
+
+    def run():
+        batch = RatioBatch.from_parsed(parsed)
+        batch.ratios
+        batch.rollup('author', 'month').to_dicts()
+        return len(batch)
+    return run
+
+BENCHMARKS = {
+    'parse_message': bench_parse,
+    'from_parsed_data': bench_row,
+    'ratios_scalar': bench_ratios_scalar,
+    'ratios_batch': bench_ratios_batch,
+    'pipeline': bench_pipeline,
+}
+
+def run_suite(sizes: List[int], repeat: int = 3, seed: int = 0, malformed_ratio: float = 0.05,
+              names: Optional[List[str]] = None) -> Dict:
+    """크기별로 모든 벤치마크 실행 후 결과(JSON 직렬화 가능) 반환"""
+    results = []
+    for size in sizes:
+        corpus = generate_corpus(size, seed=seed, malformed_ratio=malformed_ratio)
+        authors = generate_authors(size, seed=seed)
+        for name in names or BENCHMARKS:
+            measured = _time(BENCHMARKS[name](corpus, authors), repeat)
+            results.append({'name': name, 'size': size, **measured})
+            print(f"{name:<18} n={size:<7} best={measured['best_seconds']:.4f}s "
+                  f"({measured['per_item_us']:.1f}µs/건)")
+
+    return {'meta': _metadata(seed, malformed_ratio, repeat), 'results': results}
+
+def _metadata(seed: int, malformed_ratio: float, repeat: int) -> Dict:
+    """실행 환경 정보 (결과 비교 시 참고)"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except Exception:
+        commit = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'malformed_ratio': malformed_ratio,
+        'repeat': repeat,
+    }
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """이전 결과와 비교하여 threshold(%) 이상 느려진 항목 목록 반환"""
+    previous = {(item['name'], item['size']): item for item in baseline.get('results', [])}
+    regressions = []
+    for item in current['results']:
+        before = previous.get((item['name'], item['size']))
+        if not before or not before.get('best_seconds'):
+            continue
+        change = (item['best_seconds'] / before['best_seconds'] - 1) * 100
+        label = f"{item['name']} n={item['size']}"
+        print(f"{label:<30} {before['best_seconds']:.4f}s → {item['best_seconds']:.4f}s ({change:+.1f}%)")
+        if change > threshold:
+            regressions.append(label)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='주간보고 파서/파이프라인 벤치마크')
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='메시지 수 목록 (쉼표 구분, 최대 100000 권장)')
+    parser.add_argument('--repeat', type=int, default=3, help='크기별 반복 횟수 (최솟값 기록)')
+    parser.add_argument('--seed', type=int, default=0, help='말뭉치 생성 시드')
+    parser.add_argument('--malformed-ratio', type=float, default=0.05, help='깨진 메시지 비율')
+    parser.add_argument('--only', help='실행할 벤치마크 (쉼표 구분: ' + ', '.join(BENCHMARKS) + ')')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=10.0, help='회귀로 판단할 느려짐 비율(%%)')
+
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    names = [name.strip() for name in args.only.split(',')] if args.only else None
+    unknown = [name for name in names or [] if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"알 수 없는 벤치마크: {', '.join(unknown)}")
+
+    current = run_suite(sizes, repeat=args.repeat, seed=args.seed,
+                        malformed_ratio=args.malformed_ratio, names=names)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"📄 결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"❌ {args.threshold:.0f}% 이상 느려진 항목: {', '.join(regressions)}")
+            sys.exit(1)
+        print("✅ 회귀 없음")
+
+if __name__ == "__main__":
+    main()
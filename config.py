@@ -1,20 +1,91 @@
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 class Config:
-    """애플리케이션 설정 관리"""
+    """애플리케이션 설정 관리
+
+    환경변수(.env 포함)는 처음 필요할 때 Config.load()로 읽습니다.
+    파싱만 하는 실행에서는 .env를 읽지 않아 시작이 빠릅니다.
+    """
+    
+    SLACK_BOT_TOKEN = None
+    GOOGLE_SHEETS_CREDENTIALS_PATH = None
+    GOOGLE_SPREADSHEET_ID = None
+    TARGET_SHEET_NAME = None
+    GEMINI_API_KEY = None
+    ROW_CURSOR_PATH = None          # 선택: 다음 빈 행 커서 저장 파일
+    USER_CACHE_PATH = None          # 선택: Slack 사용자 이름 캐시 파일
+    USER_CACHE_TTL_HOURS = 168.0
+    SPOOL_PATH = None               # 선택: Sheets 쓰기 대기열(SQLite) 파일
+    SPOOL_MAX_BATCH = 50
+    SPOOL_FLUSH_INTERVAL = 5.0
+    INGESTION_INDEX_PATH = None     # 선택: 기록한 보고서 색인(SQLite) 파일
+    GOOGLE_TOKEN_CACHE_PATH = None  # 선택: Google 액세스 토큰 저장 파일 (만료 전까지 재사용)
+    SHEETS_METADATA_CACHE_PATH = None  # 선택: 스프레드시트/워크시트 메타데이터 저장 파일
+    SHEETS_READS_PER_MINUTE = 60.0
+    SHEETS_WRITES_PER_MINUTE = 60.0
+    SYNC_CHECKPOINT_PATH = None     # 선택: 채널 동기화 위치 저장 파일 (sync 명령은 설정 권장)
+    SLACK_API_BASE_URL = None       # 선택: Slack API 대신 사용할 서버 (예: 가짜 Slack 서버)
+    SHEETS_API_BASE_URL = None      # 선택: Sheets API 대신 사용할 서버 (인증 없이 요청)
+    SHEET_ROUTES_PATH = None        # 선택: 채널·작성자별 기록 시트 설정 파일 (JSON)
+    SHEET_SNAPSHOT_PATH = None      # 선택: 시트 좁은 열 로컬 스냅샷 파일 (npz)
+    HISTORY_CACHE_PATH = None       # 선택: 비율 기록 질의 결과 캐시 파일 (JSON)
+    DEAD_LETTER_PATH = None         # 선택: 처리에 실패한 보고서 보관 파일 (SQLite, --replay로 재처리)
+    CIRCUIT_FAILURE_THRESHOLD = 5   # 연속 실패 시 Slack/Sheets 호출을 차단하는 횟수
+    CIRCUIT_RESET_SECONDS = 30.0    # 차단 후 다시 시도하기까지의 시간 (초)
+    CIRCUIT_STATE_PATH = None       # 선택: 차단기 상태 저장 파일 (실행 간 공유)
+    ERROR_NOTIFY_CHANNEL = None     # 선택: 오류 요약을 보낼 채널 (기본값: 보고서 채널)
+    ERROR_DIGEST_INTERVAL = 300.0   # 같은 채널에 오류 요약을 보내는 최소 간격 (초)
+    ERROR_DIGEST_STATE_PATH = None  # 선택: 보내지 않은 오류와 마지막 전송 시각 저장 파일 (실행 간 공유)
     
-    SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
-    GOOGLE_SHEETS_CREDENTIALS_PATH = os.getenv("GOOGLE_SHEETS_CREDENTIALS_PATH")
-    GOOGLE_SPREADSHEET_ID = os.getenv("GOOGLE_SPREADSHEET_ID")
-    TARGET_SHEET_NAME = os.getenv("TARGET_SHEET_NAME")
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+    _loaded = False
     
     @classmethod
-    def validate(cls):
-        """필수 환경변수 검증"""
+    def load(cls):
+        """.env와 환경변수에서 설정 읽기 (여러 번 호출해도 한 번만 읽음)"""
+        if cls._loaded:
+            return cls
+        
+        from dotenv import load_dotenv
+        load_dotenv()
+        
+        cls.SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
+        cls.GOOGLE_SHEETS_CREDENTIALS_PATH = os.getenv("GOOGLE_SHEETS_CREDENTIALS_PATH")
+        cls.GOOGLE_SPREADSHEET_ID = os.getenv("GOOGLE_SPREADSHEET_ID")
+        cls.TARGET_SHEET_NAME = os.getenv("TARGET_SHEET_NAME")
+        cls.GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+        cls.ROW_CURSOR_PATH = os.getenv("ROW_CURSOR_PATH")
+        cls.USER_CACHE_PATH = os.getenv("USER_CACHE_PATH")
+        cls.USER_CACHE_TTL_HOURS = float(os.getenv("USER_CACHE_TTL_HOURS", "168"))
+        cls.SPOOL_PATH = os.getenv("SPOOL_PATH")
+        cls.SPOOL_MAX_BATCH = int(os.getenv("SPOOL_MAX_BATCH", "50"))
+        cls.SPOOL_FLUSH_INTERVAL = float(os.getenv("SPOOL_FLUSH_INTERVAL", "5"))
+        cls.INGESTION_INDEX_PATH = os.getenv("INGESTION_INDEX_PATH")
+        cls.GOOGLE_TOKEN_CACHE_PATH = os.getenv("GOOGLE_TOKEN_CACHE_PATH")
+        cls.SHEETS_METADATA_CACHE_PATH = os.getenv("SHEETS_METADATA_CACHE_PATH")
+        cls.SHEETS_READS_PER_MINUTE = float(os.getenv("SHEETS_READS_PER_MINUTE", "60"))
+        cls.SHEETS_WRITES_PER_MINUTE = float(os.getenv("SHEETS_WRITES_PER_MINUTE", "60"))
+        cls.SYNC_CHECKPOINT_PATH = os.getenv("SYNC_CHECKPOINT_PATH")
+        cls.SLACK_API_BASE_URL = os.getenv("SLACK_API_BASE_URL")
+        cls.SHEETS_API_BASE_URL = os.getenv("SHEETS_API_BASE_URL")
+        cls.SHEET_ROUTES_PATH = os.getenv("SHEET_ROUTES_PATH")
+        cls.SHEET_SNAPSHOT_PATH = os.getenv("SHEET_SNAPSHOT_PATH")
+        cls.HISTORY_CACHE_PATH = os.getenv("HISTORY_CACHE_PATH")
+        cls.DEAD_LETTER_PATH = os.getenv("DEAD_LETTER_PATH")
+        cls.CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+        cls.CIRCUIT_RESET_SECONDS = float(os.getenv("CIRCUIT_RESET_SECONDS", "30"))
+        cls.CIRCUIT_STATE_PATH = os.getenv("CIRCUIT_STATE_PATH")
+        cls.ERROR_NOTIFY_CHANNEL = os.getenv("ERROR_NOTIFY_CHANNEL")
+        cls.ERROR_DIGEST_INTERVAL = float(os.getenv("ERROR_DIGEST_INTERVAL", "300"))
+        cls.ERROR_DIGEST_STATE_PATH = os.getenv("ERROR_DIGEST_STATE_PATH")
+        
+        cls._loaded = True
+        return cls
+    
+    @classmethod
+    def validate(cls, slack: bool = True):
+        """필수 환경변수 검증 (slack=False면 Slack 토큰은 확인하지 않음)"""
+        cls.load()
+        
         required_vars = [
             "SLACK_BOT_TOKEN",
             "GOOGLE_SHEETS_CREDENTIALS_PATH", 
@@ -23,6 +94,14 @@ class Config:
             "GEMINI_API_KEY"
         ]
         
+        if not slack:
+            # Slack 내보내기 가져오기처럼 Slack API를 쓰지 않는 실행
+            required_vars.remove("SLACK_BOT_TOKEN")
+        
+        if cls.SHEETS_API_BASE_URL:
+            # 대체 Sheets 서버는 인증 파일 없이 사용
+            required_vars.remove("GOOGLE_SHEETS_CREDENTIALS_PATH")
+        
         missing = [var for var in required_vars if not getattr(cls, var)]
         if missing:
             raise ValueError(f"필수 환경변수가 설정되지 않았습니다: {', '.join(missing)}")
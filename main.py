@@ -6,42 +6,559 @@ Slack 주간업무 현황을 Google Sheets에 자동 입력하는 메인 스크
 import argparse
 import sys
 from config import Config
-from services.slack_service import SlackService
-from services.sheets_service import SheetsService
-from services.message_parser import WeeklyReportParser
-from models.spreadsheet_row import SpreadsheetRow
 
-def main():
-    """메인 실행 함수"""
+# Slack/Sheets 클라이언트(slack_sdk, gspread, google-auth)는 무거우므로 실제로 쓰는 함수 안에서 import합니다.
+# --help나 --from-file --dry-run은 네트워크 라이브러리를 전혀 불러오지 않습니다.
+
+def configure_rate_limits():
+    """환경변수의 Sheets 요청 한도와 Slack/Sheets 차단기로 공용 스케줄러 설정"""
+    from services.circuit_breaker import create_breakers
+    from services.rate_limiter import configure_scheduler
     
-    # 명령행 인자 파싱
-    parser = argparse.ArgumentParser(description='Slack 주간업무 현황을 Google Sheets에 자동 입력')
-    parser.add_argument('--channel-id', required=True, help='Slack 채널 ID')
-    parser.add_argument('--thread-ts', required=True, help='Slack 스레드 타임스탬프')
-    parser.add_argument('--author-name', help='작성자 이름 (지정하지 않으면 Slack에서 자동 추출)')
+    return configure_scheduler({
+        'sheets:read': Config.SHEETS_READS_PER_MINUTE,
+        'sheets:write': Config.SHEETS_WRITES_PER_MINUTE
+    }, breakers=create_breakers(
+        Config.CIRCUIT_FAILURE_THRESHOLD,
+        Config.CIRCUIT_RESET_SECONDS,
+        state_path=Config.CIRCUIT_STATE_PATH
+    ))
+
+def format_rate_limit_stats(stats) -> str:
+    """요청 한도 스케줄러 통계 문자열"""
+    return ", ".join(
+        f"{name} 호출 {int(values['calls'])}회/재시도 {int(values['retries'])}회/대기 {values['throttle_seconds']:.1f}초"
+        for name, values in sorted(stats.items())
+    )
+
+def format_stage_stats(summary) -> str:
+    """단계별 소요 시간 요약 한 줄"""
+    return ", ".join(
+        f"{name} {values['seconds']:.2f}초/{values['count']}회"
+        for name, values in sorted(summary['stages'].items())
+    )
+
+def write_metrics(args):
+    """--metrics-json / --metrics-textfile 지정 시 계측 결과 저장"""
+    from services.instrumentation import get_instrumentation
     
-    args = parser.parse_args()
+    instrumentation = get_instrumentation()
+    for path, write in ((args.metrics_json, instrumentation.write_json),
+                        (args.metrics_textfile, instrumentation.write_prometheus)):
+        if not path:
+            continue
+        try:
+            write(path)
+        except OSError as e:
+            print(f"⚠️ 계측 결과 저장 실패 ({path}): {str(e)}")
+
+def create_slack_service(warm_user_cache: bool = False):
+    """사용자 이름 캐시를 연결한 SlackService 생성"""
+    from services.slack_service import SlackService
+    from services.user_cache import UserDirectoryCache
+    
+    user_cache = UserDirectoryCache(
+        Config.USER_CACHE_PATH,
+        ttl_seconds=Config.USER_CACHE_TTL_HOURS * 3600
+    )
+    slack_service = SlackService(Config.SLACK_BOT_TOKEN, user_cache=user_cache, base_url=Config.SLACK_API_BASE_URL)
+    
+    if warm_user_cache:
+        print("Slack 사용자 목록으로 이름 캐시를 채우는 중...")
+        count = slack_service.warm_user_cache()
+        print(f"사용자 {count}명 캐시 완료")
+    
+    return slack_service
+
+def create_sheets_service(revalidate_rows: bool = False):
+    """설정값으로 SheetsService 생성 (토큰/메타데이터 캐시와 HTTP 세션은 공용 생성기에서 재사용)
+    
+    SHEET_ROUTES_PATH가 설정되면 채널·작성자별로 시트를 나누어 기록하는 SheetRouter를 반환합니다.
+    revalidate_rows=True면 기록 전마다 빈 행 캐시를 시트와 다시 확인합니다. (상주 서비스처럼 오래 실행되는 경우)
+    """
+    from services.sheets_client_factory import get_client_factory
+    from services.sheets_service import SheetsService
+    
+    client_factory = get_client_factory(
+        Config.GOOGLE_SHEETS_CREDENTIALS_PATH,
+        token_cache_path=Config.GOOGLE_TOKEN_CACHE_PATH,
+        metadata_cache_path=Config.SHEETS_METADATA_CACHE_PATH,
+        api_base_url=Config.SHEETS_API_BASE_URL
+    )
+    if Config.SHEET_ROUTES_PATH:
+        from services.sheet_router import SheetRouter, SheetTarget, load_routing_rules
+        return SheetRouter(
+            SheetTarget(Config.GOOGLE_SPREADSHEET_ID, Config.TARGET_SHEET_NAME),
+            load_routing_rules(Config.SHEET_ROUTES_PATH),
+            client_factory,
+            row_cursor_path=Config.ROW_CURSOR_PATH,
+            revalidate_rows=revalidate_rows
+        )
+    return SheetsService(
+        Config.GOOGLE_SHEETS_CREDENTIALS_PATH,
+        Config.GOOGLE_SPREADSHEET_ID,
+        Config.TARGET_SHEET_NAME,
+        row_cursor_path=Config.ROW_CURSOR_PATH,
+        client_factory=client_factory,
+        snapshot_path=Config.SHEET_SNAPSHOT_PATH,
+        revalidate_rows=revalidate_rows
+    )
+
+def format_client_stats(stats) -> str:
+    """Sheets 클라이언트 생성기 통계 문자열"""
+    return (f"새 연결 {stats['connections']}개 / HTTP 요청 {stats['http_requests']}회 / "
+            f"토큰 갱신 {stats['token_refreshes']}회 (저장된 토큰 사용 {stats['token_cache_hits']}회) / "
+            f"메타데이터 조회 {stats['metadata_fetches']}회 (저장된 값 사용 {stats['metadata_cache_hits']}회)")
+
+def create_index():
+    """INGESTION_INDEX_PATH가 설정된 경우 기록한 보고서 색인 생성"""
+    if not Config.INGESTION_INDEX_PATH:
+        return None
+    
+    from services.ingestion_index import IngestionIndex
+    return IngestionIndex(Config.INGESTION_INDEX_PATH)
+
+def create_spool(sheets_service, index=None):
+    """SPOOL_PATH가 설정된 경우 쓰기 대기열 생성 (이전 실행에서 남은 행 수 안내)"""
+    if not Config.SPOOL_PATH:
+        return None
+    
+    from services.write_spool import WriteSpool
+    spool = WriteSpool(
+        Config.SPOOL_PATH,
+        sheets_service,
+        max_batch=Config.SPOOL_MAX_BATCH,
+        flush_interval=Config.SPOOL_FLUSH_INTERVAL,
+        on_flushed=index.on_flushed if index else None  # 백그라운드 기록 결과도 색인에 반영
+    )
+    pending = spool.pending_count()
+    if pending:
+        print(f"이전 실행에서 기록되지 않은 {pending}개 행을 함께 기록합니다.")
+    return spool
+
+def create_error_notifier(slack_service=None):
+    """오류 요약 알림기 생성 (Slack 서비스가 없으면 새로 만듦)"""
+    from services.error_notifier import ErrorNotifier
+    
+    return ErrorNotifier(
+        slack_service or create_slack_service(),
+        interval=Config.ERROR_DIGEST_INTERVAL,
+        channel_id=Config.ERROR_NOTIFY_CHANNEL,
+        state_path=Config.ERROR_DIGEST_STATE_PATH
+    )
+
+def notify_failures(slack_service, results):
+    """실패한 보고서를 채널별 오류 요약 하나로 알림 (같은 원인의 오류는 건수로 묶음)
+    
+    실패가 없어도 이전 실행에서 미룬 오류가 있으면 간격이 지난 것은 보내므로, 한 번 실행하는 명령은
+    성공했을 때도 끝에 호출합니다.
+    """
+    from services.error_notifier import has_deferred_errors
+    
+    failures = [result for result in results if not result.success]
+    if not failures and not has_deferred_errors(Config.ERROR_DIGEST_STATE_PATH):
+        return
+    try:
+        notifier = create_error_notifier(slack_service)
+        for result in failures:
+            notifier.notify(result.ref.channel_id, result.error, result.ref.thread_ts)
+        notifier.close()
+    except Exception as e:
+        print(f"⚠️ 오류 알림 실패: {str(e)}")
+
+def create_dead_letters():
+    """DEAD_LETTER_PATH가 설정된 경우 실패한 보고서 보관소 생성 (보관 중인 보고서 수 안내)"""
+    if not Config.DEAD_LETTER_PATH:
+        return None
+    
+    from services.dead_letter import DeadLetterStore
+    store = DeadLetterStore(Config.DEAD_LETTER_PATH)
+    count = store.count()
+    if count:
+        print(f"📮 실패해서 보관 중인 보고서가 {count}개 있습니다. (--replay로 다시 기록)")
+    return store
+
+def create_processor(slack_service, sheets_service, on_duplicate: str = 'skip'):
+    """색인, 쓰기 대기열, 실패 보관소를 연결한 BatchProcessor 생성"""
+    from services.batch_processor import BatchProcessor
+    
+    index = create_index()
+    return BatchProcessor(
+        slack_service,
+        sheets_service,
+        spool=create_spool(sheets_service, index),
+        index=index,
+        on_duplicate=on_duplicate,
+        dead_letters=create_dead_letters()
+    )
+
+def prefetch_threads(refs, slack_service, concurrency: int):
+    """본문이 없는 스레드를 AsyncSlackService로 동시에 미리 가져오기 (--async-fetch)
+    
+    실패한 스레드는 그대로 두어 파이프라인의 가져오기 단계에서 다시 조회하고 실패로 보고되게 합니다.
+    """
+    import asyncio
+    from services.async_slack_service import AsyncSlackService
+    
+    targets = [ref for ref in refs if ref.message is None]
+    if not targets:
+        return
+    
+    async_service = AsyncSlackService(
+        Config.SLACK_BOT_TOKEN,
+        max_concurrency=concurrency,
+        user_cache=slack_service.user_cache,
+        base_url=Config.SLACK_API_BASE_URL,
+        scheduler=slack_service.scheduler
+    )
+    fetched = asyncio.run(async_service.fetch_reports(
+        [(ref.channel_id, ref.thread_ts) for ref in targets],
+        return_exceptions=True
+    ))
+    
+    for ref, result in zip(targets, fetched):
+        if isinstance(result, Exception):
+            continue
+        content, author_name = result
+        ref.message = content
+        ref.author_name = ref.author_name or author_name
+
+def run_batch(args):
+    """여러 스레드를 한 번의 실행으로 처리 (스레드 목록 파일 또는 기간 지정)
+    
+    가져오기/파싱/행 생성/기록 단계를 크기 제한 큐로 연결한 파이프라인으로 처리하므로
+    다음 스레드를 가져오는 동안 앞선 스레드의 파싱과 기록이 함께 진행됩니다.
+    """
+    from services.batch_processor import load_thread_file, date_to_slack_ts, format_report
+    from services.pipeline import ReportPipeline
     
     try:
         # 환경변수 검증
         Config.validate()
         
-        # 서비스 초기화
-        slack_service = SlackService(Config.SLACK_BOT_TOKEN)
-        sheets_service = SheetsService(
-            Config.GOOGLE_SHEETS_CREDENTIALS_PATH,
-            Config.GOOGLE_SPREADSHEET_ID,
-            Config.TARGET_SHEET_NAME
-        )
-        parser = WeeklyReportParser()
+        # 서비스는 한 번만 초기화하여 모든 스레드에 재사용
+        slack_service = create_slack_service(args.warm_user_cache)
+        sheets_service = create_sheets_service()
+        processor = create_processor(slack_service, sheets_service, args.on_duplicate)
+        
+        if args.batch_file:
+            refs = load_thread_file(args.batch_file)
+        else:
+            print("채널 기록에서 주간업무 현황 메시지를 찾는 중...")
+            refs = processor.find_report_threads(
+                args.channel_id,
+                oldest=date_to_slack_ts(args.oldest) if args.oldest else None,
+                latest=date_to_slack_ts(args.latest, end_of_day=True) if args.latest else None
+            )
         
-        print("Slack 메시지를 가져오는 중...")
+        if args.async_fetch:
+            print(f"Slack 메시지를 asyncio로 최대 {args.concurrency}개씩 동시에 가져오는 중...")
+            prefetch_threads(refs, slack_service, args.concurrency)
+        
+        pipeline = ReportPipeline(processor, fetch_workers=args.concurrency, write_batch=args.write_batch)
+        print(f"{len(refs)}개 스레드 처리 중... (Slack 동시 조회 {args.concurrency}개, {args.write_batch}행씩 기록)")
+        results = pipeline.run(refs)
+        stored = processor.record_failures(results)
+        
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+        sys.exit(1)
+    
+    print(format_report(results))
+    notify_failures(slack_service, results)
+    if stored:
+        print(f"📮 실패한 보고서 {stored}개를 보관했습니다. 복구 후 --replay로 다시 기록하세요.")
+    
+    cache_stats = slack_service.user_cache.stats()
+    print(f"사용자 이름 캐시: 적중 {cache_stats['hits']}회 / 실패 {cache_stats['misses']}회")
+    
+    rate_limit_stats = slack_service.scheduler.stats()
+    if rate_limit_stats:
+        print(f"요청 한도: {format_rate_limit_stats(rate_limit_stats)}")
+    
+    print(f"Sheets 연결: {format_client_stats(sheets_service.client_factory.stats())}")
+    
+    from services.instrumentation import get_instrumentation
+    summary = get_instrumentation().summary()
+    print(f"단계별 시간: {format_stage_stats(summary)}")
+    print(f"API 호출: {summary['totals']['calls']}회 / 재시도 {summary['totals']['retries']}회 / "
+          f"수신 {summary['totals']['bytes']:,}바이트")
+    
+    if not all(result.success for result in results):
+        sys.exit(1)
+
+def run_sync(args):
+    """저장된 위치 이후의 채널 기록에서 새 주간업무 현황만 찾아 기록"""
+    from services.batch_processor import date_to_slack_ts
+    from services.channel_sync import ChannelSync, SyncCheckpoint, format_sync_result
+    
+    try:
+        Config.validate()
         
-        # Slack 메시지 가져오기
-        message_content = slack_service.get_message_content(
-            args.channel_id, 
-            args.thread_ts
+        slack_service = create_slack_service(args.warm_user_cache)
+        sheets_service = create_sheets_service()
+        processor = create_processor(slack_service, sheets_service, args.on_duplicate)
+        if not Config.SYNC_CHECKPOINT_PATH:
+            print("⚠️ SYNC_CHECKPOINT_PATH가 설정되지 않아 동기화 위치를 저장하지 않습니다. (다음 실행도 --oldest부터 확인)")
+        sync = ChannelSync(processor, SyncCheckpoint(Config.SYNC_CHECKPOINT_PATH))
+        result = sync.sync(
+            args.channel_id,
+            oldest=date_to_slack_ts(args.oldest) if args.oldest else None
         )
+        processor.record_failures(result.failures)
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+        sys.exit(1)
+    
+    print(format_sync_result(result))
+    notify_failures(slack_service, result.failures)
+    if result.failures:
+        sys.exit(1)
+
+def run_import(args):
+    """Slack 내보내기(ZIP 또는 폴더)의 주간업무 현황을 Slack API 없이 기록하는 과거 데이터 가져오기"""
+    from services.slack_export import ExportImporter, SlackExport, format_import_result
+    
+    try:
+        Config.validate(slack=False)
+        
+        sheets_service = create_sheets_service()
+        # 본문과 작성자를 내보내기에서 읽으므로 Slack 서비스는 사용하지 않음
+        processor = create_processor(None, sheets_service, args.on_duplicate)
+        importer = ExportImporter(
+            processor,
+            workers=args.import_workers,
+            chunk_size=args.write_batch
+        )
+        channels = args.export_channels.split(',') if args.export_channels else None
+        with SlackExport(args.import_export) as export:
+            print(f"📦 {args.import_export} 가져오는 중...")
+            result = importer.run(export, channels=channels, oldest=args.oldest, latest=args.latest)
+        processor.record_failures(result.failures)
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+        sys.exit(1)
+    
+    print(format_import_result(result))
+    if result.failures:
+        sys.exit(1)
+
+def print_daemon_result(result):
+    """상주 서비스 처리 결과 출력"""
+    ref = result.ref
+    if result.duplicate == 'skipped':
+        print(f"⏭️ {ref.channel_id} {ref.thread_ts} → 이미 기록됨, 건너뜀")
+    elif result.success and result.duplicate == 'updated':
+        print(f"🔁 {ref.channel_id} {ref.thread_ts} → {result.row_number}행 갱신 ({result.author_name})")
+    elif result.success and result.row_number is None:
+        print(f"✅ {ref.channel_id} {ref.thread_ts} → 대기열 저장 ({result.author_name})")
+    elif result.success:
+        print(f"✅ {ref.channel_id} {ref.thread_ts} → {result.row_number}행 ({result.author_name})")
+    else:
+        print(f"❌ {ref.channel_id} {ref.thread_ts} → {result.error}")
+
+def run_daemon(args):
+    """Slack/Sheets 서비스를 한 번만 초기화하고 보고서 이벤트를 계속 받아 처리하는 상주 모드"""
+    import time
+    from services.report_daemon import ReportDaemon
+    
+    try:
+        Config.validate()
+        
+        slack_service = create_slack_service(args.warm_user_cache)
+        sheets_service = create_sheets_service(revalidate_rows=True)
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+        sys.exit(1)
+    
+    # 실패 알림은 모아서 주기적으로 요약 전송 (처리 흐름에서는 버퍼에 넣기만 함)
+    notifier = create_error_notifier(slack_service)
+    notifier.start()
+    
+    def on_result(result):
+        print_daemon_result(result)
+        if not result.success:
+            notifier.notify(result.ref.channel_id, result.error, result.ref.thread_ts)
+    
+    daemon = ReportDaemon(
+        create_processor(slack_service, sheets_service, args.on_duplicate),
+        workers=args.workers,
+        on_result=on_result
+    )
+    port = daemon.start(args.host, args.port)
+    print(f"🚀 상주 서비스 시작: http://{args.host}:{port}/reports (워커 {args.workers}개, Ctrl+C로 종료)")
+    
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("종료 중... 처리 중인 보고서를 마무리합니다.")
+    finally:
+        daemon.stop()
+        notifier.close(force=True)
+        print(f"처리 현황: {daemon.stats()}")
+
+def run_reconcile():
+    """시트의 A(작성자), B(금요일 날짜)열만 읽어 기록한 보고서 색인을 다시 맞춤"""
+    
+    try:
+        Config.validate()
+        if not Config.INGESTION_INDEX_PATH:
+            raise Exception("INGESTION_INDEX_PATH 환경변수가 설정되지 않았습니다.")
+        if Config.SHEET_ROUTES_PATH:
+            # 색인의 행 번호는 시트마다 따로 매겨지므로 시트 하나로 다시 맞출 수 없음
+            raise Exception("SHEET_ROUTES_PATH를 사용할 때는 색인 재구성을 지원하지 않습니다.")
+        
+        sheets_service = create_sheets_service()
+        index = create_index()
+        
+        print("시트의 작성자/날짜 열을 읽는 중...")
+        stats = index.rebuild(sheets_service.read_index_rows())
+        index.close()
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+        sys.exit(1)
+    
+    print(f"✅ 색인 재구성 완료: 시트 {stats['rows']}행 / 작성자·주 {stats['weeks']}건 / "
+          f"스레드 유지 {stats['threads_kept']}건 / 어긋난 스레드 제거 {stats['threads_dropped']}건")
+
+def run_refresh_snapshot():
+    """시트의 좁은 열 로컬 스냅샷 갱신 (끝부분만 읽는 증분 갱신)"""
+    import time
+    
+    try:
+        Config.validate()
+        if not Config.SHEET_SNAPSHOT_PATH:
+            raise Exception("SHEET_SNAPSHOT_PATH 환경변수가 설정되지 않았습니다.")
+        
+        snapshot = getattr(create_sheets_service(), 'snapshot', None)
+        if snapshot is None:
+            raise Exception("SHEET_ROUTES_PATH를 사용할 때는 스냅샷을 지원하지 않습니다.")
+        
+        start = time.perf_counter()
+        stats = snapshot.refresh()
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+        sys.exit(1)
+    
+    mode = '전체' if stats['mode'] == 'full' else '증분'
+    print(f"✅ 스냅샷 {mode} 갱신: {stats['fetched_rows']}행 읽음 / 새 행 {stats['added_rows']}개 / "
+          f"전체 {stats['rows']}행 ({elapsed:.2f}초)")
+
+def run_history(args):
+    """시트 비율 기록을 메모리에 올려 기간·그룹 집계와 빠진 주 출력"""
+    from services.ratio_history import HistoryCache, RatioHistory, format_history_table, format_missing_weeks
+    
+    by = [name.strip() for name in args.history_by.split(',') if name.strip()]
+    authors = [name.strip() for name in args.history_author.split(',')] if args.history_author else None
+    try:
+        Config.validate(slack=False)
+        sheets_service = create_sheets_service()
+        snapshot = getattr(sheets_service, 'snapshot', None)
+        if snapshot is None:
+            if not hasattr(sheets_service, 'worksheet'):
+                raise Exception("SHEET_ROUTES_PATH를 사용할 때는 비율 기록 조회를 지원하지 않습니다.")
+            # 스냅샷 파일 없이 이번 실행에서만 사용
+            from services.sheet_snapshot import SheetSnapshot
+            snapshot = SheetSnapshot(None, sheets_service.worksheet, sheets_service.scheduler)
+        snapshot.refresh()
+        
+        cache = HistoryCache(Config.HISTORY_CACHE_PATH) if Config.HISTORY_CACHE_PATH else None
+        history = RatioHistory.from_snapshot(snapshot, cache=cache)
+        rows = history.aggregate(by, since=args.oldest, until=args.latest, authors=authors)
+        missing = history.missing_weeks(args.oldest, args.latest, authors) if args.missing_weeks else None
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+        sys.exit(1)
+    
+    print(f"📊 비율 기록 {len(history)}건 (작성자 {len(history.author_names())}명)")
+    print(format_history_table(rows, by))
+    if missing is not None:
+        print(format_missing_weeks(missing))
+
+def run_replay(args):
+    """실패해서 보관한 보고서를 --write-batch개씩 묶어 다시 기록 (원문이 있으면 Slack 조회 생략)"""
+    from services.dead_letter import format_replay_result, replay_dead_letters
+    
+    try:
+        Config.validate()
+        if not Config.DEAD_LETTER_PATH:
+            raise Exception("DEAD_LETTER_PATH 환경변수가 설정되지 않았습니다.")
+        
+        slack_service = create_slack_service(args.warm_user_cache)
+        processor = create_processor(slack_service, create_sheets_service(), args.on_duplicate)
+        print(f"보관된 보고서 {processor.dead_letters.count()}개 재처리 중...")
+        result = replay_dead_letters(processor.dead_letters, processor, batch_size=args.write_batch)
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+        sys.exit(1)
+    
+    print(format_replay_result(result))
+    notify_failures(slack_service, result.failures)
+    if result.failures:
+        sys.exit(1)
+
+def read_message_file(path: str) -> str:
+    """파일(또는 '-'이면 표준 입력)에서 메시지 본문 읽기"""
+    if path == '-':
+        return sys.stdin.read()
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+def print_row(row_data):
+    """시트에 기록될 열 데이터 출력"""
+    print("\n📄 시트에 기록될 행:")
+    for column, value in row_data.get_column_data().items():
+        print(f"{column}열: {value}")
+
+def run_single(args):
+    """스레드 하나(또는 --from-file 메시지 하나)를 파싱하여 기록 (--dry-run이면 출력만)"""
+    from models.spreadsheet_row import SpreadsheetRow
+    from services.message_parser import WeeklyReportParser
+    
+    slack_service = None
+    processor = None
+    ref = None
+    message_content = None
+    parsed_data = None
+    spooled = False
+    
+    try:        
+        if not args.dry_run:
+            # 환경변수 검증
+            Config.validate()
+            
+            # 서비스 초기화
+            from services.batch_processor import ThreadRef
+            if not args.from_file:
+                slack_service = create_slack_service(args.warm_user_cache)
+            sheets_service = create_sheets_service()
+            processor = create_processor(slack_service, sheets_service, args.on_duplicate)
+            ref = ThreadRef(args.channel_id, args.thread_ts, author_name=args.author_name)
+            
+            # 이미 기록한 스레드는 Slack/Sheets 호출 없이 종료
+            existing = processor.find_duplicate(ref)
+            if existing and existing.row_number is not None and args.on_duplicate == 'skip':
+                print(f"⏭️ 이미 {existing.row_number}행에 기록된 스레드입니다. 건너뜁니다. (--on-duplicate update로 갱신)")
+                return
+        elif not args.from_file:
+            if not Config.load().SLACK_BOT_TOKEN:
+                raise ValueError("필수 환경변수가 설정되지 않았습니다: SLACK_BOT_TOKEN")
+            slack_service = create_slack_service(args.warm_user_cache)
+        
+        parser = processor.parser if processor else WeeklyReportParser()
+        
+        if args.from_file:
+            message_content = read_message_file(args.from_file)
+        else:
+            print("Slack 메시지를 가져오는 중...")
+            
+            # Slack 메시지 가져오기
+            message_content = slack_service.get_message_content(
+                args.channel_id, 
+                args.thread_ts
+            )
         
         if not message_content:
             raise Exception("메시지 내용을 가져올 수 없습니다.")
@@ -49,10 +566,14 @@ def main():
         # 작성자 이름 결정 (명령행 인자 > Slack 추출 > 기본값)
         if args.author_name:
             author_name = args.author_name
-        else:
+        elif slack_service:
             author_name = slack_service.get_message_author(args.channel_id, args.thread_ts)
+        else:
+            author_name = "홍길동"
         
         print(f"작성자: {author_name}")
+        if ref:
+            ref.author_name = author_name
         print("메시지 파싱 중...")
         
         # 메시지 파싱
@@ -61,12 +582,34 @@ def main():
         # 스프레드시트 행 데이터 생성
         row_data = SpreadsheetRow.from_parsed_data(parsed_data)
         
+        if args.dry_run:
+            print_row(row_data)
+            print("\n(--dry-run: Google Sheets에 기록하지 않았습니다.)")
+            return
+        
         print("Google Sheets에 데이터 추가 중...")
         
-        # Google Sheets에 데이터 추가
-        sheets_service.append_row(row_data)
+        # Google Sheets에 데이터 추가 (대기열 사용 시 먼저 로컬에 저장하여 실패해도 보고서를 잃지 않음)
+        row_number, duplicate = processor.write_row(ref, row_data)
+        if duplicate == 'skipped':
+            location = f"{row_number}행" if row_number else "대기열"
+            print(f"⏭️ 같은 작성자·주의 보고서가 이미 기록되어 있습니다 ({location}). 건너뜁니다.")
+            return
         
+        if processor.spool and duplicate != 'updated':
+            from services.write_spool import SpoolFlushError
+            try:
+                processor.spool.flush()
+            except SpoolFlushError as e:
+                spooled = True
+                raise Exception(f"Google Sheets 기록 실패, 대기열에 보관되어 다음 실행에서 다시 기록됩니다: {str(e)}")
+        
+        if duplicate == 'updated':
+            print(f"🔁 기존 {row_number}행을 갱신했습니다.")
         print("✅ 작업이 성공적으로 완료되었습니다!")
+        if args.channel_id:
+            # 이전 실행에서 미룬 오류 요약 전송
+            notify_failures(slack_service, [])
         
         # 파싱된 데이터 출력 (디버깅용)
         print("\n📊 파싱된 데이터:")
@@ -81,14 +624,126 @@ def main():
         error_msg = f"오류 발생: {str(e)}"
         print(f"❌ {error_msg}")
         
-        # Slack에 에러 알림 전송
-        try:
-            slack_service = SlackService(Config.SLACK_BOT_TOKEN)
-            slack_service.send_error_notification(args.channel_id, str(e))
-        except:
-            pass
+        # 원문과 파싱 결과를 보관하여 복구 후 --replay로 다시 기록 (대기열에 남은 행은 제외)
+        if processor and processor.dead_letters and ref and not spooled:
+            ref.message = message_content
+            processor.dead_letters.add(ref, str(e), parsed_data)
+            print("📮 실패한 보고서를 보관했습니다. 복구 후 --replay로 다시 기록하세요.")
+        
+        # Slack에 오류 요약 알림 (Slack 스레드를 처리한 경우만, 이미 만든 Slack 서비스 재사용)
+        # 마지막 요약 후 ERROR_DIGEST_INTERVAL 안에 다시 실패하면 다음 실행의 요약에 합쳐 보냄
+        if args.channel_id and not args.dry_run:
+            try:
+                notifier = create_error_notifier(slack_service)
+                notifier.notify(args.channel_id, e, args.thread_ts)
+                notifier.close()
+            except Exception as notify_error:
+                print(f"⚠️ 오류 알림 실패: {str(notify_error)}")
         
         sys.exit(1)
 
+def dispatch(args, parser):
+    """실행 모드 선택"""
+    # 파일 메시지를 출력만 하는 경우는 설정과 네트워크 라이브러리를 불러오지 않음
+    if args.from_file and args.dry_run:
+        run_single(args)
+        return
+    
+    Config.load()
+    configure_rate_limits()
+    
+    if args.reconcile:
+        run_reconcile()
+        return
+    
+    if args.refresh_snapshot:
+        run_refresh_snapshot()
+        return
+    
+    if args.history:
+        run_history(args)
+        return
+    
+    if args.replay:
+        run_replay(args)
+        return
+    
+    if args.serve:
+        run_daemon(args)
+        return
+    
+    if args.import_export:
+        run_import(args)
+        return
+    
+    if args.sync:
+        if not args.channel_id:
+            parser.error('동기화하려면 --channel-id가 필요합니다.')
+        run_sync(args)
+        return
+    
+    if args.batch_file or args.oldest or args.latest:
+        if not args.batch_file and not args.channel_id:
+            parser.error('기간으로 일괄 처리하려면 --channel-id가 필요합니다.')
+        run_batch(args)
+        return
+    
+    if not args.from_file and (not args.channel_id or not args.thread_ts):
+        parser.error('--channel-id와 --thread-ts가 필요합니다. (또는 --from-file)')
+    
+    run_single(args)
+
+def main():
+    """메인 실행 함수"""
+    
+    # 명령행 인자 파싱
+    parser = argparse.ArgumentParser(description='Slack 주간업무 현황을 Google Sheets에 자동 입력')
+    parser.add_argument('--channel-id', help='Slack 채널 ID')
+    parser.add_argument('--thread-ts', help='Slack 스레드 타임스탬프')
+    parser.add_argument('--author-name', help='작성자 이름 (지정하지 않으면 Slack에서 자동 추출)')
+    parser.add_argument('--from-file', help='Slack 대신 파일에서 메시지 읽기 (-는 표준 입력)')
+    parser.add_argument('--dry-run', action='store_true', help='파싱 결과 행만 출력하고 Google Sheets에 기록하지 않음')
+    parser.add_argument('--batch-file', help='일괄 처리할 스레드 목록 파일 (한 줄에 "채널ID 스레드TS [작성자이름]")')
+    parser.add_argument('--oldest', help='일괄 처리 시작 날짜 (YYYY-MM-DD, --channel-id와 함께 사용)')
+    parser.add_argument('--latest', help='일괄 처리 종료 날짜 (YYYY-MM-DD, --channel-id와 함께 사용)')
+    parser.add_argument('--concurrency', type=int, default=4, help='일괄 처리 시 Slack 동시 조회 수 (기본값: 4)')
+    parser.add_argument('--async-fetch', action='store_true',
+                        help='일괄 처리 전에 AsyncSlackService로 스레드 본문과 작성자를 --concurrency개씩 미리 가져오기')
+    parser.add_argument('--write-batch', type=int, default=50, help='일괄 처리 시 한 번의 요청으로 기록할 최대 행 수 (기본값: 50)')
+    parser.add_argument('--serve', action='store_true', help='상주 서비스 모드 (로컬 HTTP로 보고서 이벤트 수신)')
+    parser.add_argument('--host', default='127.0.0.1', help='상주 서비스 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='상주 서비스 포트 (기본값: 8080)')
+    parser.add_argument('--workers', type=int, default=4, help='상주 서비스 워커 수 (기본값: 4)')
+    parser.add_argument('--warm-user-cache', action='store_true', help='처리 전에 users_list로 사용자 이름 캐시 채우기')
+    parser.add_argument('--on-duplicate', choices=['skip', 'update'], default='skip',
+                        help='이미 기록한 보고서 처리 방식 (INGESTION_INDEX_PATH 설정 시, 기본값: skip)')
+    parser.add_argument('--reconcile', action='store_true', help='시트 A:B열로 기록한 보고서 색인 다시 맞추기')
+    parser.add_argument('--refresh-snapshot', action='store_true',
+                        help='시트의 A/B/I/L/N열과 O열 해시 로컬 스냅샷 갱신 (SHEET_SNAPSHOT_PATH 설정 시)')
+    parser.add_argument('--history', action='store_true',
+                        help='시트 비율 기록 집계 출력 (--oldest/--latest로 금요일 날짜 기간 제한)')
+    parser.add_argument('--history-by', default='author',
+                        help='비율 기록 집계 기준 author, week, month (쉼표로 구분, 기본값: author)')
+    parser.add_argument('--history-author', help='비율 기록을 조회할 작성자 (쉼표로 구분, 기본값: 전체)')
+    parser.add_argument('--missing-weeks', action='store_true', help='--history와 함께 작성자별 보고서가 빠진 주 출력')
+    parser.add_argument('--replay', action='store_true',
+                        help='실패해서 보관한 보고서 다시 기록 (DEAD_LETTER_PATH 설정 시, --write-batch개씩)')
+    parser.add_argument('--sync', action='store_true',
+                        help='--channel-id 채널의 저장된 위치 이후 새 주간업무 현황만 기록 (처음 실행 시 --oldest부터)')
+    parser.add_argument('--import-export', help='Slack 내보내기 ZIP 파일(또는 압축을 푼 폴더)의 주간업무 현황 기록 (--oldest/--latest로 기간 제한)')
+    parser.add_argument('--export-channels', help='내보내기에서 가져올 채널 이름 (쉼표로 구분, 기본값: 전체)')
+    parser.add_argument('--import-workers', type=int, help='내보내기 파싱 프로세스 수 (기본값: CPU 수, 0이면 현재 프로세스)')
+    parser.add_argument('--metrics-json', help='종료 시 단계별 시간과 API 호출 통계를 JSON 파일로 저장')
+    parser.add_argument('--metrics-textfile', help='종료 시 같은 통계를 Prometheus 텍스트 파일로 저장 (node_exporter textfile collector용)')
+    
+    args = parser.parse_args()
+    
+    from services.instrumentation import get_instrumentation
+    try:
+        with get_instrumentation().stage('run'):
+            dispatch(args, parser)
+    finally:
+        write_metrics(args)
+
 if __name__ == "__main__":
     main()
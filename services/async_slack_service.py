@@ -0,0 +1,151 @@
+import asyncio
+import time
+from collections import OrderedDict
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.errors import SlackApiError
+from typing import Dict, Iterable, List, Optional, Tuple
+from services.user_cache import UserDirectoryCache
+from services.rate_limiter import RateLimitScheduler, get_scheduler, slack_bucket
+
+class AsyncSlackService:
+    """AsyncWebClient 기반 Slack API 처리 서비스 (동시 요청 수 제한)
+
+    SlackService와 같은 메서드를 코루틴으로 제공하며, 여러 스레드를 조회할 때 네트워크 대기 시간을 겹쳐 줄입니다.
+    부모 메시지 캐시는 SlackService와 같이 개수(parent_cache_size)와 시간(parent_cache_ttl)을 제한합니다.
+    """
+
+    def __init__(self, token: str, max_concurrency: int = 10,
+                 user_cache: Optional[UserDirectoryCache] = None, base_url: Optional[str] = None,
+                 scheduler: Optional[RateLimitScheduler] = None, parent_cache_size: int = 128,
+                 parent_cache_ttl: float = 60.0):
+        client_kwargs = {'token': token}
+        if base_url:
+            client_kwargs['base_url'] = base_url
+        self.client = AsyncWebClient(**client_kwargs)
+        self.user_cache = user_cache
+        self.scheduler = scheduler or get_scheduler()  # 동기 SlackService와 같은 요청 한도를 공유
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.parent_cache_size = parent_cache_size
+        self.parent_cache_ttl = parent_cache_ttl
+        self._parent_messages: "OrderedDict[tuple, tuple]" = OrderedDict()  # (채널, 스레드TS) → (부모 메시지, 저장 시각)
+
+    async def _call(self, method: str, **kwargs):
+        """동시 요청 수 제한과 메서드 등급별 요청 한도 안에서 Slack API 호출"""
+        async with self._semaphore:
+            return await self.scheduler.call_async(slack_bucket(method), getattr(self.client, method), **kwargs)
+
+    async def get_parent_message(self, channel_id: str, thread_ts: str) -> Optional[Dict]:
+        """스레드의 부모 메시지만 가져오기 (캐시 유효 시간 안의 같은 스레드는 한 번만 조회)"""
+        key = (channel_id, thread_ts)
+        cached = self._parent_messages.get(key)
+        if cached is not None and time.monotonic() - cached[1] <= self.parent_cache_ttl:
+            self._parent_messages.move_to_end(key)
+            return cached[0]
+
+        try:
+            response = await self._call('conversations_replies', channel=channel_id, ts=thread_ts, limit=1)
+        except SlackApiError as e:
+            raise Exception(f"Slack API 오류: {e.response['error']}")
+        messages = response['messages']
+        message = messages[0] if messages else None
+        self._remember_parent(key, message)
+        return message
+
+    def forget_parent_message(self, channel_id: str, thread_ts: str):
+        """캐시된 부모 메시지 삭제 (보고서 처리가 끝났거나 메시지가 수정·재제출된 경우)"""
+        self._parent_messages.pop((channel_id, thread_ts), None)
+
+    def _remember_parent(self, key: tuple, message: Optional[Dict]):
+        """부모 메시지 캐시 (최대 개수를 넘으면 가장 오래 사용하지 않은 항목 제거)"""
+        self._parent_messages[key] = (message, time.monotonic())
+        self._parent_messages.move_to_end(key)
+        while len(self._parent_messages) > self.parent_cache_size:
+            self._parent_messages.popitem(last=False)
+
+    async def get_thread_messages(self, channel_id: str, thread_ts: str) -> List[Dict]:
+        """스레드의 모든 메시지 가져오기 (답글이 많으면 커서로 페이지 순회)"""
+        messages = []
+        cursor = None
+        while True:
+            kwargs = {'channel': channel_id, 'ts': thread_ts, 'limit': 200}
+            if cursor:
+                kwargs['cursor'] = cursor
+
+            try:
+                response = await self._call('conversations_replies', **kwargs)
+            except SlackApiError as e:
+                raise Exception(f"Slack API 오류: {e.response['error']}")
+
+            messages.extend(response['messages'])
+
+            cursor = (response.get('response_metadata') or {}).get('next_cursor')
+            if not response.get('has_more') or not cursor:
+                break
+
+        if messages:
+            self._remember_parent((channel_id, thread_ts), messages[0])
+        return messages
+
+    async def get_message_content(self, channel_id: str, thread_ts: str) -> str:
+        """스레드의 첫 번째 메시지 내용 가져오기"""
+        message = await self.get_parent_message(channel_id, thread_ts)
+        if message:
+            return message.get('text', '')
+        return ""
+
+    async def get_message_author(self, channel_id: str, thread_ts: str) -> str:
+        """메시지 작성자 이름 가져오기"""
+        try:
+            message = await self.get_parent_message(channel_id, thread_ts)
+            if message:
+                user_id = message.get('user')
+                if user_id:
+                    return await self.get_user_name(user_id)
+            return '홍길동'
+        except SlackApiError:
+            return '홍길동'
+
+    async def get_user_name(self, user_id: str) -> str:
+        """사용자 ID로 실명 가져오기 (캐시에 없거나 만료된 경우에만 users_info 호출)"""
+        if self.user_cache:
+            cached_name = self.user_cache.get(user_id)
+            if cached_name:
+                return cached_name
+
+        try:
+            user_info = await self._call('users_info', user=user_id)
+        except SlackApiError:
+            return '홍길동'
+
+        real_name = user_info['user'].get('real_name')
+        if not real_name:
+            return '홍길동'
+
+        if self.user_cache:
+            self.user_cache.put(user_id, real_name)
+        return real_name
+
+    async def send_error_notification(self, channel_id: str, error_message: str):
+        """에러 알림 전송"""
+        try:
+            await self._call('chat_postMessage', channel=channel_id, text=f"⚠️ 오류 발생: {error_message}")
+        except SlackApiError as e:
+            print(f"Slack 알림 전송 실패: {e.response['error']}")
+
+    async def fetch_reports(self, threads: Iterable[Tuple[str, str]],
+                            return_exceptions: bool = False) -> List[Tuple[str, str]]:
+        """여러 스레드의 (본문, 작성자)를 동시에 가져오기 (입력 순서 유지)
+
+        return_exceptions=True이면 실패한 스레드 자리에 예외 객체를 넣고 나머지는 계속 진행합니다.
+        """
+
+        async def fetch(channel_id: str, thread_ts: str) -> Tuple[str, str]:
+            content = await self.get_message_content(channel_id, thread_ts)
+            author = await self.get_message_author(channel_id, thread_ts)
+            self.forget_parent_message(channel_id, thread_ts)
+            return content, author
+
+        return await asyncio.gather(
+            *(fetch(channel_id, thread_ts) for channel_id, thread_ts in threads),
+            return_exceptions=return_exceptions
+        )
@@ -0,0 +1,371 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from models.spreadsheet_row import SpreadsheetRow
+from services.ingestion_index import IndexEntry, IngestionIndex
+from services.message_parser import WeeklyReportParser
+from services.write_spool import SpoolFlushError
+
+# 이미 기록한 보고서를 다시 처리할 때의 동작
+DUPLICATE_POLICIES = ('skip', 'update')
+
+@dataclass
+class ThreadRef:
+    """처리할 Slack 스레드 정보"""
+
+    channel_id: str
+    thread_ts: str
+    author_name: Optional[str] = None       # 지정 시 Slack 작성자 조회 생략
+    user_id: Optional[str] = None           # 작성자 Slack 사용자 ID (채널 기록 조회 시)
+    message: Optional[str] = None           # 이미 알고 있는 메시지 본문 (채널 기록 조회 시)
+
+@dataclass
+class BatchResult:
+    """스레드별 처리 결과"""
+
+    ref: ThreadRef
+    success: bool
+    author_name: str = ""
+    row_number: Optional[int] = None
+    error: str = ""
+    duplicate: str = ""                     # 이미 기록된 보고서였으면 'skipped' 또는 'updated'
+    parsed_data: Optional[Dict] = None      # 파싱까지 끝난 경우 파싱 결과 (실패 보관 시 함께 저장)
+    spooled: bool = False                   # 기록은 실패했지만 쓰기 대기열에 보관되어 다음 실행에서 다시 기록됨
+
+def load_thread_file(path: str) -> List[ThreadRef]:
+    """스레드 목록 파일 읽기
+
+    한 줄에 `채널ID 스레드TS [작성자이름]` 형식이며, 빈 줄과 #으로 시작하는 줄은 무시합니다.
+    """
+    refs = []
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            parts = line.split(maxsplit=2)
+            if len(parts) < 2:
+                raise ValueError(f"{path}:{line_number} 형식 오류: '채널ID 스레드TS [작성자이름]' 형식이어야 합니다.")
+
+            refs.append(ThreadRef(
+                channel_id=parts[0],
+                thread_ts=parts[1],
+                author_name=parts[2] if len(parts) > 2 else None
+            ))
+    return refs
+
+def date_to_slack_ts(date_text: str, end_of_day: bool = False) -> str:
+    """YYYY-MM-DD 날짜를 Slack 타임스탬프 문자열로 변환"""
+    date = datetime.strptime(date_text, '%Y-%m-%d')
+    if end_of_day:
+        date = date.replace(hour=23, minute=59, second=59)
+    return f"{date.timestamp():.6f}"
+
+class BatchProcessor:
+    """여러 스레드를 하나의 Slack/Sheets 서비스로 처리하는 일괄 처리기"""
+
+    def __init__(self, slack_service, sheets_service, parser: Optional[WeeklyReportParser] = None, spool=None,
+                 index: Optional[IngestionIndex] = None, on_duplicate: str = 'skip', dead_letters=None):
+        if on_duplicate not in DUPLICATE_POLICIES:
+            raise ValueError(f"지원하지 않는 중복 처리 방식입니다: {on_duplicate}")
+        self.slack_service = slack_service
+        self.sheets_service = sheets_service
+        self.parser = parser or WeeklyReportParser()
+        self.spool = spool  # 지정 시 행을 WriteSpool에 먼저 저장한 뒤 모아서 기록
+        self.index = index  # 지정 시 이미 기록한 보고서는 건너뛰거나(skip) 기존 행을 갱신(update)
+        self.on_duplicate = on_duplicate
+        self.dead_letters = dead_letters  # 지정 시 실패한 보고서를 원문과 함께 DeadLetterStore에 보관
+
+    def find_report_threads(self, channel_id: str, oldest: Optional[str] = None,
+                            latest: Optional[str] = None) -> List[ThreadRef]:
+        """채널 기록에서 기간 내 주간업무 현황 메시지 찾기 (오래된 순)"""
+        refs = []
+        for message in self.slack_service.iter_channel_messages(channel_id, oldest, latest):
+            ref = self.report_ref(channel_id, message)
+            if ref:
+                refs.append(ref)
+
+        # conversations_history는 최신 메시지부터 반환하므로 시간순으로 정렬
+        refs.sort(key=lambda ref: float(ref.thread_ts))
+        return refs
+
+    def report_ref(self, channel_id: str, message: Dict) -> Optional[ThreadRef]:
+        """채널 기록 메시지가 주간업무 현황(년/월/주차 헤더)이면 ThreadRef, 아니면 None"""
+        text = message.get('text', '')
+        if not self.parser.is_weekly_report(text):
+            return None
+        return ThreadRef(
+            channel_id=channel_id,
+            thread_ts=message['ts'],
+            user_id=message.get('user'),
+            message=text
+        )
+
+    def build_row(self, ref: ThreadRef) -> Tuple[SpreadsheetRow, Dict]:
+        """스레드 하나를 가져와 파싱하고 스프레드시트 행 생성"""
+        message_content, author_name = self.fetch_report(ref)
+        parsed_data = self.parser.parse_message(message_content, author_name)
+        return SpreadsheetRow.from_parsed_data(parsed_data), parsed_data
+
+    def fetch_report(self, ref: ThreadRef) -> Tuple[str, str]:
+        """스레드의 메시지 본문과 작성자 이름 가져오기"""
+        message_content = ref.message
+        if message_content is None:
+            message_content = self.slack_service.get_message_content(ref.channel_id, ref.thread_ts)
+
+        if not message_content:
+            raise Exception("메시지 내용을 가져올 수 없습니다.")
+
+        # 작성자 이름 결정 (지정값 > Slack 사용자 ID > 스레드 작성자)
+        if ref.author_name:
+            author_name = ref.author_name
+        elif ref.user_id:
+            author_name = self.slack_service.get_user_name(ref.user_id)
+        else:
+            author_name = self.slack_service.get_message_author(ref.channel_id, ref.thread_ts)
+
+        # 같은 스레드가 수정되어 다시 제출되면 새 본문을 읽도록 부모 메시지 캐시는 보고서 단위로만 유지
+        forget = getattr(self.slack_service, 'forget_parent_message', None)
+        if forget and ref.thread_ts:
+            forget(ref.channel_id, ref.thread_ts)
+
+        # 이후 단계에서 실패해도 보관(dead letter)과 재처리에 Slack을 다시 조회하지 않도록 남겨 둠
+        ref.message = message_content
+        ref.author_name = author_name
+        return message_content, author_name
+
+    def find_duplicate(self, ref: ThreadRef, row: Optional[SpreadsheetRow] = None) -> Optional[IndexEntry]:
+        """이미 기록한 보고서 찾기
+
+        행을 만들기 전에는 thread_ts로만, 만든 뒤에는 (작성자, 금요일 날짜)로도 찾습니다.
+        색인이 없으면 Sheets 서비스가 로컬 스냅샷을 쓰는 경우에만 스냅샷에서 (작성자, 금요일 날짜)로 찾고,
+        둘 다 없으면 항상 None입니다.
+        """
+        if not self.index:
+            if row is None or getattr(self.sheets_service, 'snapshot', None) is None:
+                return None
+            row_number = self.sheets_service.find_row(row.author_name, row.friday_date)
+            if row_number is None:
+                return None
+            return IndexEntry(thread_ts=None, author_name=row.author_name, week=row.friday_date, row_number=row_number)
+        if row is None:
+            return self.index.find(thread_ts=ref.thread_ts)
+        return self.index.find(ref.thread_ts, row.author_name, row.friday_date)
+
+    def write_row(self, ref: ThreadRef, row: SpreadsheetRow) -> Tuple[Optional[int], str]:
+        """행 하나 기록 (중복 처리 포함)
+
+        Returns:
+            (행 번호, 중복 처리 결과) - 대기열에 저장한 경우 행 번호는 None
+        """
+        entry = self.find_duplicate(ref, row)
+        if self._should_skip(ref, entry):
+            return entry.row_number, 'skipped'
+
+        route = self.route(ref, row)
+        if entry and entry.row_number is not None:
+            self._sheets_call('update_row', entry.row_number, row, route=route)
+            self._record(ref, row, entry.row_number)
+            return entry.row_number, 'updated'
+
+        if self.spool:
+            # 같은 스레드가 대기 중이면 대기열에서 새 행으로 교체됨
+            self.spool.enqueue(row, key=ref.thread_ts, route=route)
+            self._record(ref, row, None)
+            return None, ''
+
+        row_number = self._sheets_call('append_row', row, route=route)
+        self._record(ref, row, row_number)
+        return row_number, ''
+
+    def route(self, ref: ThreadRef, row: SpreadsheetRow) -> Optional[str]:
+        """시트 라우터(SheetRouter)를 쓰는 경우 보고서를 기록할 시트 키, 아니면 None"""
+        route = getattr(self.sheets_service, 'route', None)
+        if route is None:
+            return None
+        return route(ref.channel_id, row.author_name).key
+
+    def _sheets_call(self, method: str, *args, route: Optional[str] = None):
+        """Sheets 서비스 호출 (라우팅된 경우에만 route 전달)"""
+        if route is None:
+            return getattr(self.sheets_service, method)(*args)
+        return getattr(self.sheets_service, method)(*args, route=route)
+
+    def _should_skip(self, ref: ThreadRef, entry: Optional[IndexEntry]) -> bool:
+        """중복 보고서를 건너뛸지 판단
+
+        이미 시트에 기록된 보고서는 skip 방식일 때 건너뛰고, 대기열에 있는 다른 스레드의 같은 보고서는
+        항상 건너뜁니다. 대기열에 있는 같은 스레드는 다시 저장하여 새 내용으로 교체합니다.
+        """
+        if not entry:
+            return False
+        if entry.row_number is None:
+            return entry.thread_ts != ref.thread_ts
+        return self.on_duplicate == 'skip'
+
+    def _record(self, ref: ThreadRef, row: SpreadsheetRow, row_number: Optional[int]):
+        """색인에 기록 결과 저장"""
+        if self.index:
+            self.index.record(ref.thread_ts, row.author_name, row.friday_date, row_number)
+
+    def run(self, refs: Iterable[ThreadRef]) -> List[BatchResult]:
+        """모든 스레드를 파싱한 뒤 성공한 행을 한 번에 기록
+
+        색인이 있으면 이미 기록한 스레드는 Slack 조회 없이 건너뛰고(skip), update 방식이면
+        기존 행들을 한 번의 요청으로 갱신합니다. 같은 실행 안에서 중복된 보고서는 처음 것만 기록합니다.
+        """
+        results = []
+        built = []  # (결과, 행) 목록
+
+        for ref in refs:
+            # 이미 기록된 스레드는 Slack 조회 전에 건너뜀
+            skipped = self.skip_known(ref)
+            if skipped:
+                results.append(skipped)
+                continue
+
+            try:
+                row, parsed_data = self.build_row(ref)
+            except Exception as e:
+                results.append(BatchResult(ref=ref, success=False, error=str(e)))
+                continue
+
+            result = BatchResult(ref=ref, success=True, author_name=parsed_data['author_name'],
+                                 parsed_data=parsed_data)
+            results.append(result)
+            built.append((result, row))
+
+        self.write_built(built, set())
+        return results
+
+    def record_failures(self, results: Iterable[BatchResult]) -> int:
+        """실패한 보고서를 보관소에 저장 (보관소가 없거나 쓰기 대기열에 남은 보고서는 제외)
+
+        Returns:
+            보관한 보고서 수
+        """
+        if not self.dead_letters:
+            return 0
+        count = 0
+        for result in results:
+            if not result.success and not result.spooled:
+                self.dead_letters.add(result.ref, result.error, result.parsed_data)
+                count += 1
+        return count
+
+    def skip_known(self, ref: ThreadRef) -> Optional[BatchResult]:
+        """색인상 이미 시트에 기록된 스레드면 (skip 방식일 때) 건너뛴 결과, 아니면 None"""
+        entry = self.find_duplicate(ref)
+        if entry and entry.row_number is not None and self.on_duplicate == 'skip':
+            return BatchResult(ref=ref, success=True, author_name=entry.author_name,
+                               row_number=entry.row_number, duplicate='skipped')
+        return None
+
+    def write_built(self, built: List[Tuple[BatchResult, SpreadsheetRow]], seen: set):
+        """만든 행들을 중복 확인 후 한 번에 기록하고 결과(BatchResult)에 행 번호 반영
+
+        seen은 이미 처리한 thread_ts와 (작성자, 금요일 날짜) 집합으로, 여러 묶음에 걸쳐 같은 집합을 넘기면
+        실행 전체에서 중복된 보고서는 처음 것만 기록합니다.
+        """
+        pending = []  # (결과, 행) 목록
+        updates = []  # (결과, 행, 기존 행 번호) 목록
+
+        for result, row in built:
+            ref = result.ref
+            keys = (ref.thread_ts, (row.author_name, row.friday_date))
+            entry = self.find_duplicate(ref, row)
+            if any(key in seen for key in keys) or self._should_skip(ref, entry):
+                result.row_number = entry.row_number if entry else None
+                result.duplicate = 'skipped'
+                continue
+            seen.update(keys)
+
+            if entry and entry.row_number is not None:
+                result.row_number = entry.row_number
+                result.duplicate = 'updated'
+                updates.append((result, row, entry.row_number))
+            else:
+                pending.append((result, row))
+
+        # 시트 라우터를 쓰면 기록할 시트별로 묶어 시트마다 한 번씩 기록
+        for route, route_updates in self._group_by_route(updates).items():
+            self._update_rows(route_updates, route)
+
+        if pending and self.spool:
+            self._write_through_spool(pending)
+            return
+
+        for route, route_pending in self._group_by_route(pending).items():
+            try:
+                row_numbers = self._sheets_call('append_rows', [row for _, row in route_pending], route=route)
+                for (result, row), row_number in zip(route_pending, row_numbers):
+                    result.row_number = row_number
+                    self._record(result.ref, row, row_number)
+            except Exception as e:
+                # 일괄 기록 실패 시 같은 시트에 기록할 스레드는 모두 실패로 처리
+                for result, _ in route_pending:
+                    result.success = False
+                    result.error = str(e)
+
+    def _group_by_route(self, items: List[Tuple]) -> Dict[Optional[str], List[Tuple]]:
+        """(결과, 행, ...) 목록을 기록할 시트별로 묶기 (순서 유지, 라우터가 없으면 하나의 묶음)"""
+        groups: Dict[Optional[str], List[Tuple]] = {}
+        for item in items:
+            groups.setdefault(self.route(item[0].ref, item[1]), []).append(item)
+        return groups
+
+    def _update_rows(self, updates: List[Tuple[BatchResult, SpreadsheetRow, int]], route: Optional[str] = None):
+        """기존 행 갱신 (시트마다 한 번의 요청, 실패 시 해당 스레드 모두 실패)"""
+        try:
+            self._sheets_call('update_rows', [row_number for _, _, row_number in updates],
+                              [row for _, row, _ in updates], route=route)
+        except Exception as e:
+            for result, _, _ in updates:
+                result.success = False
+                result.error = str(e)
+            return
+
+        for result, row, row_number in updates:
+            self._record(result.ref, row, row_number)
+
+    def _write_through_spool(self, pending: List[Tuple[BatchResult, SpreadsheetRow]]):
+        """행을 대기열에 저장한 뒤 기록 (실패한 행은 대기열에 남아 다음 실행에서 재시도)"""
+        for result, row in pending:
+            self.spool.enqueue(row, key=result.ref.thread_ts, route=self.route(result.ref, row))
+            self._record(result.ref, row, None)
+
+        error = None
+        try:
+            row_numbers = dict(self.spool.flush())
+        except SpoolFlushError as e:
+            row_numbers = dict(e.written)
+            error = str(e)
+
+        for result, row in pending:
+            if result.ref.thread_ts in row_numbers:
+                result.row_number = row_numbers[result.ref.thread_ts]
+                self._record(result.ref, row, result.row_number)
+            else:
+                result.success = False
+                result.spooled = True
+                result.error = f"시트 기록 실패, 대기열에 보관되어 다음 실행에서 다시 기록됩니다: {error}"
+
+def format_report(results: List[BatchResult]) -> str:
+    """스레드별 처리 결과 요약 문자열 생성"""
+    succeeded = sum(1 for result in results if result.success)
+    lines = [f"📋 처리 결과: 전체 {len(results)}건 / 성공 {succeeded}건 / 실패 {len(results) - succeeded}건"]
+
+    for result in results:
+        ref = result.ref
+        if result.duplicate == 'skipped':
+            location = f"{result.row_number}행" if result.row_number else "대기열"
+            lines.append(f"⏭️ {ref.channel_id} {ref.thread_ts} → 이미 기록됨, 건너뜀 ({location})")
+        elif result.success and result.duplicate == 'updated':
+            lines.append(f"🔁 {ref.channel_id} {ref.thread_ts} → {result.row_number}행 갱신 ({result.author_name})")
+        elif result.success:
+            lines.append(f"✅ {ref.channel_id} {ref.thread_ts} → {result.row_number}행 ({result.author_name})")
+        else:
+            lines.append(f"❌ {ref.channel_id} {ref.thread_ts} → {result.error}")
+
+    return "\n".join(lines)
@@ -0,0 +1,171 @@
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional
+from services.batch_processor import BatchProcessor, BatchResult, ThreadRef
+
+# 실패한 보고서를 다음 동기화에서 다시 시도하는 최대 횟수
+MAX_SYNC_RETRIES = 3
+
+@dataclass
+class SyncResult:
+    """채널 동기화 한 번의 결과 (보고서별 결과는 실패한 것만 보관)"""
+
+    channel_id: str
+    oldest_before: Optional[str]
+    oldest_after: Optional[str] = None
+    scanned: int = 0                        # 확인한 채널 메시지 수
+    reports: int = 0                        # 주간업무 현황 메시지 수 (재시도 포함)
+    written: int = 0
+    skipped: int = 0                        # 이미 기록되어 건너뛴 보고서
+    retried: int = 0                        # 이전 동기화에서 실패해 다시 시도한 보고서
+    failures: List[BatchResult] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)  # 재시도 횟수를 넘겨 포기한 thread_ts
+
+class SyncCheckpoint:
+    """채널별 동기화 위치 저장 파일 (JSON)
+
+    채널마다 마지막으로 확인한 메시지 TS(oldest)와 다시 시도할 보고서의 thread_ts → 실패 횟수를 저장합니다.
+    동기화 도중에는 pending에 이번 동기화가 끝나면 저장할 TS(newest)와 처리를 마친 가장 오래된 TS(latest)를 남깁니다.
+    path가 없으면 메모리에만 저장하므로 프로세스가 끝나면 위치를 잊습니다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._memory: Dict = {}  # path가 없을 때 채널별 위치
+
+    def get(self, channel_id: str) -> Dict:
+        """채널의 저장된 위치
+
+        Returns:
+            {'oldest': TS 또는 None, 'retry': {thread_ts: 실패 횟수},
+             'pending': 중단된 동기화의 {'newest': TS, 'latest': TS} 또는 None}
+        """
+        state = self._load().get(channel_id) or {}
+        return {'oldest': state.get('oldest'), 'retry': dict(state.get('retry') or {}),
+                'pending': state.get('pending')}
+
+    def save(self, channel_id: str, oldest: Optional[str], retry: Dict[str, int], pending: Optional[Dict] = None):
+        """채널 위치 저장 (임시 파일에 쓴 뒤 교체)"""
+        checkpoints = self._load()
+        checkpoints[channel_id] = {'oldest': oldest, 'retry': retry, 'synced_at': time.time()}
+        if pending:
+            checkpoints[channel_id]['pending'] = pending
+        if not self.path:
+            self._memory = checkpoints
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoints, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def _load(self) -> Dict:
+        if not self.path:
+            return dict(self._memory)
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+class ChannelSync:
+    """저장된 위치 이후의 채널 기록만 읽어 새 주간업무 현황 보고서를 기록하는 증분 동기화
+
+    - conversations_history를 페이지 단위 제너레이터로 읽고 chunk_size개씩 BatchProcessor.run으로 처리하므로
+      채널 기록이 많아도 메모리 사용량이 일정합니다.
+    - 새 메시지가 없으면 conversations_history 한 번만 호출합니다.
+    - 실패한 보고서는 위치 파일에 남겨 다음 동기화에서 다시 시도하고, MAX_SYNC_RETRIES번 실패하면 포기합니다.
+    - 채널 기록은 최신 메시지부터 오므로, 묶음을 기록할 때마다 처리를 마친 가장 오래된 TS를 위치 파일에 남깁니다.
+      도중에 중단되면 다음 실행은 그 TS보다 오래된 메시지만 이어서 읽고, 끝나면 중단 전 가장 최근 TS로 위치를 옮깁니다.
+    """
+
+    def __init__(self, processor: BatchProcessor, checkpoint: SyncCheckpoint, chunk_size: int = 50):
+        self.processor = processor
+        self.checkpoint = checkpoint
+        self.chunk_size = chunk_size
+
+    def sync(self, channel_id: str, oldest: Optional[str] = None) -> SyncResult:
+        """channel_id의 새 보고서 기록 (저장된 위치가 없으면 oldest부터, 둘 다 없으면 채널 처음부터)"""
+        state = self.checkpoint.get(channel_id)
+        start = state['oldest'] or oldest
+        result = SyncResult(channel_id=channel_id, oldest_before=start)
+        # 중단된 동기화가 있으면 처리를 마친 가장 오래된 TS 이전부터 이어서 읽음
+        pending = state['pending'] or {}
+        progress = {'newest': pending.get('newest', start), 'lowest': pending.get('latest')}
+
+        retry_refs = [ThreadRef(channel_id, thread_ts) for thread_ts in state['retry']]
+        result.retried = len(retry_refs)
+        refs = chain(retry_refs, self._iter_new_reports(channel_id, start, result, progress))
+
+        # 아직 다시 시도하지 않은 보고서도 묶음마다 저장하는 위치에 남김
+        retry = dict(state['retry'])
+        for chunk in _chunks(refs, self.chunk_size):
+            # 같은 묶음 안에서는 시간순으로 기록
+            chunk.sort(key=lambda ref: float(ref.thread_ts))
+            for batch_result in self.processor.run(chunk):
+                result.reports += 1
+                thread_ts = batch_result.ref.thread_ts
+                retry.pop(thread_ts, None)
+                if not batch_result.success:
+                    result.failures.append(batch_result)
+                    attempts = state['retry'].get(thread_ts, 0) + 1
+                    if attempts < MAX_SYNC_RETRIES:
+                        retry[thread_ts] = attempts
+                    else:
+                        result.dropped.append(thread_ts)
+                elif batch_result.duplicate == 'skipped':
+                    result.skipped += 1
+                else:
+                    result.written += 1
+
+            # 기록을 마친 묶음까지 저장 (위치 oldest는 동기화가 끝날 때 옮김)
+            pending = {'newest': progress['newest'], 'latest': progress['lowest']} if progress['lowest'] else None
+            self.checkpoint.save(channel_id, start, retry, pending=pending)
+
+        result.oldest_after = progress['newest']
+        self.checkpoint.save(channel_id, result.oldest_after, retry)
+        return result
+
+    def _iter_new_reports(self, channel_id: str, oldest: Optional[str], result: SyncResult,
+                          progress: Dict) -> Iterator[ThreadRef]:
+        """oldest 이후 채널 메시지 중 주간업무 현황만 하나씩 반환
+
+        가장 최근 TS와 지금까지 읽은 가장 오래된 TS를 progress에 기록하고, progress['lowest']가 있으면
+        그 TS보다 오래된 메시지만 읽습니다. (중단된 동기화 이어서 읽기)
+        """
+        messages = self.processor.slack_service.iter_channel_messages(channel_id, oldest=oldest,
+                                                                      latest=progress['lowest'])
+        for message in messages:
+            result.scanned += 1
+            if progress['newest'] is None or float(message['ts']) > float(progress['newest']):
+                progress['newest'] = message['ts']
+            if progress['lowest'] is None or float(message['ts']) < float(progress['lowest']):
+                progress['lowest'] = message['ts']
+            ref = self.processor.report_ref(channel_id, message)
+            if ref:
+                yield ref
+
+def _chunks(items: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def format_sync_result(result: SyncResult) -> str:
+    """동기화 결과 요약 문자열"""
+    lines = [
+        f"📥 {result.channel_id} 동기화: 메시지 {result.scanned}개 확인 / 보고서 {result.reports}건 "
+        f"(기록 {result.written}, 건너뜀 {result.skipped}, 실패 {len(result.failures)}, 재시도 {result.retried})",
+        f"   위치: {result.oldest_before or '처음'} → {result.oldest_after or '처음'}"
+    ]
+    for failure in result.failures:
+        lines.append(f"❌ {failure.ref.thread_ts} → {failure.error}")
+    for thread_ts in result.dropped:
+        lines.append(f"⚠️ {thread_ts} → {MAX_SYNC_RETRIES}번 실패하여 더 이상 재시도하지 않습니다.")
+    return "\n".join(lines)
@@ -0,0 +1,148 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+_state_file_lock = threading.Lock()
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있어 외부 호출을 하지 않고 바로 실패"""
+
+    def __init__(self, backend: str, retry_in: float, failures: int):
+        super().__init__(f"{backend} 호출 차단 중 (연속 실패 {failures}회, {retry_in:.0f}초 후 다시 시도)")
+        self.backend = backend
+        self.retry_in = retry_in
+
+class CircuitBreaker:
+    """백엔드(slack, sheets)별 차단기
+
+    - 연속 failure_threshold회 실패하면 열리고(open), reset_timeout초 동안은 호출하지 않고 바로
+      CircuitOpenError를 냅니다. (장애 중에 보고서마다 재시도와 타임아웃을 모두 기다리지 않음)
+    - reset_timeout이 지나면 호출 하나만 시험으로 통과시키고(half_open), 성공하면 닫히고 실패하면 다시 열립니다.
+    - state_path를 주면 열린 시각을 파일에 남기므로, 보고서마다 따로 실행하는 경우에도 다음 실행이 바로 실패합니다.
+
+    실패로 세는 오류의 판단(5xx, 429, 연결 오류 등)은 호출하는 쪽(RateLimitScheduler)에서 합니다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 state_path: Optional[str] = None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0      # time.time() 기준 (파일에 저장하므로 벽시계 시각)
+        self._probing = False
+        self._stats = {'rejected': 0, 'opened': 0}
+        self._load_state()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> bool:
+        """호출 전 확인 (열려 있으면 CircuitOpenError)
+
+        Returns:
+            이번 호출이 시험 호출인지 (True면 결과를 기록하지 못한 경우 release_probe()를 호출해야 함)
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return False
+            if state == HALF_OPEN and not self._probing:
+                self._state = HALF_OPEN
+                self._probing = True
+                return True
+            self._stats['rejected'] += 1
+            retry_in = max(0.0, self._opened_at + self.reset_timeout - time.time())
+            raise CircuitOpenError(self.name, retry_in, self._failures)
+
+    def record_success(self):
+        """호출 성공 (또는 백엔드가 응답한 오류) - 연속 실패 초기화, 시험 호출이면 닫힘"""
+        with self._lock:
+            reopened = self._state != CLOSED
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+        if reopened:
+            self._save_state()
+
+    def record_failure(self):
+        """백엔드 장애로 보이는 실패 - 연속 실패가 한도에 이르거나 시험 호출이 실패하면 열림"""
+        with self._lock:
+            self._failures += 1
+            if self._state == CLOSED and self._failures < self.failure_threshold:
+                return
+            if self._state == OPEN:
+                # 열리기 전에 시작된 호출의 실패
+                return
+            self._state = OPEN
+            self._opened_at = time.time()
+            self._probing = False
+            self._stats['opened'] += 1
+        self._save_state()
+
+    def release_probe(self):
+        """결과를 기록하지 못하고 끝난 시험 호출 정리 (대기 중 오류 등) - 다음 호출이 다시 시험할 수 있게 함"""
+        with self._lock:
+            self._probing = False
+
+    def stats(self) -> Dict:
+        """상태, 연속 실패 수, 바로 실패시킨 호출 수, 열린 횟수"""
+        with self._lock:
+            return {'state': self._current_state(), 'failures': self._failures, **self._stats}
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and time.time() - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return self._state
+
+    def _load_state(self):
+        """이전 실행에서 열린 차단기 상태 읽기 (아직 reset_timeout 전이면 열린 채로 시작)"""
+        opened = _read_state_file(self.state_path).get(self.name)
+        if not opened:
+            return
+        self._state = OPEN
+        self._opened_at = float(opened.get('opened_at', 0))
+        self._failures = int(opened.get('failures', self.failure_threshold))
+
+    def _save_state(self):
+        if not self.state_path:
+            return
+        with _state_file_lock:
+            states = _read_state_file(self.state_path)
+            with self._lock:
+                if self._state == CLOSED:
+                    states.pop(self.name, None)
+                else:
+                    states[self.name] = {'opened_at': self._opened_at, 'failures': self._failures}
+            tmp_path = f"{self.state_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(states, f)
+            os.replace(tmp_path, self.state_path)
+
+def _read_state_file(path: Optional[str]) -> Dict:
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def create_breakers(failure_threshold: int = 5, reset_timeout: float = 30.0,
+                    state_path: Optional[str] = None) -> Dict[str, CircuitBreaker]:
+    """Slack, Sheets 백엔드별 차단기 (RateLimitScheduler의 breakers 인자용)"""
+    return {
+        name: CircuitBreaker(name, failure_threshold, reset_timeout, state_path)
+        for name in ('slack', 'sheets')
+    }
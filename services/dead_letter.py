@@ -0,0 +1,176 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+from models.spreadsheet_row import SpreadsheetRow
+from services.batch_processor import BatchProcessor, BatchResult, ThreadRef
+
+@dataclass
+class DeadLetter:
+    """처리에 실패해 보관한 보고서"""
+
+    id: int
+    ref: ThreadRef
+    error: str
+    attempts: int
+    failed_at: float
+    parsed_data: Optional[Dict] = None     # 파싱까지 끝난 경우 (재처리 시 파싱 생략)
+
+@dataclass
+class ReplayResult:
+    """재처리 결과"""
+
+    replayed: List[BatchResult] = field(default_factory=list)
+    failures: List[BatchResult] = field(default_factory=list)
+    remaining: int = 0
+
+class DeadLetterStore:
+    """처리에 실패한 보고서 보관소 (SQLite)
+
+    실패한 보고서를 스레드 정보, 원문 메시지, 파싱 결과(있으면)와 함께 저장합니다.
+    같은 스레드가 다시 실패하면 새 내용으로 교체하고 실패 횟수를 늘립니다.
+    원문이 있는 보고서는 replay_dead_letters로 재처리할 때 Slack을 다시 조회하지 않습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS dead_letters (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                channel_id TEXT,
+                thread_ts TEXT,
+                author_name TEXT,
+                message TEXT,
+                parsed_json TEXT,
+                error TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 1,
+                failed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS dead_letters_thread ON dead_letters (channel_id, thread_ts)")
+        self._conn.commit()
+
+    def add(self, ref: ThreadRef, error: str, parsed_data: Optional[Dict] = None) -> int:
+        """실패한 보고서 저장 (ref.message에 원문이 있으면 함께 저장)"""
+        with self._lock:
+            attempts = 1
+            if ref.thread_ts:
+                previous = self._conn.execute(
+                    "SELECT id, attempts, message, parsed_json FROM dead_letters WHERE channel_id IS ? AND thread_ts = ?",
+                    (ref.channel_id, ref.thread_ts)
+                ).fetchone()
+                if previous:
+                    self._conn.execute("DELETE FROM dead_letters WHERE id = ?", (previous[0],))
+                    attempts = previous[1] + 1
+            cursor = self._conn.execute(
+                """INSERT INTO dead_letters (channel_id, thread_ts, author_name, message, parsed_json, error,
+                                             attempts, failed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (ref.channel_id, ref.thread_ts, ref.author_name, ref.message,
+                 json.dumps(parsed_data, ensure_ascii=False) if parsed_data else None, error, attempts, time.time())
+            )
+            self._conn.commit()
+            return cursor.lastrowid
+
+    def entries(self, limit: Optional[int] = None) -> List[DeadLetter]:
+        """보관된 보고서 목록 (오래된 순)"""
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT id, channel_id, thread_ts, author_name, message, parsed_json, error, attempts, failed_at
+                   FROM dead_letters ORDER BY id LIMIT ?""",
+                (-1 if limit is None else limit,)
+            ).fetchall()
+        return [
+            DeadLetter(
+                id=row[0],
+                ref=ThreadRef(channel_id=row[1], thread_ts=row[2], author_name=row[3], message=row[4]),
+                parsed_data=json.loads(row[5]) if row[5] else None,
+                error=row[6],
+                attempts=row[7],
+                failed_at=row[8]
+            )
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM dead_letters").fetchone()[0]
+
+    def remove(self, entry_ids: List[int]):
+        """재처리에 성공한 보고서 삭제"""
+        with self._lock:
+            self._conn.executemany("DELETE FROM dead_letters WHERE id = ?", [(entry_id,) for entry_id in entry_ids])
+            self._conn.commit()
+
+    def mark_failed(self, failures: Dict[int, str]):
+        """재처리에 다시 실패한 보고서의 실패 횟수와 오류 갱신 ({id: 오류})"""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE dead_letters SET attempts = attempts + 1, error = ?, failed_at = ? WHERE id = ?",
+                [(error, now, entry_id) for entry_id, error in failures.items()]
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def replay_dead_letters(store: DeadLetterStore, processor: BatchProcessor, batch_size: int = 50,
+                        limit: Optional[int] = None) -> ReplayResult:
+    """보관된 보고서를 batch_size개씩 묶어 다시 기록
+
+    - 파싱 결과가 있으면 바로 행을 만들고, 원문만 있으면 다시 파싱합니다. 둘 다 없을 때만 Slack을 조회합니다.
+    - 묶음마다 BatchProcessor.write_built로 한 번에 기록하며, 색인상 이미 기록된 보고서는 건너뜁니다.
+    - 성공한(또는 쓰기 대기열에 보관된) 보고서는 보관소에서 삭제하고, 실패한 보고서는 실패 횟수를 늘려 남깁니다.
+    """
+    result = ReplayResult()
+    seen = set()
+    for chunk in _chunks(store.entries(limit), batch_size):
+        built = []
+        outcomes = []  # (보관 ID, 결과)
+        for entry in chunk:
+            skipped = processor.skip_known(entry.ref)
+            if skipped:
+                outcomes.append((entry.id, skipped))
+                continue
+            try:
+                if entry.parsed_data:
+                    parsed_data = entry.parsed_data
+                    row = SpreadsheetRow.from_parsed_data(parsed_data)
+                else:
+                    row, parsed_data = processor.build_row(entry.ref)
+            except Exception as e:
+                outcomes.append((entry.id, BatchResult(ref=entry.ref, success=False, error=str(e))))
+                continue
+            batch_result = BatchResult(ref=entry.ref, success=True, author_name=parsed_data['author_name'],
+                                       parsed_data=parsed_data)
+            built.append((batch_result, row))
+            outcomes.append((entry.id, batch_result))
+
+        processor.write_built(built, seen)
+
+        store.remove([entry_id for entry_id, outcome in outcomes if outcome.success or outcome.spooled])
+        store.mark_failed({entry_id: outcome.error for entry_id, outcome in outcomes
+                           if not (outcome.success or outcome.spooled)})
+        for _, outcome in outcomes:
+            (result.replayed if outcome.success or outcome.spooled else result.failures).append(outcome)
+
+    result.remaining = store.count()
+    return result
+
+def _chunks(entries: List[DeadLetter], size: int) -> Iterator[List[DeadLetter]]:
+    for start in range(0, len(entries), max(1, size)):
+        yield entries[start:start + size]
+
+def format_replay_result(result: ReplayResult) -> str:
+    """재처리 결과 요약 문자열"""
+    lines = [f"📮 재처리 결과: 성공 {len(result.replayed)}건 / 실패 {len(result.failures)}건 / "
+             f"남은 보고서 {result.remaining}건"]
+    for failure in result.failures:
+        lines.append(f"❌ {failure.ref.channel_id} {failure.ref.thread_ts} → {failure.error}")
+    return "\n".join(lines)
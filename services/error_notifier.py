@@ -0,0 +1,254 @@
+import fcntl
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# 오류 분류 시 지우는 값 (스레드 TS, 행 번호, 날짜 등 4자리 이상 숫자)
+_VOLATILE_NUMBERS = re.compile(r'\d[\d.:-]{3,}')
+
+def error_class(error) -> str:
+    """같은 원인의 오류를 묶는 분류 키 (오류 종류 + 숫자를 지운 첫 줄)"""
+    message = str(error).strip().splitlines()[0] if str(error).strip() else ''
+    message = _VOLATILE_NUMBERS.sub('#', message)[:120]
+    if isinstance(error, BaseException):
+        return f"{type(error).__name__}: {message}"
+    return message
+
+def thread_link(channel_id: str, thread_ts: str) -> str:
+    """스레드 링크 (Slack mrkdwn)"""
+    return f"<https://slack.com/archives/{channel_id}/p{thread_ts.replace('.', '')}|{thread_ts}>"
+
+class ErrorNotifier:
+    """오류 알림을 모아 채널별 요약(digest)으로 보내는 알림기
+
+    - notify()는 버퍼에 넣기만 하므로 처리 흐름을 막지 않습니다. (Slack 호출 없음)
+    - (채널, 오류 분류)별로 건수와 스레드 링크 몇 개를 모아, interval초마다 채널마다 메시지 하나로 보냅니다.
+    - 전송은 기존 SlackService(공용 요청 한도 스케줄러)를 재사용하고, 분당 max_posts_per_minute개를 넘으면
+      남은 요약은 다음 전송으로 미룹니다.
+    - channel_id를 주면 모든 요약을 그 채널(예: 운영 채널)로 보냅니다.
+    - state_path를 주면 마지막 전송 시각과 미처 보내지 못한 오류를 파일에 남깁니다. 보고서마다 따로 실행하는
+      경우 interval 안에 다시 실패한 오류는 미뤄 두었다가, 다음 실행(성공한 실행 포함)이 끝날 때 interval이
+      지났으면 보냅니다. 한 번만 실행하는 명령은 끝날 때마다 close()를 호출해야 미룬 오류가 전송됩니다.
+    - 미룬 오류는 close()에서 잠금 파일({state_path}.lock)을 잡은 채 읽고, 전송하고, 저장하므로 동시에 끝나는
+      실행끼리 오류를 덮어쓰거나 같은 요약을 두 번 보내지 않습니다.
+    """
+
+    def __init__(self, slack_service, interval: float = 300.0, max_samples: int = 3,
+                 max_posts_per_minute: int = 10, channel_id: Optional[str] = None,
+                 state_path: Optional[str] = None):
+        self.slack_service = slack_service
+        self.interval = interval
+        self.max_samples = max_samples
+        self.max_posts_per_minute = max_posts_per_minute
+        self.channel_id = channel_id
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self._pending: Dict[tuple, Dict] = {}          # (채널, 분류) → 건수, 예시, 스레드 링크
+        self._last_posted: Dict[str, float] = {}       # 채널 → 마지막 전송 시각
+        self._posted_at = deque()                       # 최근 1분간 전송 시각
+        self._stats = {'notified': 0, 'posted': 0, 'failed_posts': 0}
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_posted = {channel: float(at) for channel, at in self._read_state().get('last_posted', {}).items()}
+
+    def notify(self, channel_id: str, error, thread_ts: Optional[str] = None):
+        """오류 하나를 요약 버퍼에 추가 (바로 반환)"""
+        target = self.channel_id or channel_id
+        if not target:
+            return
+        key = (target, error_class(error))
+        now = time.time()
+        with self._lock:
+            entry = self._pending.setdefault(key, {
+                'count': 0, 'example': str(error)[:300], 'samples': [], 'first_at': now
+            })
+            entry['count'] += 1
+            entry['last_at'] = now
+            if thread_ts and channel_id and len(entry['samples']) < self.max_samples:
+                entry['samples'].append(thread_link(channel_id, thread_ts))
+            self._stats['notified'] += 1
+
+    def pending_count(self) -> int:
+        """보내지 않은 오류 건수"""
+        with self._lock:
+            return sum(entry['count'] for entry in self._pending.values())
+
+    def flush(self, force: bool = True) -> int:
+        """모은 오류를 채널별 요약으로 전송
+
+        Args:
+            force: False면 마지막 전송 후 interval이 지나지 않은 채널은 보내지 않고 남김
+
+        Returns:
+            보낸 요약 메시지 수
+        """
+        now = time.time()
+        with self._lock:
+            by_channel: Dict[str, List[tuple]] = {}
+            for (channel, name), entry in self._pending.items():
+                if force or now - self._last_posted.get(channel, 0) >= self.interval:
+                    # 전송하는 동안 들어온 오류와 섞이지 않도록 복사본으로 보냄
+                    by_channel.setdefault(channel, []).append((name, dict(entry, samples=list(entry['samples']))))
+
+        posted = 0
+        for channel, entries in by_channel.items():
+            if not self._take_post_slot():
+                break  # 분당 전송 한도 초과 - 다음 전송으로 미룸
+            try:
+                self.slack_service.post_message(channel, format_digest(entries))
+            except Exception as e:
+                print(f"⚠️ 오류 요약 전송 실패 ({channel}): {str(e)}")
+                with self._lock:
+                    self._stats['failed_posts'] += 1
+                continue
+
+            with self._lock:
+                for name, sent in entries:
+                    current = self._pending.get((channel, name))
+                    if current is None:
+                        continue
+                    # 전송하는 동안 들어온 오류는 다음 요약에 남김
+                    current['count'] -= sent['count']
+                    if current['count'] <= 0:
+                        del self._pending[(channel, name)]
+                    else:
+                        current['samples'] = current['samples'][len(sent['samples']):]
+                        current['first_at'] = sent['last_at']
+                self._last_posted[channel] = time.time()
+                self._stats['posted'] += 1
+            posted += 1
+        return posted
+
+    def start(self):
+        """백그라운드 전송 스레드 시작 (interval초마다 전송)"""
+        if self._thread:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name='error-notifier', daemon=True)
+        self._thread.start()
+
+    def close(self, force: Optional[bool] = None):
+        """백그라운드 스레드를 멈추고 남은 오류 전송 (이전 실행에서 미룬 오류 포함)
+
+        Args:
+            force: None이면 state_path가 있을 때만 interval 안에 이미 요약을 보낸 채널의 오류를 파일에 남겨
+                   다음 실행에서 합치고, True면 모두 보냅니다. (상주 서비스 종료 시)
+        """
+        if self._thread:
+            self._stopping.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        with self._state_file_lock():
+            self._merge_state()
+            self.flush(force=not self.state_path if force is None else force)
+            self._save_state()
+
+    def stats(self) -> Dict[str, int]:
+        """받은 오류 수, 보낸 요약 수, 전송 실패 수, 남은 오류 수"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['pending'] = self.pending_count()
+        return stats
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wake.wait(self.interval)
+            if self._stopping.is_set():
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"⚠️ 오류 요약 전송 실패: {str(e)}")
+
+    def _take_post_slot(self) -> bool:
+        """분당 전송 한도 확인 (자리가 있으면 예약)"""
+        now = time.monotonic()
+        with self._lock:
+            while self._posted_at and now - self._posted_at[0] >= 60:
+                self._posted_at.popleft()
+            if len(self._posted_at) >= self.max_posts_per_minute:
+                return False
+            self._posted_at.append(now)
+            return True
+
+    @contextmanager
+    def _state_file_lock(self):
+        """상태 파일 읽기-전송-저장 동안 다른 실행을 막는 잠금 (state_path가 없으면 잠그지 않음)"""
+        if not self.state_path:
+            yield
+            return
+        with open(f"{self.state_path}.lock", 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_state(self) -> Dict:
+        if not self.state_path or not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _merge_state(self):
+        """파일에 남은 미룬 오류와 마지막 전송 시각을 현재 버퍼에 합침 (잠금을 잡은 채 호출)"""
+        state = self._read_state()
+        with self._lock:
+            for channel, at in state.get('last_posted', {}).items():
+                self._last_posted[channel] = max(self._last_posted.get(channel, 0), float(at))
+            for item in state.get('pending', []):
+                key = (item['channel'], item['error_class'])
+                entry = self._pending.get(key)
+                if entry is None:
+                    self._pending[key] = {name: item[name] for name in ('count', 'example', 'samples', 'first_at', 'last_at')}
+                    continue
+                entry['count'] += item['count']
+                entry['samples'] = (item['samples'] + entry['samples'])[:self.max_samples]
+                entry['first_at'] = min(entry['first_at'], item['first_at'])
+                entry['last_at'] = max(entry['last_at'], item['last_at'])
+
+    def _save_state(self):
+        if not self.state_path:
+            return
+        with self._lock:
+            state = {
+                'last_posted': self._last_posted,
+                'pending': [dict(entry, channel=channel, error_class=name)
+                            for (channel, name), entry in self._pending.items()]
+            }
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+def has_deferred_errors(state_path: Optional[str]) -> bool:
+    """이전 실행에서 미뤄 둔 오류가 상태 파일에 있는지 (Slack 서비스를 만들기 전 확인용)"""
+    if not state_path or not os.path.exists(state_path):
+        return False
+    try:
+        with open(state_path, encoding='utf-8') as f:
+            return bool(json.load(f).get('pending'))
+    except (OSError, ValueError):
+        return False
+
+def format_digest(entries: List[tuple]) -> str:
+    """채널 하나의 오류 요약 메시지 ([(분류, 항목), ...])"""
+    total = sum(entry['count'] for _, entry in entries)
+    minutes = max(1, round((max(entry['last_at'] for _, entry in entries) -
+                            min(entry['first_at'] for _, entry in entries)) / 60))
+    lines = [f"⚠️ 주간업무 자동 입력 오류 {total}건 (최근 {minutes}분)"]
+    for _, entry in sorted(entries, key=lambda item: -item[1]['count']):
+        lines.append(f"• {entry['count']}건 — {entry['example']}")
+        if entry['samples']:
+            lines.append(f"    예: {', '.join(entry['samples'])}")
+    return "\n".join(lines)
@@ -0,0 +1,157 @@
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+@dataclass
+class IndexEntry:
+    """이미 기록한 보고서 정보 (row_number가 None이면 쓰기 대기열에서 기록 대기 중)"""
+
+    thread_ts: Optional[str]
+    author_name: str
+    week: str
+    row_number: Optional[int]
+
+class IngestionIndex:
+    """기록한 보고서 → 시트 행 번호 로컬 색인 (SQLite)
+
+    thread_ts와 (작성자, 주)로 이미 기록한 행을 Sheets 호출 없이 바로 찾아 중복 기록을 막습니다.
+    주는 B열에 기록되는 금요일 날짜(YYYY-MM-DD)로 구분합니다.
+    시트가 직접 수정되어 색인과 어긋나면 rebuild()로 A:B열만 읽어 다시 맞춥니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS threads (
+                thread_ts TEXT PRIMARY KEY,
+                author_name TEXT NOT NULL,
+                week TEXT NOT NULL,
+                row_number INTEGER,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS weeks (
+                author_name TEXT NOT NULL,
+                week TEXT NOT NULL,
+                thread_ts TEXT,
+                row_number INTEGER,
+                PRIMARY KEY (author_name, week)
+            )
+        """)
+        self._conn.commit()
+
+    def find(self, thread_ts: Optional[str] = None, author_name: Optional[str] = None,
+             week: Optional[str] = None) -> Optional[IndexEntry]:
+        """thread_ts 또는 (작성자, 주)로 이미 기록한 보고서 찾기 (thread_ts 우선)"""
+        with self._lock:
+            if thread_ts:
+                row = self._conn.execute(
+                    "SELECT thread_ts, author_name, week, row_number FROM threads WHERE thread_ts = ?",
+                    (thread_ts,)
+                ).fetchone()
+                if row:
+                    return IndexEntry(*row)
+
+            if author_name and week:
+                row = self._conn.execute(
+                    "SELECT thread_ts, author_name, week, row_number FROM weeks WHERE author_name = ? AND week = ?",
+                    (author_name, week)
+                ).fetchone()
+                if row:
+                    return IndexEntry(*row)
+
+        return None
+
+    def record(self, thread_ts: Optional[str], author_name: str, week: str, row_number: Optional[int]):
+        """기록한 보고서 저장 (row_number None은 대기열 저장 상태, thread_ts가 없으면 작성자·주만 저장)
+
+        같은 스레드가 다른 작성자·주로 다시 기록되면 (보고서 수정) 이전 작성자·주 항목은 지웁니다.
+        """
+        with self._lock:
+            if thread_ts:
+                self._conn.execute("DELETE FROM weeks WHERE thread_ts = ?", (thread_ts,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO threads (thread_ts, author_name, week, row_number, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (thread_ts, author_name, week, row_number, time.time())
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO weeks (author_name, week, thread_ts, row_number) VALUES (?, ?, ?, ?)",
+                (author_name, week, thread_ts, row_number)
+            )
+            self._conn.commit()
+
+    def on_flushed(self, written: List[Tuple[Optional[str], int]]):
+        """WriteSpool 기록 완료 시 대기 중이던 보고서의 행 번호 채우기 (WriteSpool의 on_flushed로 사용)"""
+        with self._lock:
+            for thread_ts, row_number in written:
+                if thread_ts is None:
+                    continue
+                self._conn.execute("UPDATE threads SET row_number = ? WHERE thread_ts = ?", (row_number, thread_ts))
+                self._conn.execute("UPDATE weeks SET row_number = ? WHERE thread_ts = ?", (row_number, thread_ts))
+            self._conn.commit()
+
+    def rebuild(self, sheet_rows: Iterable[Tuple[int, str, str]]) -> Dict[str, int]:
+        """시트의 (행 번호, 작성자, 주) 목록으로 색인을 다시 맞추기
+
+        (작성자, 주) 색인은 시트 기준으로 새로 만들고 (같은 작성자·주가 여러 행이면 첫 행),
+        thread_ts 항목은 해당 행의 작성자·주가 그대로인 경우에만 남깁니다.
+        아직 대기열에 있는 항목(행 번호 없음)은 그대로 둡니다.
+        """
+        by_row = {}
+        by_week = {}
+        for row_number, author_name, week in sheet_rows:
+            by_row[row_number] = (author_name, week)
+            by_week.setdefault((author_name, week), row_number)
+
+        with self._lock:
+            threads = self._conn.execute(
+                "SELECT thread_ts, author_name, week, row_number FROM threads"
+            ).fetchall()
+            stale = {
+                thread_ts for thread_ts, author_name, week, row_number in threads
+                if row_number is not None and by_row.get(row_number) != (author_name, week)
+            }
+            thread_of_row = {
+                row_number: thread_ts for thread_ts, _, _, row_number in threads
+                if row_number is not None and thread_ts not in stale
+            }
+            pending = self._conn.execute(
+                "SELECT author_name, week, thread_ts FROM weeks WHERE row_number IS NULL"
+            ).fetchall()
+
+            self._conn.executemany("DELETE FROM threads WHERE thread_ts = ?", [(thread_ts,) for thread_ts in stale])
+            self._conn.execute("DELETE FROM weeks")
+            self._conn.executemany(
+                "INSERT INTO weeks (author_name, week, thread_ts, row_number) VALUES (?, ?, ?, ?)",
+                [(author_name, week, thread_of_row.get(row_number), row_number)
+                 for (author_name, week), row_number in by_week.items()]
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO weeks (author_name, week, thread_ts, row_number) VALUES (?, ?, ?, NULL)",
+                pending
+            )
+            self._conn.commit()
+
+        return {
+            'rows': len(by_row),
+            'weeks': len(by_week),
+            'threads_kept': len(threads) - len(stale),
+            'threads_dropped': len(stale)
+        }
+
+    def count(self) -> int:
+        """색인된 스레드 수"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM threads").fetchone()[0]
+
+    def close(self):
+        """SQLite 연결 닫기"""
+        with self._lock:
+            self._conn.close()
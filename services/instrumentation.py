@@ -0,0 +1,176 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+# Prometheus 지표 이름 접두사
+METRIC_PREFIX = 'weekly_report'
+
+def payload_size(result) -> int:
+    """API 응답 본문 크기(바이트) 추정 (SlackResponse는 data, gspread 값 목록은 JSON 기준)"""
+    data = getattr(result, 'data', result)
+    if isinstance(data, bytes):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode('utf-8'))
+    if isinstance(data, (dict, list)):
+        return len(json.dumps(data, ensure_ascii=False, default=str).encode('utf-8'))
+    return 0
+
+class Instrumentation:
+    """실행 단계별 소요 시간과 외부 API 호출 통계 수집기
+
+    - stage(name): 단계별 실행 횟수와 누적/최대 소요 시간
+    - record_call(...): API(버킷)·메서드별 호출/오류/재시도 수, 누적 시간, 받은 바이트 수
+    - add_hook(fn): 기록할 때마다 fn(kind, name, values) 호출 (상주/일괄 모드에서 보고서별 집계용)
+    - summary()/write_json()/write_prometheus(): 결과 출력
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hooks: List[Callable[[str, str, Dict], None]] = []
+        self.reset()
+
+    def reset(self):
+        """수집한 값 초기화"""
+        with self._lock:
+            self._started_at = time.time()
+            self._stages: Dict[str, Dict[str, float]] = {}
+            self._calls: Dict[tuple, Dict[str, float]] = {}
+
+    def add_hook(self, hook: Callable[[str, str, Dict], None]):
+        """기록 시 호출할 함수 등록 (kind는 'stage' 또는 'api_call')"""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[str, str, Dict], None]):
+        """등록한 함수 해제"""
+        if hook in self._hooks:
+            self._hooks.remove(hook)
+
+    @contextmanager
+    def stage(self, name: str):
+        """with 블록 실행 시간을 단계 이름으로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(name, time.perf_counter() - start)
+
+    def record_stage(self, name: str, seconds: float):
+        """단계 실행 시간 기록"""
+        with self._lock:
+            values = self._stages.setdefault(name, {'count': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+            values['count'] += 1
+            values['seconds'] += seconds
+            values['max_seconds'] = max(values['max_seconds'], seconds)
+        self._notify('stage', name, {'seconds': seconds})
+
+    def record_call(self, api: str, method: str, seconds: float = 0.0, bytes_received: int = 0,
+                    error: bool = False, retries: int = 0):
+        """외부 API 호출 한 건 기록 (api는 요청 한도 버킷 이름, 예: slack:tier3, sheets:read)"""
+        with self._lock:
+            values = self._calls.setdefault((api, method), {
+                'calls': 0, 'errors': 0, 'retries': 0, 'seconds': 0.0, 'bytes': 0
+            })
+            values['calls'] += 1
+            values['errors'] += int(error)
+            values['retries'] += retries
+            values['seconds'] += seconds
+            values['bytes'] += bytes_received
+        self._notify('api_call', f"{api}/{method}", {
+            'seconds': seconds, 'bytes': bytes_received, 'error': error, 'retries': retries
+        })
+
+    def summary(self) -> Dict:
+        """수집한 값 요약 (JSON 직렬화 가능)"""
+        with self._lock:
+            stages = {name: dict(values) for name, values in self._stages.items()}
+            calls = {f"{api}/{method}": dict(values, api=api, method=method)
+                     for (api, method), values in sorted(self._calls.items())}
+            started_at = self._started_at
+
+        return {
+            'started_at': started_at,
+            'elapsed_seconds': time.time() - started_at,
+            'stages': stages,
+            'api_calls': calls,
+            'totals': {
+                'calls': sum(values['calls'] for values in calls.values()),
+                'errors': sum(values['errors'] for values in calls.values()),
+                'retries': sum(values['retries'] for values in calls.values()),
+                'bytes': sum(values['bytes'] for values in calls.values()),
+            }
+        }
+
+    def write_json(self, path: str):
+        """요약을 JSON 파일로 저장"""
+        _write_atomic(path, json.dumps(self.summary(), ensure_ascii=False, indent=2))
+
+    def prometheus_text(self) -> str:
+        """Prometheus 텍스트 형식 (node_exporter textfile collector용)"""
+        summary = self.summary()
+        lines = []
+
+        def metric(name: str, help_text: str, samples: List[tuple]):
+            full_name = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} counter")
+            for labels, value in samples:
+                label_text = ','.join(f'{key}="{_escape_label(str(label))}"' for key, label in labels.items())
+                lines.append(f"{full_name}{{{label_text}}} {value}")
+
+        stages = sorted(summary['stages'].items())
+        metric('stage_runs_total', 'Number of times each stage ran.',
+               [({'stage': name}, values['count']) for name, values in stages])
+        metric('stage_seconds_total', 'Wall time spent in each stage.',
+               [({'stage': name}, round(values['seconds'], 6)) for name, values in stages])
+
+        calls = [({'api': values['api'], 'method': values['method']}, values) for values in summary['api_calls'].values()]
+        metric('api_calls_total', 'External API calls by bucket and method.',
+               [(labels, values['calls']) for labels, values in calls])
+        metric('api_errors_total', 'External API calls that failed.',
+               [(labels, values['errors']) for labels, values in calls])
+        metric('api_retries_total', 'Retried external API calls.',
+               [(labels, values['retries']) for labels, values in calls])
+        metric('api_seconds_total', 'Wall time spent in external API calls.',
+               [(labels, round(values['seconds'], 6)) for labels, values in calls])
+        metric('api_received_bytes_total', 'Approximate response payload bytes.',
+               [(labels, values['bytes']) for labels, values in calls])
+
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str):
+        """Prometheus 텍스트 파일로 저장"""
+        _write_atomic(path, self.prometheus_text())
+
+    def _notify(self, kind: str, name: str, values: Dict):
+        for hook in list(self._hooks):
+            try:
+                hook(kind, name, values)
+            except Exception as e:
+                print(f"⚠️ 계측 훅 실행 실패: {str(e)}")
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _write_atomic(path: str, text: str):
+    """임시 파일에 쓴 뒤 교체 (수집기가 쓰는 도중의 파일을 읽지 않도록)"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+_default_instrumentation: Optional[Instrumentation] = None
+_default_lock = threading.Lock()
+
+def get_instrumentation() -> Instrumentation:
+    """프로세스 전체에서 공유하는 기본 수집기"""
+    global _default_instrumentation
+    if _default_instrumentation is not None:
+        return _default_instrumentation
+    with _default_lock:
+        if _default_instrumentation is None:
+            _default_instrumentation = Instrumentation()
+        return _default_instrumentation
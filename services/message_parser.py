@@ -1,27 +1,54 @@
 import re
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Tuple
 from datetime import datetime, timedelta
+from services.instrumentation import get_instrumentation
+
+# 소요시간 섹션에서 인식하는 병원 이름 기본 목록 (WeeklyReportParser(hospitals=...)로 변경 가능)
+DEFAULT_HOSPITALS = ('온리프', '르샤인', '오블리브', '심플')
+
+# 미리 컴파일한 패턴 (호출마다 다시 컴파일하지 않음)
+YEAR_WEEK_PATTERN = re.compile(r'(\d{4})년\s*(\d+)월\s*(\d+)주차')
+PERIOD_PATTERN = re.compile(
+    r'기간\s*:\s*(\d{2})\.\s*(\d{1,2})\.\s*(\d{1,2})\s*~\s*(\d{2})\.\s*(\d{1,2})\.\s*(\d{1,2})'
+)
+TOTAL_PATTERN = re.compile(r'총합\s*:\s*([\d.]+)')
+TIME_SECTION_HEADER = '금주 완료 작업 소요시간 합계'
+
+def compile_hospital_pattern(hospitals: Iterable[str]):
+    """병원 이름 목록으로 `병원 : 시간` 패턴 생성 (긴 이름 우선, 줄바꿈은 넘지 않음)"""
+    names = sorted(set(hospitals), key=len, reverse=True)
+    return re.compile(r'(' + '|'.join(re.escape(name) for name in names) + r')[^\S\n]*:[^\S\n]*([\d.]+)')
+
+_DEFAULT_HOSPITAL_PATTERN = compile_hospital_pattern(DEFAULT_HOSPITALS)
 
 class WeeklyReportParser:
     """주간업무 현황 메시지 파싱 클래스"""
     
+    def __init__(self, hospitals: Optional[Iterable[str]] = None):
+        self.hospitals = tuple(hospitals) if hospitals else DEFAULT_HOSPITALS
+        if self.hospitals == DEFAULT_HOSPITALS:
+            self._hospital_pattern = _DEFAULT_HOSPITAL_PATTERN
+        else:
+            self._hospital_pattern = compile_hospital_pattern(self.hospitals)
+    
     def parse_message(self, message: str, author_name: str = "홍길동") -> Dict:
         """Slack 메시지를 파싱하여 필요한 데이터 추출"""
         
-        # 년도와 주차 추출
-        year_week = self._extract_year_week(message)
-        
-        # 해당 주 금요일 날짜 계산
-        friday_date = self._calculate_friday_date(message)
-        
-        # 완료 작업 소요시간 추출
-        time_data = self._extract_completion_times(message)
-        
-        # 비율 계산 (I~N열)
-        ratios = self._calculate_ratios(time_data)
-        
-        # O열 데이터 생성
-        o_column_data = self._generate_o_column_data(year_week, author_name, message)
+        with get_instrumentation().stage('parse'):
+            # 년도/주차, 기간, 완료 작업 소요시간을 한 번에 추출
+            year_week_groups, period_groups, time_data = self._scan_message(message)
+            
+            # 년도와 주차
+            year_week = self._format_year_week(year_week_groups)
+            
+            # 해당 주 금요일 날짜 계산
+            friday_date = self._friday_from_period(period_groups)
+            
+            # 비율 계산 (I~N열)
+            ratios = self._calculate_ratios(time_data)
+            
+            # O열 데이터 생성
+            o_column_data = self._generate_o_column_data(year_week, author_name, message)
         
         return {
             'author_name': author_name,
@@ -32,27 +59,115 @@ class WeeklyReportParser:
             'o_column_data': o_column_data
         }
     
+    def is_weekly_report(self, message: str) -> bool:
+        """주간업무 현황 메시지인지 확인 (년도/월/주차 헤더 존재 여부)"""
+        return bool(YEAR_WEEK_PATTERN.search(message or ''))
+    
+    def _scan_message(self, message: str) -> Tuple[Optional[tuple], Optional[tuple], Dict[str, float]]:
+        """년도/주차, 기간, 병원별 소요시간과 총합 추출
+        
+        헤더 패턴은 메시지 앞부분에서 첫 일치 지점까지만 읽고, 소요시간은 섹션 제목부터
+        첫 `총합` 줄까지만 한 번 훑습니다. (메시지 전체를 줄 단위로 나누지 않음)
+        """
+        match = YEAR_WEEK_PATTERN.search(message)
+        year_week_groups = match.groups() if match else None
+        
+        match = PERIOD_PATTERN.search(message)
+        period_groups = match.groups() if match else None
+        
+        header_index = message.find(TIME_SECTION_HEADER)
+        if header_index == -1:
+            return year_week_groups, period_groups, {}
+        
+        return year_week_groups, period_groups, self._scan_time_section(message, header_index)
+    
+    def _scan_time_section(self, message: str, header_index: int) -> Dict[str, float]:
+        """섹션 제목 다음 줄부터 첫 `총합` 줄까지 병원별 소요시간과 총합 추출"""
+        time_data = {}
+        body_start = message.find('\n', header_index) + 1
+        if body_start == 0:
+            return time_data
+        
+        # 섹션 끝(첫 `총합` 줄) 찾기
+        total_index = message.find('총합', body_start)
+        if total_index == -1:
+            body_end = total_line = None
+        else:
+            body_end = message.rfind('\n', 0, total_index) + 1
+            line_end = message.find('\n', total_index)
+            total_line = message[body_end:line_end if line_end != -1 else len(message)]
+        
+        body = message[body_start:body_end]
+        if TIME_SECTION_HEADER in body or (total_line and TIME_SECTION_HEADER in total_line):
+            # 섹션 제목이 반복되는 드문 경우는 줄 단위로 처리
+            return self._scan_time_section_lines(message, body_start)
+        
+        # 섹션 본문 전체에 패턴을 한 번 적용 (한 줄에서 병원별 첫 번째 값만 사용)
+        line_of_hospital = {}
+        for match in self._hospital_pattern.finditer(body):
+            hospital = match.group(1)
+            line_start = body.rfind('\n', 0, match.start())
+            if line_of_hospital.get(hospital) == line_start:
+                continue
+            line_of_hospital[hospital] = line_start
+            time_data[hospital] = float(match.group(2))
+        
+        if total_line is not None:
+            total_match = TOTAL_PATTERN.search(total_line)
+            if total_match:
+                time_data['총합'] = float(total_match.group(1))
+        
+        return time_data
+    
+    def _scan_time_section_lines(self, message: str, body_start: int) -> Dict[str, float]:
+        """줄 단위로 소요시간 섹션 처리 (섹션 제목 줄은 건너뜀)"""
+        time_data = {}
+        for line in message[body_start:].split('\n'):
+            if TIME_SECTION_HEADER in line:
+                continue
+            
+            if '총합' in line:
+                # 총합 추출 후 섹션 종료
+                total_match = TOTAL_PATTERN.search(line)
+                if total_match:
+                    time_data['총합'] = float(total_match.group(1))
+                break
+            
+            seen = set()
+            for match in self._hospital_pattern.finditer(line):
+                hospital = match.group(1)
+                if hospital not in seen:
+                    seen.add(hospital)
+                    time_data[hospital] = float(match.group(2))
+        
+        return time_data
+    
     def _extract_year_week(self, message: str) -> str:
         """년도와 주차 추출"""
-        pattern = r'(\d{4})년\s*(\d+)월\s*(\d+)주차'
-        match = re.search(pattern, message)
-        if match:
-            year, month, week = match.groups()
-            return f"{year} {month}월 {week}주차"
-        return "2025 9월 1주차"  # 기본값
+        return self._format_year_week(self._scan_message(message)[0])
     
     def _calculate_friday_date(self, message: str) -> str:
         """해당 주의 금요일 날짜 계산"""
-        # 기간 정보에서 날짜 추출
-        period_pattern = r'기간\s*:\s*(\d{2})\.\s*(\d{1,2})\.\s*(\d{1,2})\s*~\s*(\d{2})\.\s*(\d{1,2})\.\s*(\d{1,2})'
-        match = re.search(period_pattern, message)
-        
-        if match:
-            start_year, start_month, start_day, end_year, end_month, end_day = match.groups()
+        return self._friday_from_period(self._scan_message(message)[1])
+    
+    def _extract_completion_times(self, message: str) -> Dict[str, float]:
+        """완료 작업 소요시간 추출"""
+        return self._scan_message(message)[2]
+    
+    def _format_year_week(self, groups: Optional[tuple]) -> str:
+        """년도/월/주차 문자열 생성"""
+        if groups:
+            year, month, week = groups
+            return f"{year} {month}월 {week}주차"
+        return "2025 9월 1주차"  # 기본값
+    
+    def _friday_from_period(self, groups: Optional[tuple]) -> str:
+        """기간 시작일 기준 해당 주의 금요일 날짜 계산"""
+        if groups:
+            start_year, start_month, start_day, end_year, end_month, end_day = groups
             
             # 20XX 형태로 년도 변환
             start_year = f"20{start_year}"
-            end_year = f"20{end_year}"
             
             try:
                 # 시작일로부터 해당 주의 금요일 찾기
@@ -77,36 +192,6 @@ class WeeklyReportParser:
         friday = today + timedelta(days=days_to_friday)
         return friday.strftime('%Y-%m-%d')
     
-    def _extract_completion_times(self, message: str) -> Dict[str, float]:
-        """완료 작업 소요시간 추출"""
-        time_data = {}
-        
-        # "금주 완료 작업 소요시간 합계(시간)" 섹션 찾기
-        lines = message.split('\n')
-        in_time_section = False
-        
-        for line in lines:
-            if '금주 완료 작업 소요시간 합계' in line:
-                in_time_section = True
-                continue
-            
-            if in_time_section:
-                if '총합' in line:
-                    # 총합 추출
-                    total_match = re.search(r'총합\s*:\s*([\d.]+)', line)
-                    if total_match:
-                        time_data['총합'] = float(total_match.group(1))
-                    break
-                
-                # 각 병원별 시간 추출
-                for hospital in ['온리프', '르샤인', '오블리브', '심플']:
-                    if hospital in line:
-                        time_match = re.search(rf'{hospital}\s*:\s*([\d.]+)', line)
-                        if time_match:
-                            time_data[hospital] = float(time_match.group(1))
-        
-        return time_data
-    
     def _calculate_ratios(self, time_data: Dict[str, float]) -> Dict[str, str]:
         """비율 계산 (온리프+심플치과 합쳐서 계산)"""
         ratios = {}
@@ -0,0 +1,258 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from models.spreadsheet_row import SpreadsheetRow
+from services.batch_processor import BatchProcessor, BatchResult, ThreadRef
+
+# 단계 사이 큐에 넣는 종료 표시
+_DONE = object()
+
+@dataclass
+class PipelineStage:
+    """파이프라인 단계 (fn은 이전 단계 값을 받아 다음 단계 값을 반환, BatchResult를 반환하면 바로 완료)"""
+
+    name: str
+    fn: Callable[["_Item"], Any]
+    workers: int = 1
+
+class _Item:
+    """파이프라인을 흐르는 보고서 하나"""
+
+    __slots__ = ('index', 'ref', 'value', 'result')
+
+    def __init__(self, index: int, ref: ThreadRef):
+        self.index = index
+        self.ref = ref
+        self.value: Any = None
+        self.result: Optional[BatchResult] = None
+
+class ReportPipeline:
+    """Slack 가져오기 → 파싱 → 행 생성 → 묶음 기록 단계를 크기 제한 큐로 연결한 스트리밍 처리기
+
+    - 단계마다 워커 스레드 수를 지정할 수 있고, 큐가 가득 차면 앞 단계가 기다립니다 (backpressure).
+    - 다음 보고서를 가져오는 동안 앞선 보고서의 파싱과 기록이 함께 진행됩니다.
+    - 기록 단계는 write_batch개가 모이거나 write_interval초가 지나면 BatchProcessor.write_built로 한 번에 기록합니다.
+    - 보고서별 오류는 해당 보고서의 실패 결과(BatchResult)로만 처리하고 나머지는 계속 진행합니다.
+    """
+
+    def __init__(self, processor: BatchProcessor, fetch_workers: int = 4, parse_workers: int = 1,
+                 build_workers: int = 1, queue_size: int = 64, write_batch: int = 50,
+                 write_interval: float = 1.0):
+        self.processor = processor
+        self.queue_size = queue_size
+        self.write_batch = write_batch
+        self.write_interval = write_interval
+        self.stages = [
+            PipelineStage('fetch', self._fetch, fetch_workers),
+            PipelineStage('parse', self._parse, parse_workers),
+            PipelineStage('build', self._build, build_workers),
+        ]
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def run(self, refs: Iterable[ThreadRef]) -> List[BatchResult]:
+        """모든 보고서를 처리하고 입력 순서대로 결과 반환"""
+        items = sorted(self._iter_items(refs), key=lambda item: item.index)
+        return [item.result for item in items]
+
+    def iter_results(self, refs: Iterable[ThreadRef]) -> Iterator[BatchResult]:
+        """처리가 끝나는 순서대로 결과 반환 (refs는 제너레이터여도 됨)"""
+        for item in self._iter_items(refs):
+            yield item.result
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """단계별 처리 건수, 실패 건수, 작업 시간(초), 큐 최대 길이 (기록 단계는 묶음 수 포함)"""
+        with self._lock:
+            return {name: dict(values) for name, values in self._stats.items()}
+
+    def _iter_items(self, refs: Iterable[ThreadRef]) -> Iterator[_Item]:
+        self._stats = {stage.name: {'processed': 0, 'failed': 0, 'busy_seconds': 0.0, 'max_queue': 0}
+                       for stage in self.stages}
+        self._stats['write'] = {'processed': 0, 'failed': 0, 'busy_seconds': 0.0, 'max_queue': 0, 'batches': 0}
+
+        stopping = threading.Event()
+        feed_error: List[BaseException] = []
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        results: queue.Queue = queue.Queue()
+
+        threads = [threading.Thread(target=self._feed, args=(refs, queues[0], results, stopping, feed_error),
+                                    name='pipeline-feed', daemon=True)]
+        for position, stage in enumerate(self.stages):
+            remaining = [stage.workers]
+            next_workers = self.stages[position + 1].workers if position + 1 < len(self.stages) else 1
+            for number in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[position], queues[position + 1], results, stopping, remaining, next_workers),
+                    name=f"pipeline-{stage.name}-{number}", daemon=True
+                ))
+        threads.append(threading.Thread(target=self._write, args=(queues[-1], results, stopping),
+                                        name='pipeline-write', daemon=True))
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            # 소비자가 중간에 멈춘 경우에도 워커들이 큐에서 빠져나오도록 함
+            stopping.set()
+
+        for thread in threads:
+            thread.join()
+        if feed_error:
+            raise feed_error[0]
+
+    def _feed(self, refs: Iterable[ThreadRef], out: queue.Queue, results: queue.Queue,
+              stopping: threading.Event, feed_error: List[BaseException]):
+        """입력 보고서를 첫 단계 큐에 넣기 (색인상 이미 기록된 보고서는 바로 완료)"""
+        try:
+            for index, ref in enumerate(refs):
+                item = _Item(index, ref)
+                skipped = self.processor.skip_known(ref)
+                if skipped:
+                    item.result = skipped
+                    results.put(item)
+                elif not _put(out, item, stopping):
+                    return
+        except Exception as e:
+            # 채널 기록 조회 실패 등 입력 자체의 오류는 처리 중인 보고서를 마친 뒤 호출한 쪽으로 전달
+            feed_error.append(e)
+        finally:
+            for _ in range(self.stages[0].workers):
+                _put(out, _DONE, stopping)
+
+    def _work(self, stage: PipelineStage, inbox: queue.Queue, out: queue.Queue, results: queue.Queue,
+              stopping: threading.Event, remaining: List[int], next_workers: int):
+        """단계 워커: 값을 변환해 다음 큐로 넘기고, 실패한 보고서는 결과로 바로 보냄"""
+        while True:
+            item = _get(inbox, stopping)
+            if item is None:
+                return
+            if item is _DONE:
+                with self._lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last:
+                    for _ in range(next_workers):
+                        _put(out, _DONE, stopping)
+                return
+
+            start = time.perf_counter()
+            try:
+                value = stage.fn(item)
+            except Exception as e:
+                item.result = BatchResult(ref=item.ref, success=False, error=str(e))
+                value = item.result
+            self._record(stage.name, start, failed=item.result is not None and not item.result.success,
+                         depth=inbox.qsize())
+
+            if isinstance(value, BatchResult):
+                item.result = value
+                results.put(item)
+            else:
+                item.value = value
+                if not _put(out, item, stopping):
+                    return
+
+    def _write(self, inbox: queue.Queue, results: queue.Queue, stopping: threading.Event):
+        """기록 단계: 만든 행을 모아서 한 번에 기록"""
+        seen = set()  # 실행 전체에서 처리한 thread_ts와 (작성자, 금요일 날짜)
+        batch: List[_Item] = []
+        deadline = None
+        try:
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = inbox.get(timeout=0.1 if timeout is None else min(timeout, 0.1))
+                except queue.Empty:
+                    if stopping.is_set():
+                        return
+                    if deadline is not None and time.monotonic() >= deadline:
+                        self._flush(batch, seen, results, inbox.qsize())
+                        batch, deadline = [], None
+                    continue
+
+                if item is _DONE:
+                    self._flush(batch, seen, results, inbox.qsize())
+                    return
+
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.write_interval
+                if len(batch) >= self.write_batch:
+                    self._flush(batch, seen, results, inbox.qsize())
+                    batch, deadline = [], None
+        finally:
+            results.put(_DONE)
+
+    def _flush(self, batch: List[_Item], seen: set, results: queue.Queue, depth: int):
+        if not batch:
+            return
+        start = time.perf_counter()
+        built = [(item.result, item.value) for item in batch]
+        try:
+            self.processor.write_built(built, seen)
+        except Exception as e:
+            for item in batch:
+                item.result.success = False
+                item.result.error = str(e)
+
+        with self._lock:
+            self._stats['write']['batches'] += 1
+        for item in batch:
+            self._record('write', start, failed=not item.result.success, depth=depth, busy=False)
+            results.put(item)
+        self._record_busy('write', start)
+
+    def _fetch(self, item: _Item):
+        return self.processor.fetch_report(item.ref)
+
+    def _parse(self, item: _Item):
+        message_content, author_name = item.value
+        return self.processor.parser.parse_message(message_content, author_name)
+
+    def _build(self, item: _Item):
+        parsed_data = item.value
+        # 기록 단계에서 행 번호와 중복 여부를 채움
+        item.result = BatchResult(ref=item.ref, success=True, author_name=parsed_data['author_name'],
+                                  parsed_data=parsed_data)
+        return SpreadsheetRow.from_parsed_data(parsed_data)
+
+    def _record(self, name: str, start: float, failed: bool, depth: int, busy: bool = True):
+        with self._lock:
+            values = self._stats[name]
+            values['processed'] += 1
+            values['failed'] += int(failed)
+            values['max_queue'] = max(values['max_queue'], depth)
+            if busy:
+                values['busy_seconds'] += time.perf_counter() - start
+
+    def _record_busy(self, name: str, start: float):
+        with self._lock:
+            self._stats[name]['busy_seconds'] += time.perf_counter() - start
+
+def _put(out: queue.Queue, item, stopping: threading.Event) -> bool:
+    """큐가 빌 때까지 기다려 넣기 (중단 시 False)"""
+    while not stopping.is_set():
+        try:
+            out.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _get(inbox: queue.Queue, stopping: threading.Event):
+    """큐에서 꺼내기 (중단 시 None)"""
+    while not stopping.is_set():
+        try:
+            return inbox.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return None
@@ -0,0 +1,277 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+from services.circuit_breaker import CircuitBreaker
+from services.instrumentation import Instrumentation, get_instrumentation, payload_size
+
+# Slack Web API 메서드별 요청 한도 등급
+SLACK_METHOD_BUCKETS = {
+    'users_list': 'slack:tier2',
+    'conversations_history': 'slack:tier3',
+    'conversations_replies': 'slack:tier3',
+    'users_info': 'slack:tier4',
+    'chat_postMessage': 'slack:post',
+}
+
+# 버킷별 분당 요청 수 기본값 (Slack 등급 한도, Sheets 사용자당 분당 한도)
+DEFAULT_LIMITS = {
+    'slack:tier2': 20,
+    'slack:tier3': 50,
+    'slack:tier4': 100,
+    'slack:post': 60,
+    'sheets:read': 60,
+    'sheets:write': 60,
+}
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 5xx 응답이어도 이미 처리됐을 수 있어 다시 보내면 안 되는 버킷 (메시지 전송 - 중복 게시 방지, 429만 재시도)
+NON_IDEMPOTENT_BUCKETS = {'slack:post'}
+
+def slack_bucket(method: str) -> str:
+    """Slack 메서드 이름에 해당하는 버킷 이름"""
+    return SLACK_METHOD_BUCKETS.get(method, 'slack:tier3')
+
+class TokenBucket:
+    """분당 요청 수 제한 버킷 (GCRA 방식으로 대기 시간을 예약)"""
+
+    def __init__(self, rate_per_minute: float, burst: Optional[int] = None):
+        self.interval = 60.0 / rate_per_minute
+        self.burst = burst or max(1, int(rate_per_minute // 6))  # 기본: 10초 분량까지 몰아서 허용
+        self._tolerance = self.interval * (self.burst - 1)
+        self._tat = 0.0              # 다음 요청의 이론적 도착 시각
+        self._blocked_until = 0.0    # Retry-After로 막힌 시각
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """요청 한 건을 예약하고 기다려야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            tat = max(self._tat, now)
+            allowed_at = max(tat - self._tolerance, self._blocked_until)
+            self._tat = max(tat, allowed_at) + self.interval
+            return max(0.0, allowed_at - now)
+
+    def block_for(self, seconds: float):
+        """Retry-After 등으로 일정 시간 동안 모든 요청 중단"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+class RateLimitScheduler:
+    """Slack/Sheets 외부 호출 공용 스케줄러
+
+    - 버킷(API + 등급)별 토큰 버킷으로 호출 속도를 한도 안으로 맞춥니다. (limits에 없는 버킷은 제한 없음)
+    - 429/5xx 응답은 Retry-After를 따르거나 지터를 준 지수 백오프로 재시도합니다.
+      (NON_IDEMPOTENT_BUCKETS의 호출은 처리되지 않은 것이 확실한 429만 재시도)
+    - stats()로 버킷별 대기 중인 호출 수, 누적 대기 시간, 재시도 횟수를 확인할 수 있습니다.
+    - 모든 호출은 메서드별 소요 시간과 응답 크기와 함께 Instrumentation에 기록됩니다.
+    - breakers(백엔드 이름 → CircuitBreaker)를 주면 버킷 이름 앞부분(slack, sheets)의 차단기를 거칩니다.
+      5xx/429/연결 오류가 이어져 차단기가 열리면 재시도와 대기 없이 바로 CircuitOpenError를 냅니다.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, float]] = None, max_retries: int = 5,
+                 base_delay: float = 1.0, max_delay: float = 60.0,
+                 instrumentation: Optional[Instrumentation] = None,
+                 breakers: Optional[Dict[str, CircuitBreaker]] = None):
+        limits = DEFAULT_LIMITS if limits is None else limits
+        self.buckets = {name: TokenBucket(rate) for name, rate in limits.items()}
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.instrumentation = instrumentation or get_instrumentation()
+        self.breakers = breakers or {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def call(self, bucket_name: str, fn: Callable, *args, **kwargs):
+        """한도 안에서 fn 호출 (재시도 가능한 오류는 재시도)"""
+        breaker = self._breaker(bucket_name)
+        attempt = 0
+        while True:
+            probe = breaker.allow() if breaker else False
+            try:
+                self._wait_sync(bucket_name)
+                start = time.perf_counter()
+                try:
+                    result = fn(*args, **kwargs)
+                    self._record(bucket_name, 'calls')
+                    self._instrument(bucket_name, fn, start, attempt, result=result)
+                    if breaker:
+                        breaker.record_success()
+                    probe = False
+                    return result
+                except Exception as e:
+                    self._record_outcome(breaker, e)
+                    probe = False
+                    delay = self._retry_delay(bucket_name, e, attempt)
+                    if delay is None:
+                        self._instrument(bucket_name, fn, start, attempt, error=True)
+                        raise
+            finally:
+                if probe:
+                    # 결과를 기록하기 전에 끝난 시험 호출이 차단기를 반쯤 열린 채로 막지 않도록
+                    breaker.release_probe()
+            attempt += 1
+            self._record(bucket_name, 'retries')
+            self._record(bucket_name, 'throttle_seconds', delay)
+            time.sleep(delay)
+
+    async def call_async(self, bucket_name: str, fn: Callable, *args, **kwargs):
+        """call의 asyncio 버전 (fn은 코루틴 함수)"""
+        breaker = self._breaker(bucket_name)
+        attempt = 0
+        while True:
+            probe = breaker.allow() if breaker else False
+            try:
+                wait = self._reserve(bucket_name)
+                if wait:
+                    self._record(bucket_name, 'queue_depth', 1)
+                    try:
+                        await asyncio.sleep(wait)
+                    finally:
+                        self._record(bucket_name, 'queue_depth', -1)
+                start = time.perf_counter()
+                try:
+                    result = await fn(*args, **kwargs)
+                    self._record(bucket_name, 'calls')
+                    self._instrument(bucket_name, fn, start, attempt, result=result)
+                    if breaker:
+                        breaker.record_success()
+                    probe = False
+                    return result
+                except Exception as e:
+                    self._record_outcome(breaker, e)
+                    probe = False
+                    delay = self._retry_delay(bucket_name, e, attempt)
+                    if delay is None:
+                        self._instrument(bucket_name, fn, start, attempt, error=True)
+                        raise
+            finally:
+                if probe:
+                    # 취소 등으로 결과를 기록하기 전에 끝난 시험 호출 정리
+                    breaker.release_probe()
+            attempt += 1
+            self._record(bucket_name, 'retries')
+            self._record(bucket_name, 'throttle_seconds', delay)
+            await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """버킷별 호출 수, 재시도 수, 누적 대기 시간(초), 현재 대기 중인 호출 수"""
+        with self._lock:
+            return {name: dict(values) for name, values in self._stats.items()}
+
+    def breaker_stats(self) -> Dict[str, Dict]:
+        """백엔드별 차단기 상태 (차단기를 쓰지 않으면 빈 딕셔너리)"""
+        return {name: breaker.stats() for name, breaker in self.breakers.items()}
+
+    def _breaker(self, bucket_name: str) -> Optional[CircuitBreaker]:
+        return self.breakers.get(bucket_name.split(':', 1)[0])
+
+    def _record_outcome(self, breaker: Optional[CircuitBreaker], error: Exception):
+        """실패한 시도를 차단기에 반영 (백엔드가 응답한 4xx 등은 정상 동작으로 봄)"""
+        if breaker:
+            if is_backend_failure(error):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+    def _instrument(self, bucket_name: str, fn: Callable, start: float, retries: int,
+                    result=None, error: bool = False):
+        """호출 한 건(재시도 포함)의 마지막 시도 시간과 응답 크기 기록"""
+        self.instrumentation.record_call(
+            bucket_name,
+            getattr(fn, '__name__', type(fn).__name__),
+            seconds=time.perf_counter() - start,
+            bytes_received=0 if error else payload_size(result),
+            error=error,
+            retries=retries
+        )
+
+    def _wait_sync(self, bucket_name: str):
+        wait = self._reserve(bucket_name)
+        if wait:
+            self._record(bucket_name, 'queue_depth', 1)
+            try:
+                time.sleep(wait)
+            finally:
+                self._record(bucket_name, 'queue_depth', -1)
+
+    def _reserve(self, bucket_name: str) -> float:
+        bucket = self.buckets.get(bucket_name)
+        if bucket is None:
+            return 0.0
+        wait = bucket.reserve()
+        if wait:
+            self._record(bucket_name, 'throttle_seconds', wait)
+        return wait
+
+    def _retry_delay(self, bucket_name: str, error: Exception, attempt: int) -> Optional[float]:
+        """재시도할 오류면 대기 시간(초), 아니면 None"""
+        response = getattr(error, 'response', None)
+        status_code = getattr(response, 'status_code', None)
+        if status_code not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+            return None
+        if status_code != 429 and bucket_name in NON_IDEMPOTENT_BUCKETS:
+            return None
+
+        retry_after = _retry_after_seconds(response)
+        if retry_after is not None:
+            delay = retry_after
+            # 같은 버킷을 쓰는 다른 호출도 함께 멈춤
+            bucket = self.buckets.get(bucket_name)
+            if bucket:
+                bucket.block_for(delay)
+        else:
+            delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+            delay *= 0.5 + random.random() / 2  # 지터
+        return delay
+
+    def _record(self, bucket_name: str, key: str, amount: float = 1):
+        with self._lock:
+            values = self._stats.setdefault(
+                bucket_name, {'calls': 0, 'retries': 0, 'throttle_seconds': 0.0, 'queue_depth': 0}
+            )
+            values[key] += amount
+
+def is_backend_failure(error: Exception) -> bool:
+    """백엔드 장애로 볼 오류인지 (재시도 대상 상태 코드, 또는 응답 없는 연결·타임아웃 오류)"""
+    response = getattr(error, 'response', None)
+    status_code = getattr(response, 'status_code', None)
+    if status_code is not None:
+        return status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (OSError, TimeoutError))
+
+def _retry_after_seconds(response) -> Optional[float]:
+    """응답 헤더의 Retry-After 값(초)"""
+    headers = getattr(response, 'headers', None) or {}
+    for name, value in headers.items():
+        if name.lower() == 'retry-after':
+            if isinstance(value, list):
+                value = value[0] if value else None
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+_default_scheduler: Optional[RateLimitScheduler] = None
+_default_lock = threading.Lock()
+
+def get_scheduler() -> RateLimitScheduler:
+    """프로세스 전체에서 공유하는 기본 스케줄러"""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = RateLimitScheduler()
+        return _default_scheduler
+
+def configure_scheduler(limits: Optional[Dict[str, float]] = None, **kwargs) -> RateLimitScheduler:
+    """기본 스케줄러를 지정한 한도로 다시 만들기 (기본 한도에 덮어쓰기)"""
+    global _default_scheduler
+    merged = dict(DEFAULT_LIMITS)
+    merged.update(limits or {})
+    with _default_lock:
+        _default_scheduler = RateLimitScheduler(merged, **kwargs)
+        return _default_scheduler
@@ -0,0 +1,300 @@
+import hashlib
+import json
+import os
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from services.ratio_rollup import HOUR_COLUMNS, RATIO_KEYS, RatioBatch
+
+# 시트 비율 열 (SheetSnapshot 열 이름, RATIO_KEYS와 같은 순서)
+SHEET_RATIO_COLUMNS = ('onleaf_simple_ratio', 'leshine_ratio', 'oblible_ratio')
+
+# 1970-01-01은 목요일이므로 (일수 - 1) % 7 == 0 이면 금요일
+_FRIDAY_OFFSET = 1
+_WEEK = np.timedelta64(7, 'D')
+
+def parse_ratio_strings(values: Sequence[str]) -> np.ndarray:
+    """'12.34%' 형식 문자열 배열을 실수(%) 배열로 변환 (빈 칸이나 잘못된 값은 NaN)"""
+    values = np.asarray(values, dtype=str)
+    stripped = np.char.strip(np.char.rstrip(np.char.strip(values), '%'))
+    try:
+        return np.where(stripped == '', 'nan', stripped).astype(float)
+    except ValueError:
+        # 잘못된 값이 섞여 있으면 값마다 변환
+        return np.array([_to_float(value) for value in stripped], dtype=float)
+
+def _to_float(value: str) -> float:
+    try:
+        return float(value) if value else np.nan
+    except ValueError:
+        return np.nan
+
+class HistoryCache:
+    """질의 결과 파일 캐시 (데이터 지문이 바뀌면 모두 버림)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.fingerprint = None
+        self.results: Dict[str, object] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+                self.fingerprint = data.get('fingerprint')
+                self.results = data.get('results', {})
+            except (OSError, ValueError):
+                pass
+
+    def get(self, fingerprint: str, key: str):
+        if fingerprint != self.fingerprint:
+            return None
+        return self.results.get(key)
+
+    def put(self, fingerprint: str, key: str, result):
+        if fingerprint != self.fingerprint:
+            self.fingerprint = fingerprint
+            self.results = {}
+        self.results[key] = result
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': self.fingerprint, 'results': self.results}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+class RatioHistory:
+    """작성자·주별 비율/시간 기록을 숫자 배열로 올려 두고 기간·그룹 집계를 메모리에서 처리하는 질의 API
+
+    - 시트(SheetSnapshot)에서 불러오면 비율만, 파싱 결과(parse_message)에서 불러오면 병원별 시간도 있습니다.
+      시간이 없는 행의 시간은 NaN이며 합계에서 제외합니다.
+    - 행은 (작성자, 금요일 날짜) 순으로 정렬해 두고 작성자별 범위를 색인하므로, 작성자·기간 조회는 이진 탐색입니다.
+    - 질의 결과는 데이터 지문(fingerprint)별로 캐시하며, cache(HistoryCache)를 주면 실행 간에도 재사용합니다.
+
+    Example:
+        history = RatioHistory.from_snapshot(snapshot)
+        history.aggregate(('author', 'month'), since='2025-01-01')
+        history.missing_weeks(until='2025-09-30')
+    """
+
+    def __init__(self, authors: Sequence[str], friday_dates: Sequence[str], ratios: np.ndarray,
+                 hours: Optional[np.ndarray] = None, totals: Optional[np.ndarray] = None,
+                 cache: Optional[HistoryCache] = None):
+        authors = np.asarray(authors, dtype=str)
+        dates = _parse_dates(friday_dates)
+        ratios = np.asarray(ratios, dtype=float).reshape(-1, len(RATIO_KEYS))
+        if hours is None:
+            hours = np.full((len(authors), len(HOUR_COLUMNS)), np.nan)
+            totals = np.full(len(authors), np.nan)
+
+        # 작성자가 없거나 날짜를 알 수 없는 행은 제외하고 (작성자, 날짜) 순으로 정렬
+        valid = (np.char.strip(authors) != '') & ~np.isnat(dates)
+        order = np.flatnonzero(valid)[np.lexsort((dates[valid], authors[valid]))]
+        self.authors = authors[order]
+        self.dates = dates[order]
+        self.ratios = ratios[order]
+        self.hours = np.asarray(hours, dtype=float).reshape(-1, len(HOUR_COLUMNS))[order]
+        self.totals = np.asarray(totals, dtype=float)[order]
+        self.cache = cache
+
+        names, starts = np.unique(self.authors, return_index=True)
+        ends = np.append(starts[1:], len(self.authors))
+        self._author_ranges: Dict[str, Tuple[int, int]] = {
+            str(name): (int(start), int(end)) for name, start, end in zip(names, starts, ends)
+        }
+        self.fingerprint = self._fingerprint()
+        self._results: Dict[str, object] = {}
+
+    @classmethod
+    def from_snapshot(cls, snapshot, cache: Optional[HistoryCache] = None) -> 'RatioHistory':
+        """시트 스냅샷(SheetSnapshot)의 작성자, 금요일 날짜, I/L/N열 비율로 생성"""
+        columns = snapshot.columns
+        ratios = np.column_stack([parse_ratio_strings(columns[name]) for name in SHEET_RATIO_COLUMNS]) \
+            if len(snapshot) else np.zeros((0, len(RATIO_KEYS)))
+        return cls(columns['author_name'], columns['friday_date'], ratios, cache=cache)
+
+    @classmethod
+    def from_parsed(cls, parsed_reports: Iterable[Dict], cache: Optional[HistoryCache] = None) -> 'RatioHistory':
+        """parse_message 결과로 생성 (병원별 시간 포함, 비율은 RatioBatch로 계산)"""
+        batch = RatioBatch.from_parsed(parsed_reports)
+        return cls(batch.authors, batch.friday_dates, batch.ratios, batch.hours, batch.totals, cache=cache)
+
+    def __len__(self) -> int:
+        return len(self.authors)
+
+    def author_names(self) -> List[str]:
+        """작성자 목록 (이름순)"""
+        return list(self._author_ranges)
+
+    def select(self, author_name: Optional[str] = None, since: Optional[str] = None,
+               until: Optional[str] = None) -> np.ndarray:
+        """조건에 맞는 행 위치 (since/until은 금요일 날짜 YYYY-MM-DD, 양끝 포함)"""
+        if author_name is not None:
+            start, end = self._author_ranges.get(author_name, (0, 0))
+            dates = self.dates[start:end]
+            low = np.searchsorted(dates, np.datetime64(since, 'D'), 'left') if since else 0
+            high = np.searchsorted(dates, np.datetime64(until, 'D'), 'right') if until else len(dates)
+            return np.arange(start + low, start + high)
+
+        mask = np.ones(len(self), dtype=bool)
+        if since:
+            mask &= self.dates >= np.datetime64(since, 'D')
+        if until:
+            mask &= self.dates <= np.datetime64(until, 'D')
+        return np.flatnonzero(mask)
+
+    def aggregate(self, by: Sequence[str] = ('author',), since: Optional[str] = None, until: Optional[str] = None,
+                  authors: Optional[Sequence[str]] = None) -> List[Dict]:
+        """기준별 보고서 수, 평균 비율, 시간 합계
+
+        Args:
+            by: 'author', 'week', 'month' 중 0개 이상 (없으면 전체 한 그룹)
+            authors: 지정 시 해당 작성자만
+
+        Returns:
+            그룹마다 {기준: 값, 'reports', RATIO_KEYS(평균 %), 'total_hours', HOUR_COLUMNS(시간 합계)}
+            시간을 모르는 그룹의 시간 값은 None
+        """
+        by = tuple(by)
+        key = json.dumps(['aggregate', by, since, until, sorted(authors) if authors else None], ensure_ascii=False)
+        return self._cached(key, lambda: self._aggregate(by, since, until, authors))
+
+    def missing_weeks(self, since: Optional[str] = None, until: Optional[str] = None,
+                      authors: Optional[Sequence[str]] = None) -> Dict[str, List[str]]:
+        """작성자별로 보고서가 없는 주(금요일 날짜) 목록
+
+        기간은 since(없으면 작성자의 첫 보고서)부터 until(없으면 전체 마지막 보고서 주)까지이며,
+        작성자의 첫 보고서 이전 주는 빠진 것으로 보지 않습니다.
+        """
+        key = json.dumps(['missing_weeks', since, until, sorted(authors) if authors else None], ensure_ascii=False)
+        return self._cached(key, lambda: self._missing_weeks(since, until, authors))
+
+    def _aggregate(self, by: Tuple[str, ...], since: Optional[str], until: Optional[str],
+                   authors: Optional[Sequence[str]]) -> List[Dict]:
+        positions = self._positions(since, until, authors)
+        if len(positions) == 0:
+            return []
+
+        batch = RatioBatch(self.authors[positions], self.dates[positions].astype(str),
+                           np.nan_to_num(self.hours[positions]), np.nan_to_num(self.totals[positions]))
+        combined = np.zeros(len(positions), dtype=np.int64)
+        groupings = [batch.group_codes(name) for name in by]
+        for values, codes in groupings:
+            combined = combined * len(values) + codes
+        _, first_index, inverse = np.unique(combined, return_index=True, return_inverse=True)
+        group_count = len(first_index)
+
+        counts = np.bincount(inverse, minlength=group_count)
+        ratio_means = _group_nanmean(self.ratios[positions], inverse, group_count)
+        known = ~np.isnan(self.totals[positions])
+        known_counts = np.bincount(inverse, weights=known, minlength=group_count)
+        hour_sums = np.column_stack([
+            np.bincount(inverse, weights=np.nan_to_num(self.hours[positions, column]), minlength=group_count)
+            for column in range(len(HOUR_COLUMNS))
+        ])
+        total_sums = np.bincount(inverse, weights=np.nan_to_num(self.totals[positions]), minlength=group_count)
+
+        columns = [values[codes[first_index]] for values, codes in groupings]
+        rows = []
+        for index in range(group_count):
+            row = {name: str(column[index]) for name, column in zip(by, columns)}
+            row['reports'] = int(counts[index])
+            row.update({name: _round(ratio_means[index, column]) for column, name in enumerate(RATIO_KEYS)})
+            has_hours = known_counts[index] > 0
+            row['total_hours'] = float(total_sums[index]) if has_hours else None
+            row.update({name: float(hour_sums[index, column]) if has_hours else None
+                        for column, name in enumerate(HOUR_COLUMNS)})
+            rows.append(row)
+        return rows
+
+    def _missing_weeks(self, since: Optional[str], until: Optional[str],
+                       authors: Optional[Sequence[str]]) -> Dict[str, List[str]]:
+        if len(self) == 0:
+            return {}
+        last = np.datetime64(until, 'D') if until else self.dates.max()
+        missing = {}
+        for author_name in (authors or self.author_names()):
+            start, end = self._author_ranges.get(author_name, (0, 0))
+            dates = self.dates[start:end]
+            if len(dates) == 0:
+                continue
+            first = max(np.datetime64(since, 'D'), dates[0]) if since else dates[0]
+            expected = _fridays(first, last)
+            absent = np.setdiff1d(expected, dates)
+            if len(absent):
+                missing[author_name] = [str(date) for date in absent]
+        return missing
+
+    def _positions(self, since: Optional[str], until: Optional[str],
+                   authors: Optional[Sequence[str]]) -> np.ndarray:
+        if not authors:
+            return self.select(since=since, until=until)
+        return np.concatenate([self.select(name, since, until) for name in authors]).astype(int)
+
+    def _cached(self, key: str, compute: Callable):
+        """같은 데이터에 대한 같은 질의는 다시 계산하지 않음 (파일 캐시가 있으면 실행 간에도)"""
+        if key in self._results:
+            return self._results[key]
+        result = self.cache.get(self.fingerprint, key) if self.cache else None
+        if result is None:
+            result = compute()
+            if self.cache:
+                self.cache.put(self.fingerprint, key, result)
+        self._results[key] = result
+        return result
+
+    def _fingerprint(self) -> str:
+        """데이터 지문 (행 내용이 하나라도 바뀌면 달라짐)"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update('\0'.join(self.authors.tolist()).encode('utf-8'))
+        for values in (self.dates.astype('int64'), self.ratios, self.hours, self.totals):
+            digest.update(np.ascontiguousarray(values).tobytes())
+        return digest.hexdigest()
+
+def _parse_dates(values: Sequence[str]) -> np.ndarray:
+    """YYYY-MM-DD 문자열 배열을 datetime64[D]로 변환 (잘못된 값은 NaT)"""
+    values = np.asarray(values, dtype=str)
+    try:
+        return np.where(values == '', 'NaT', values).astype('datetime64[D]')
+    except ValueError:
+        parsed = []
+        for value in values:
+            try:
+                parsed.append(np.datetime64(value.strip(), 'D'))
+            except ValueError:
+                parsed.append(np.datetime64('NaT'))
+        return np.array(parsed, dtype='datetime64[D]')
+
+def _fridays(first: np.datetime64, last: np.datetime64) -> np.ndarray:
+    """first 이후 첫 금요일부터 last까지의 금요일 배열"""
+    offset = (_FRIDAY_OFFSET - first.astype('int64')) % 7
+    return np.arange(first + np.timedelta64(int(offset), 'D'), last + np.timedelta64(1, 'D'), _WEEK)
+
+def _group_nanmean(values: np.ndarray, inverse: np.ndarray, group_count: int) -> np.ndarray:
+    """그룹별 평균 (NaN 제외, 값이 없는 그룹은 NaN)"""
+    means = np.full((group_count, values.shape[1]), np.nan)
+    for column in range(values.shape[1]):
+        known = ~np.isnan(values[:, column])
+        counts = np.bincount(inverse, weights=known, minlength=group_count)
+        sums = np.bincount(inverse, weights=np.where(known, values[:, column], 0), minlength=group_count)
+        np.divide(sums, counts, out=means[:, column], where=counts > 0)
+    return means
+
+def _round(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 2)
+
+def format_history_table(rows: List[Dict], by: Sequence[str]) -> str:
+    """집계 결과 표 문자열"""
+    if not rows:
+        return "조건에 맞는 기록이 없습니다."
+    headers = list(by) + ['보고서', '온리프+심플', '르샤인', '오블리브', '총 시간']
+    lines = [" | ".join(headers)]
+    for row in rows:
+        cells = [row[name] for name in by] + [str(row['reports'])]
+        cells += ['-' if row[name] is None else f"{row[name]:.2f}%" for name in RATIO_KEYS]
+        cells.append('-' if row['total_hours'] is None else f"{row['total_hours']:g}")
+        lines.append(" | ".join(cells))
+    return "\n".join(lines)
+
+def format_missing_weeks(missing: Dict[str, List[str]]) -> str:
+    """빠진 주 목록 문자열"""
+    if not missing:
+        return "✅ 빠진 주가 없습니다."
+    return "\n".join(f"⚠️ {author_name}: {len(weeks)}주 누락 ({', '.join(weeks)})"
+                     for author_name, weeks in missing.items())
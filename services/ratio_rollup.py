@@ -0,0 +1,151 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# 비율 열 이름 (WeeklyReportParser._calculate_ratios와 같은 키)
+RATIO_KEYS = ('onlief_simple_ratio', 'leshaen_ratio', 'oblive_ratio')
+
+# 시간 행렬의 열 순서
+HOUR_COLUMNS = ('온리프', '심플', '르샤인', '오블리브')
+
+ZERO_RATIO = '00.00%'
+
+def format_ratio(value: float) -> str:
+    """비율 값을 시트에 기록하는 문자열로 변환 (NaN은 총합 0을 뜻함)"""
+    if np.isnan(value):
+        return ZERO_RATIO
+    return f"{float(value):.2f}%"
+
+def compute_ratios(hours: np.ndarray, totals: np.ndarray) -> np.ndarray:
+    """병원별 시간 행렬(n×4)과 총합(n)으로 비율 행렬(n×3, %) 계산
+
+    총합이 0인 행은 NaN으로 두고, 문자열로 바꿀 때 '00.00%'가 됩니다.
+    """
+    onlief_simple = hours[:, 0] + hours[:, 1]
+    numerators = np.column_stack((onlief_simple, hours[:, 2], hours[:, 3]))
+    ratios = np.full(numerators.shape, np.nan)
+    nonzero = totals != 0
+    # 스칼라 경로와 같은 연산 순서 (시간 / 총합 * 100)
+    ratios[nonzero] = numerators[nonzero] / totals[nonzero, None] * 100
+    return ratios
+
+@dataclass
+class Rollup:
+    """집계 결과 (그룹별 시간 합계와 비율, 문자열 변환은 to_dicts에서)"""
+
+    keys: List[Tuple]
+    key_names: Tuple[str, ...]
+    report_counts: np.ndarray
+    hours: np.ndarray
+    totals: np.ndarray
+    ratios: np.ndarray
+
+    def to_dicts(self) -> List[Dict]:
+        """그룹별 결과를 시트/출력용 딕셔너리로 변환"""
+        rows = []
+        for index, key in enumerate(self.keys):
+            row = dict(zip(self.key_names, key))
+            row['reports'] = int(self.report_counts[index])
+            row['total_hours'] = float(self.totals[index])
+            row.update({name: float(self.hours[index, column]) for column, name in enumerate(HOUR_COLUMNS)})
+            row.update({name: format_ratio(self.ratios[index, column]) for column, name in enumerate(RATIO_KEYS)})
+            rows.append(row)
+        return rows
+
+class RatioBatch:
+    """여러 보고서의 병원별 시간을 배열로 모아 비율과 집계를 한 번에 계산
+
+    Example:
+        batch = RatioBatch.from_parsed(parsed_reports)
+        batch.ratio_strings()          # 보고서별 비율 (parse_message의 ratios와 동일)
+        batch.rollup('author', 'month')  # 작성자·월별 집계
+    """
+
+    def __init__(self, authors: Sequence[str], friday_dates: Sequence[str],
+                 hours: np.ndarray, totals: np.ndarray):
+        self.authors = np.asarray(authors, dtype=object)
+        self.friday_dates = np.asarray(friday_dates, dtype=object)
+        self.hours = np.asarray(hours, dtype=float).reshape(-1, len(HOUR_COLUMNS))
+        self.totals = np.asarray(totals, dtype=float)
+        self._ratios = None
+
+    @classmethod
+    def from_parsed(cls, parsed_reports: Iterable[Dict]) -> 'RatioBatch':
+        """parse_message 결과 목록으로 생성 (없는 병원 시간과 총합은 0)"""
+        parsed_reports = list(parsed_reports)
+        time_data = [parsed_data.get('time_data', {}) for parsed_data in parsed_reports]
+        # 보고서마다 행을 만드는 대신 열 단위로 한 번씩 모음
+        hours = np.column_stack([
+            np.fromiter((data.get(name, 0) for data in time_data), dtype=float, count=len(time_data))
+            for name in HOUR_COLUMNS
+        ]) if time_data else np.zeros((0, len(HOUR_COLUMNS)))
+        totals = np.fromiter((data.get('총합', 0) for data in time_data), dtype=float, count=len(time_data))
+        return cls(
+            [parsed_data.get('author_name', '') for parsed_data in parsed_reports],
+            [parsed_data.get('friday_date', '') for parsed_data in parsed_reports],
+            hours,
+            totals
+        )
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+    @property
+    def ratios(self) -> np.ndarray:
+        """보고서별 비율 행렬 (n×3, %, 총합 0이면 NaN)"""
+        if self._ratios is None:
+            self._ratios = compute_ratios(self.hours, self.totals)
+        return self._ratios
+
+    def ratio_strings(self) -> List[Dict[str, str]]:
+        """보고서별 비율 문자열 (WeeklyReportParser._calculate_ratios와 같은 형식)"""
+        return [
+            {name: format_ratio(value) for name, value in zip(RATIO_KEYS, row)}
+            for row in self.ratios
+        ]
+
+    def group_codes(self, by: str) -> Tuple[np.ndarray, np.ndarray]:
+        """집계 기준별 (고유 키 배열, 보고서별 키 번호) 반환
+
+        기준: author, week(금요일 날짜), month(YYYY-MM, 고유 주 단위로 계산)
+        """
+        if by == 'author':
+            return np.unique(self.authors.astype(str), return_inverse=True)
+        if by in ('week', 'month'):
+            weeks, week_codes = np.unique(self.friday_dates.astype(str), return_inverse=True)
+            if by == 'week':
+                return weeks, week_codes
+            months, month_of_week = np.unique(np.array([week[:7] for week in weeks], dtype=str),
+                                              return_inverse=True)
+            return months, month_of_week[week_codes]
+        raise ValueError(f"지원하지 않는 집계 기준입니다: {by}")
+
+    def rollup(self, *by: str) -> Rollup:
+        """기준별로 시간과 총합을 합산한 뒤 비율 계산 (시간 가중 비율)
+
+        Args:
+            by: 'author', 'week', 'month' 중 하나 이상 (예: rollup('author', 'month'))
+        """
+        if not by:
+            raise ValueError("집계 기준을 하나 이상 지정해야 합니다.")
+
+        if len(self) == 0:
+            empty = np.zeros((0, len(HOUR_COLUMNS)))
+            return Rollup([], tuple(by), np.zeros(0, dtype=int), empty, np.zeros(0), np.zeros((0, len(RATIO_KEYS))))
+
+        # 기준별 키 번호를 하나의 정수 키로 합친 뒤 그룹 번호 부여
+        groupings = [self.group_codes(name) for name in by]
+        combined = np.zeros(len(self), dtype=np.int64)
+        for values, codes in groupings:
+            combined = combined * len(values) + codes
+        group_ids, first_index, inverse = np.unique(combined, return_index=True, return_inverse=True)
+        group_count = len(group_ids)
+
+        hours = np.zeros((group_count, len(HOUR_COLUMNS)))
+        np.add.at(hours, inverse, self.hours)
+        totals = np.bincount(inverse, weights=self.totals, minlength=group_count)
+        counts = np.bincount(inverse, minlength=group_count)
+
+        columns = [values[codes[first_index]] for values, codes in groupings]
+        keys = [tuple(str(value) for value in key) for key in zip(*columns)]
+        return Rollup(keys, tuple(by), counts, hours, totals, compute_ratios(hours, totals))
@@ -0,0 +1,158 @@
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional
+from services.batch_processor import BatchProcessor, BatchResult, ThreadRef
+from services.instrumentation import Instrumentation, get_instrumentation
+
+class ReportDaemon:
+    """미리 초기화한 Slack/Sheets 서비스를 유지하며 주간보고 이벤트를 워커 풀로 처리하는 상주 서비스
+
+    로컬 HTTP 인터페이스:
+        POST /reports          {"channel_id": ..., "thread_ts": ..., "author_name": (선택), "message": (선택)}
+                               → 202 접수 (?wait=1이면 처리 후 결과 반환)
+        GET  /health           → 처리 현황 (요청 한도 대기 현황, 단계별 시간/API 호출 요약 포함)
+        GET  /metrics          → 같은 계측 값을 Prometheus 텍스트 형식으로
+    """
+
+    def __init__(self, processor: BatchProcessor, workers: int = 4,
+                 on_result: Optional[Callable[[BatchResult], None]] = None,
+                 instrumentation: Optional[Instrumentation] = None):
+        self.processor = processor
+        self.instrumentation = instrumentation or get_instrumentation()
+        self.spool = processor.spool  # 지정 시 행을 대기열에 저장하고 백그라운드에서 모아서 기록
+        self.on_result = on_result
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='report-worker')
+        self._write_lock = threading.Lock()  # 중복 확인, 빈 행 계산과 기록은 한 번에 하나씩
+        self._stats_lock = threading.Lock()
+        self._stats = {'accepted': 0, 'succeeded': 0, 'failed': 0}
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def submit(self, ref: ThreadRef) -> Future:
+        """보고서 처리 요청을 워커 풀에 넣기"""
+        with self._stats_lock:
+            self._stats['accepted'] += 1
+        return self._executor.submit(self._process, ref)
+
+    def _process(self, ref: ThreadRef) -> BatchResult:
+        """보고서 하나 처리 (가져오기/파싱은 병렬, 시트 기록은 직렬)"""
+        parsed_data = None
+        try:
+            with self.instrumentation.stage('report'):
+                row, parsed_data = self.processor.build_row(ref)
+                with self._write_lock:
+                    # 대기열 사용 시 행 번호는 백그라운드 기록 시 정해짐 (row_number None)
+                    row_number, duplicate = self.processor.write_row(ref, row)
+            result = BatchResult(ref=ref, success=True, author_name=parsed_data['author_name'],
+                                 row_number=row_number, duplicate=duplicate)
+        except Exception as e:
+            result = BatchResult(ref=ref, success=False, error=str(e), parsed_data=parsed_data)
+            # 실패한 보고서는 원문과 함께 보관하여 --replay로 다시 기록
+            self.processor.record_failures([result])
+
+        with self._stats_lock:
+            self._stats['succeeded' if result.success else 'failed'] += 1
+
+        if self.on_result:
+            self.on_result(result)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """처리 현황 (접수/성공/실패 건수)"""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def start(self, host: str = '127.0.0.1', port: int = 8080) -> int:
+        """HTTP 인터페이스를 백그라운드 스레드로 시작하고 실제 포트 반환"""
+        if self.spool:
+            self.spool.start()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name='report-daemon-http', daemon=True).start()
+        return self._server.server_address[1]
+
+    def stop(self):
+        """HTTP 인터페이스를 닫고 남은 작업이 끝날 때까지 대기"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        self._executor.shutdown(wait=True)
+        if self.spool:
+            self.spool.stop(flush=True)
+
+    def _make_handler(self):
+        daemon = self
+
+        class ReportRequestHandler(BaseHTTPRequestHandler):
+            """보고서 이벤트 수신 핸들러"""
+
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                if path == '/metrics':
+                    data = daemon.instrumentation.prometheus_text().encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                    self.send_header('Content-Length', str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                elif path == '/health':
+                    health = daemon.stats()
+                    scheduler = getattr(daemon.processor.sheets_service, 'scheduler', None)
+                    if scheduler:
+                        health['rate_limits'] = scheduler.stats()
+                    client_factory = getattr(daemon.processor.sheets_service, 'client_factory', None)
+                    if client_factory:
+                        health['sheets_client'] = client_factory.stats()
+                    health['instrumentation'] = daemon.instrumentation.summary()
+                    self._send_json(200, health)
+                else:
+                    self._send_json(404, {'error': 'not_found'})
+
+            def do_POST(self):
+                path, _, query = self.path.partition('?')
+                if path != '/reports':
+                    self._send_json(404, {'error': 'not_found'})
+                    return
+
+                try:
+                    length = int(self.headers.get('Content-Length') or 0)
+                    payload = json.loads(self.rfile.read(length).decode('utf-8') or '{}')
+                    if not isinstance(payload, dict):
+                        raise ValueError("JSON 객체가 아닙니다")
+                    ref = ThreadRef(
+                        channel_id=payload['channel_id'],
+                        thread_ts=payload['thread_ts'],
+                        author_name=payload.get('author_name'),
+                        message=payload.get('message')
+                    )
+                except (KeyError, ValueError) as e:
+                    self._send_json(400, {'error': f"잘못된 요청: {e}"})
+                    return
+
+                future = daemon.submit(ref)
+                if 'wait=1' in query.split('&'):
+                    result = future.result()
+                    self._send_json(200 if result.success else 500, {
+                        'success': result.success,
+                        'row_number': result.row_number,
+                        'author_name': result.author_name,
+                        'error': result.error,
+                        'duplicate': result.duplicate
+                    })
+                else:
+                    self._send_json(202, {'accepted': True})
+
+            def _send_json(self, status: int, payload: Dict):
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return ReportRequestHandler
@@ -0,0 +1,164 @@
+import json
+import os
+from typing import List, Optional
+from services.rate_limiter import RateLimitScheduler, get_scheduler
+
+class RowLocator:
+    """A열만 읽어 빈 행을 찾는 행 위치 탐색기
+
+    - 처음 한 번만 A열(col_values)을 읽고, 이후 같은 프로세스 안에서는 캐시된 A열로 빈 행을 계산합니다.
+    - cursor_path가 지정되면 마지막으로 기록한 행 다음 번호를 파일에 저장하고,
+      다음 실행에서는 커서 주변의 좁은 범위만 읽어 유효한지 확인한 뒤 그대로 사용합니다.
+      (커서를 사용할 때는 커서 위쪽의 빈 행은 다시 채우지 않습니다.)
+    - revalidate=True면 캐시가 있어도 빈 행을 찾을 때마다 마지막 기록 행 주변의 좁은 범위를 다시 읽어 확인하고,
+      다른 곳(다른 실행, 사람의 수정)에서 시트가 바뀌었으면 A열 전체를 다시 읽습니다. (상주 서비스용)
+    - snapshot(SheetSnapshot)을 주면 저장된 커서가 없거나 맞지 않을 때 스냅샷의 마지막 행 다음을 같은 좁은 범위 읽기로
+      확인해 사용하고, 그것도 맞지 않을 때만 A열 전체를 읽습니다.
+    """
+
+    def __init__(self, worksheet, cursor_path: Optional[str] = None, cursor_key: str = "default",
+                 scheduler: Optional[RateLimitScheduler] = None, revalidate: bool = False, snapshot=None):
+        self.worksheet = worksheet
+        self.snapshot = snapshot
+        self.revalidate = revalidate
+        self.scheduler = scheduler or get_scheduler()
+        self.cursor_path = cursor_path
+        self.cursor_key = cursor_key
+        self._column_a: Optional[List[str]] = None  # 캐시된 A열 값 (index 0 = 1행)
+        self._next_row: Optional[int] = None        # 검증을 통과한 커서 (마지막 기록 행 + 1)
+
+    def find_empty_rows(self, count: int) -> List[int]:
+        """A열이 비어있는 행 번호를 위에서부터 count개 반환"""
+        if self.revalidate and (self._column_a is not None or self._next_row is not None):
+            next_row = self._next_row if self._column_a is None else self._last_filled_row() + 1
+            if self._is_cursor_valid(next_row, count):
+                # 검증된 위치부터 이어서 기록 (캐시의 중간 빈 행은 그사이 채워졌을 수 있으므로 사용하지 않음)
+                self._column_a = None
+                self._next_row = next_row
+                return list(range(next_row, next_row + count))
+            self.invalidate()
+            self.refresh()
+
+        if self._column_a is None:
+            if self._next_row is None:
+                cursor = self._load_cursor()
+                if cursor and self._is_cursor_valid(cursor, count):
+                    self._next_row = cursor
+                else:
+                    hint = self._snapshot_cursor()
+                    if hint and hint != cursor and self._is_cursor_valid(hint, count):
+                        self._next_row = hint
+                    else:
+                        self.refresh()
+
+            if self._next_row is not None:
+                return list(range(self._next_row, self._next_row + count))
+
+        empty_rows = [
+            i for i, value in enumerate(self._column_a, 1)
+            if not value.strip()
+        ][:count]
+
+        # 중간에 빈 행이 모자라면 마지막 행 이후로 이어서 채움
+        next_row = len(self._column_a) + 1
+        while len(empty_rows) < count:
+            empty_rows.append(next_row)
+            next_row += 1
+
+        return empty_rows
+
+    def last_row_number(self) -> int:
+        """A열 기준 마지막 행 번호 반환 (스냅샷이 있으면 A열 전체를 읽지 않고 스냅샷에서)"""
+        if self._column_a is None and self._next_row is not None:
+            return self._next_row - 1
+        if self._column_a is None and self.snapshot is not None:
+            self.snapshot.ensure_fresh(0)
+            return self.snapshot.last_row_number()
+        if self._column_a is None:
+            self.refresh()
+        return len(self._column_a)
+
+    def mark_written(self, row_numbers: List[int]):
+        """기록된 행을 캐시와 커서에 반영"""
+        if not row_numbers:
+            return
+
+        if self._column_a is not None:
+            for row_number in row_numbers:
+                if row_number > len(self._column_a):
+                    self._column_a.extend([""] * (row_number - len(self._column_a)))
+                self._column_a[row_number - 1] = "*"  # 채워진 행 표시 (빈 행 판단용)
+
+        next_row = max(row_numbers) + 1
+        if self._next_row is not None:
+            self._next_row = max(self._next_row, next_row)
+
+        cursor = self._load_cursor()
+        if not cursor or next_row > cursor:
+            self._save_cursor(next_row)
+
+    def refresh(self):
+        """A열 전체를 다시 읽어 캐시 갱신"""
+        self._column_a = list(self.scheduler.call('sheets:read', self.worksheet.col_values, 1))
+
+    def invalidate(self):
+        """캐시 무효화 (다른 곳에서 시트가 변경된 경우)"""
+        self._column_a = None
+        self._next_row = None
+
+    def _snapshot_cursor(self) -> Optional[int]:
+        """스냅샷 기준 마지막 행 다음 번호 (스냅샷이 없거나 비어 있으면 None)"""
+        if self.snapshot is None or not len(self.snapshot):
+            return None
+        return self.snapshot.last_row_number() + 1
+
+    def _last_filled_row(self) -> int:
+        """캐시된 A열에서 값이 있는 마지막 행 번호 (없으면 0)"""
+        for index in range(len(self._column_a), 0, -1):
+            if self._column_a[index - 1].strip():
+                return index
+        return 0
+
+    def _is_cursor_valid(self, cursor: int, count: int) -> bool:
+        """커서 바로 윗행은 채워져 있고 커서부터 count개 행은 비어있는지 좁은 범위만 읽어 확인"""
+        if cursor < 1:
+            return False
+
+        start = max(cursor - 1, 1)
+        values = self.scheduler.call('sheets:read', self.worksheet.get, f"A{start}:A{cursor + count - 1}")
+        cells = [row[0].strip() if row else "" for row in values]
+        cells.extend([""] * (cursor + count - start - len(cells)))
+
+        if cursor > 1 and not cells[0]:
+            return False
+        tail = cells[1:] if cursor > 1 else cells
+        return not any(tail)
+
+    def _load_cursor(self) -> Optional[int]:
+        """저장된 커서 읽기"""
+        if not self.cursor_path or not os.path.exists(self.cursor_path):
+            return None
+        try:
+            with open(self.cursor_path, encoding='utf-8') as f:
+                return json.load(f).get(self.cursor_key)
+        except (OSError, ValueError):
+            return None
+
+    def _save_cursor(self, next_row: int):
+        """커서 저장 (시트별 키로 구분)"""
+        if not self.cursor_path:
+            return
+
+        cursors = {}
+        if os.path.exists(self.cursor_path):
+            try:
+                with open(self.cursor_path, encoding='utf-8') as f:
+                    cursors = json.load(f)
+            except (OSError, ValueError):
+                cursors = {}
+
+        cursors[self.cursor_key] = next_row
+        tmp_path = f"{self.cursor_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cursors, f)
+        os.replace(tmp_path, self.cursor_path)
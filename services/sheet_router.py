@@ -0,0 +1,145 @@
+import json
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
+from services.rate_limiter import RateLimitScheduler, get_scheduler
+from services.sheets_client_factory import SheetsClientFactory
+from services.sheets_service import SheetsService
+
+@dataclass(frozen=True)
+class SheetTarget:
+    """보고서를 기록할 스프레드시트와 워크시트"""
+
+    spreadsheet_id: str
+    sheet_name: str
+
+    @property
+    def key(self) -> str:
+        """대기열 등에 저장하는 문자열 키 (`스프레드시트ID/시트이름`)"""
+        return f"{self.spreadsheet_id}/{self.sheet_name}"
+
+    @classmethod
+    def from_key(cls, key: str) -> 'SheetTarget':
+        spreadsheet_id, _, sheet_name = key.partition('/')
+        if not spreadsheet_id or not sheet_name:
+            raise ValueError(f"시트 키 형식 오류: '{key}' ('스프레드시트ID/시트이름' 형식이어야 합니다.)")
+        return cls(spreadsheet_id, sheet_name)
+
+    def __str__(self) -> str:
+        return self.key
+
+@dataclass(frozen=True)
+class RoutingRule:
+    """채널 또는 작성자가 일치하면 target에 기록하는 규칙"""
+
+    target: SheetTarget
+    channels: frozenset = frozenset()
+    authors: frozenset = frozenset()
+
+    def matches(self, channel_id: Optional[str], author_name: Optional[str]) -> bool:
+        return channel_id in self.channels or author_name in self.authors
+
+def load_routing_rules(path: str) -> List[RoutingRule]:
+    """시트 라우팅 설정 파일(JSON) 읽기
+
+    형식: {"routes": [{"spreadsheet_id": "...", "sheet_name": "...", "channels": ["C1"], "authors": ["홍길동"]}]}
+    """
+    with open(path, encoding='utf-8') as f:
+        config = json.load(f)
+
+    rules = []
+    for number, route in enumerate(config.get('routes', []), 1):
+        if not route.get('spreadsheet_id') or not route.get('sheet_name'):
+            raise ValueError(f"{path} {number}번째 규칙: spreadsheet_id와 sheet_name이 필요합니다.")
+        rules.append(RoutingRule(
+            target=SheetTarget(route['spreadsheet_id'], route['sheet_name']),
+            channels=frozenset(route.get('channels', [])),
+            authors=frozenset(route.get('authors', []))
+        ))
+    return rules
+
+class SheetRouter:
+    """채널·작성자별로 다른 스프레드시트/워크시트에 기록하는 SheetsService 묶음
+
+    - 규칙은 설정 순서대로 확인하며, 일치하는 규칙이 없으면 default 시트에 기록합니다.
+    - 모든 시트가 하나의 SheetsClientFactory를 공유하므로 인증, gspread 클라이언트, 연결 풀은 하나이고
+      워크시트 핸들과 메타데이터도 생성기에 캐시됩니다. 시트별 SheetsService는 처음 기록할 때 만듭니다.
+    - append_rows/update_rows 등은 SheetsService와 같고 route(시트 키 또는 SheetTarget)를 추가로 받습니다.
+      route가 없으면 default 시트에 기록합니다. 여러 시트로 나누어 묶음 기록하는 것은 호출하는 쪽
+      (BatchProcessor, WriteSpool)에서 route별로 묶어 시트마다 한 번씩 호출합니다.
+    - 색인(INGESTION_INDEX_PATH)의 행 번호는 보고서가 라우팅된 시트 기준이므로 규칙을 바꾸면 색인을 다시 맞추세요.
+    """
+
+    def __init__(self, default: SheetTarget, rules: Sequence[RoutingRule], client_factory: SheetsClientFactory,
+                 row_cursor_path: Optional[str] = None, scheduler: Optional[RateLimitScheduler] = None,
+                 revalidate_rows: bool = False):
+        self.default = default
+        self.rules = list(rules)
+        self.client_factory = client_factory
+        self.row_cursor_path = row_cursor_path
+        self.revalidate_rows = revalidate_rows
+        self.scheduler = scheduler or get_scheduler()
+        self._services: Dict[SheetTarget, SheetsService] = {}
+        self._lock = threading.Lock()
+
+    def route(self, channel_id: Optional[str], author_name: Optional[str]) -> SheetTarget:
+        """보고서를 기록할 시트 (처음 일치하는 규칙, 없으면 기본 시트)"""
+        for rule in self.rules:
+            if rule.matches(channel_id, author_name):
+                return rule.target
+        return self.default
+
+    def targets(self) -> List[SheetTarget]:
+        """기본 시트와 규칙의 시트 목록 (중복 제외, 설정 순서)"""
+        return list(dict.fromkeys([self.default] + [rule.target for rule in self.rules]))
+
+    def service(self, route: Union[str, SheetTarget, None] = None) -> SheetsService:
+        """시트별 SheetsService (처음 요청할 때 공유 클라이언트 생성기로 만들고 재사용)"""
+        target = self._target(route)
+        with self._lock:
+            service = self._services.get(target)
+            if service is None:
+                service = SheetsService(
+                    self.client_factory.credentials_path,
+                    target.spreadsheet_id,
+                    target.sheet_name,
+                    row_cursor_path=self.row_cursor_path,
+                    scheduler=self.scheduler,
+                    client_factory=self.client_factory,
+                    revalidate_rows=self.revalidate_rows
+                )
+                self._services[target] = service
+            return service
+
+    def append_rows(self, rows: List, route: Union[str, SheetTarget, None] = None) -> List[int]:
+        return self.service(route).append_rows(rows)
+
+    def append_row(self, data, route: Union[str, SheetTarget, None] = None) -> int:
+        return self.service(route).append_row(data)
+
+    def update_rows(self, row_numbers: List[int], rows: List, route: Union[str, SheetTarget, None] = None):
+        self.service(route).update_rows(row_numbers, rows)
+
+    def update_row(self, row_number: int, data, route: Union[str, SheetTarget, None] = None):
+        self.service(route).update_row(row_number, data)
+
+    def read_index_rows(self, route: Union[str, SheetTarget, None] = None) -> List[tuple]:
+        return self.service(route).read_index_rows()
+
+    @property
+    def write_request_count(self) -> int:
+        """모든 시트의 값 쓰기 요청 횟수 합계"""
+        with self._lock:
+            return sum(service.write_request_count for service in self._services.values())
+
+    def stats(self) -> Dict[str, int]:
+        """시트 키별 값 쓰기 요청 횟수 (사용한 시트만)"""
+        with self._lock:
+            return {target.key: service.write_request_count for target, service in self._services.items()}
+
+    def _target(self, route: Union[str, SheetTarget, None]) -> SheetTarget:
+        if route is None:
+            return self.default
+        if isinstance(route, SheetTarget):
+            return route
+        return SheetTarget.from_key(route)
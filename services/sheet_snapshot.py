@@ -0,0 +1,281 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from services.rate_limiter import RateLimitScheduler, get_scheduler
+
+# 스냅샷에 저장하는 열 (SpreadsheetRow 필드 이름, 시트 열)
+SNAPSHOT_COLUMNS = (
+    ('author_name', 'A'),
+    ('friday_date', 'B'),
+    ('onleaf_simple_ratio', 'I'),
+    ('leshine_ratio', 'L'),
+    ('oblible_ratio', 'N'),
+)
+
+# O열은 본문 대신 해시만 저장 (내용이 바뀌었는지 확인용)
+MESSAGE_COLUMN = 'O'
+
+# 머리글 다음 첫 데이터 행
+FIRST_DATA_ROW = 2
+
+def message_hash(text: str) -> int:
+    """O열 본문의 64비트 해시 (빈 칸은 0)"""
+    if not text:
+        return 0
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+class SheetSnapshot:
+    """워크시트의 좁은 열(A, B, I, L, N)과 O열 해시를 열 단위 배열로 저장한 로컬 사본
+
+    - 열마다 numpy 배열 하나로 보관하고 npz 파일(압축)에 저장합니다. 배열의 i번째 값은 (i + 2)행입니다.
+    - refresh()는 저장된 마지막 tail_rows개 행부터 시트 끝까지만 한 번의 values.batchGet으로 읽습니다.
+      겹치는 행이 저장된 값과 같으면 새로 생긴 행만 덧붙이고, 다르면(행 삭제·수정) 전체를 다시 읽습니다.
+    - 마지막 전체 읽기 후 full_refresh_seconds가 지나면 전체를 다시 읽습니다. (끝부분 밖의 수정 반영)
+    - SheetsService가 기록한 행은 record_rows()로 바로 반영하므로 다음 refresh()에서 다시 읽지 않습니다.
+      기록한 행은 npz 전체를 다시 쓰지 않고 변경분 로그({path}.log)에 한 줄씩 덧붙이며, load()가 로그를 다시 적용합니다.
+      로그가 compact_rows행을 넘거나 refresh()로 npz를 저장할 때 로그를 npz에 합치고 비웁니다.
+    - 쓰기 대기열의 백그라운드 기록과 상주 서비스 워커가 함께 쓰므로 배열 변경과 저장은 잠금 안에서 합니다.
+    """
+
+    def __init__(self, path: str, worksheet, scheduler: Optional[RateLimitScheduler] = None,
+                 tail_rows: int = 3, full_refresh_seconds: float = 24 * 3600, compact_rows: int = 1000):
+        self.path = path
+        self.worksheet = worksheet
+        self.scheduler = scheduler or get_scheduler()
+        self.tail_rows = tail_rows
+        self.full_refresh_seconds = full_refresh_seconds
+        self.compact_rows = compact_rows
+        self.log_path = f"{path}.log" if path else None
+        self._log_rows = 0       # 변경분 로그에 쌓인 행 수
+        self.columns: Dict[str, np.ndarray] = _empty_columns()
+        self.full_at = 0.0       # 마지막 전체 읽기 시각
+        self.refreshed_at = 0.0  # 마지막 refresh 시각
+        self._lock = threading.RLock()
+        self.load()
+
+    def __len__(self) -> int:
+        """저장된 행 수 (2행부터, 빈 행 포함)"""
+        return len(self.columns['message_hash'])
+
+    def load(self) -> bool:
+        """파일에서 스냅샷 읽기 (없거나 읽을 수 없으면 빈 스냅샷, 변경분 로그가 있으면 다시 적용)"""
+        if not self.path:
+            return False
+        if not os.path.exists(self.path):
+            with self._lock:
+                self._replay_log()
+            return False
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                columns = {name: data[name] for name in _column_names()}
+                full_at = float(data['full_at'])
+                refreshed_at = float(data['refreshed_at'])
+        except (OSError, ValueError, KeyError):
+            return False
+        with self._lock:
+            self.columns = columns
+            self.full_at = full_at
+            self.refreshed_at = refreshed_at
+            self._replay_log()
+        return True
+
+    def save(self):
+        """임시 파일에 쓴 뒤 교체하고 변경분 로그 비우기 (임시 파일은 프로세스마다 따로 사용)"""
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with self._lock:
+            with open(tmp_path, 'wb') as f:
+                np.savez_compressed(f, full_at=self.full_at, refreshed_at=self.refreshed_at, **self.columns)
+            os.replace(tmp_path, self.path)
+            if os.path.exists(self.log_path):
+                os.remove(self.log_path)
+            self._log_rows = 0
+
+    def refresh(self, full: bool = False) -> Dict:
+        """시트와 맞추기 (기본은 끝부분만 읽는 증분 갱신)
+
+        Returns:
+            {'mode': 'full' 또는 'delta', 'fetched_rows': 읽은 행 수, 'added_rows': 새 행 수, 'rows': 전체 행 수}
+        """
+        with self._lock:
+            stale = time.time() - self.full_at > self.full_refresh_seconds
+            if full or stale or len(self) == 0:
+                fetched = self._fetch(FIRST_DATA_ROW)
+                self.columns = fetched
+                self.full_at = time.time()
+                stats = {'mode': 'full', 'fetched_rows': len(fetched['message_hash']), 'added_rows': 0}
+            else:
+                overlap = min(self.tail_rows, len(self))
+                start_index = len(self) - overlap
+                fetched = self._fetch(FIRST_DATA_ROW + start_index)
+                if self._matches(fetched, start_index, overlap):
+                    self.columns = {name: np.concatenate((values[:start_index], fetched[name]))
+                                    for name, values in self.columns.items()}
+                    stats = {'mode': 'delta', 'fetched_rows': len(fetched['message_hash']),
+                             'added_rows': len(fetched['message_hash']) - overlap}
+                else:
+                    # 끝부분이 달라졌으면 (행 삭제·수정) 전체를 다시 읽음
+                    return self.refresh(full=True)
+
+            self.refreshed_at = time.time()
+            self.save()
+            stats['rows'] = len(self)
+            return stats
+
+    def record_rows(self, row_numbers: Sequence[int], column_data: Sequence[Dict[str, str]]):
+        """SheetsService가 기록한 행을 스냅샷에 반영 (값이 있는 열만, 시트 기록과 동일)
+
+        파일에는 기록한 행만 변경분 로그에 덧붙이므로 비용이 시트 크기와 관계없습니다.
+        """
+        if not row_numbers:
+            return
+        changes = []
+        for row_number, data in zip(row_numbers, column_data):
+            change = {name: str(data[column]) for name, column in SNAPSHOT_COLUMNS if data.get(column)}
+            if data.get(MESSAGE_COLUMN):
+                change['message_hash'] = message_hash(data[MESSAGE_COLUMN])
+            changes.append((row_number, change))
+        with self._lock:
+            self._apply(changes)
+            self._append_log(changes)
+
+    def _apply(self, changes: List[tuple]):
+        """(행 번호, {열 이름: 값}) 목록을 배열에 반영"""
+        row_numbers = [row_number for row_number, _ in changes]
+        needed = max(row_numbers) - FIRST_DATA_ROW + 1
+        if needed > len(self):
+            padding = _empty_columns(needed - len(self))
+            self.columns = {name: np.concatenate((values, padding[name])) for name, values in self.columns.items()}
+
+        for name, _ in SNAPSHOT_COLUMNS:
+            updates = [(row_number - FIRST_DATA_ROW, change[name])
+                       for row_number, change in changes if name in change]
+            if not updates:
+                continue
+            values = self.columns[name]
+            # 고정 길이 문자열 배열이므로 더 긴 값은 배열을 넓힌 뒤 기록 (잘림 방지)
+            width = max(len(value) for _, value in updates)
+            if width > values.dtype.itemsize // 4:
+                values = self.columns[name] = values.astype(f"<U{width}")
+            for index, value in updates:
+                values[index] = value
+
+        for row_number, change in changes:
+            if 'message_hash' in change:
+                self.columns['message_hash'][row_number - FIRST_DATA_ROW] = change['message_hash']
+
+    def _append_log(self, changes: List[tuple]):
+        """변경분 로그에 한 줄 덧붙이기 (로그가 compact_rows행을 넘으면 npz에 합침)"""
+        if not self.path:
+            return
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps([[row_number, change] for row_number, change in changes], ensure_ascii=False) + "\n")
+        self._log_rows += len(changes)
+        if self._log_rows >= self.compact_rows:
+            self.save()
+
+    def _replay_log(self):
+        """npz 저장 이후 변경분 로그 다시 적용 (마지막 줄이 잘린 경우 그 줄은 무시)"""
+        if not self.log_path or not os.path.exists(self.log_path):
+            return
+        try:
+            with open(self.log_path, encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                changes = [(int(row_number), change) for row_number, change in json.loads(line)]
+            except ValueError:
+                continue
+            self._apply(changes)
+            self._log_rows += len(changes)
+
+    def last_row_number(self) -> int:
+        """A열(작성자)이 채워진 마지막 행 번호 (없으면 머리글 행 1)"""
+        with self._lock:
+            filled = np.flatnonzero(self.columns['author_name'] != '')
+            return int(filled[-1]) + FIRST_DATA_ROW if len(filled) else FIRST_DATA_ROW - 1
+
+    def find(self, author_name: str, friday_date: str) -> Optional[int]:
+        """작성자·주(금요일 날짜) 보고서가 기록된 첫 행 번호 (없으면 None)"""
+        with self._lock:
+            matches = np.flatnonzero((self.columns['author_name'] == author_name) &
+                                     (self.columns['friday_date'] == friday_date))
+            return int(matches[0]) + FIRST_DATA_ROW if len(matches) else None
+
+    def ensure_fresh(self, max_age: float) -> Optional[Dict]:
+        """마지막 갱신 후 max_age초가 지났거나 비어 있으면 refresh() (갱신 결과, 아니면 None)"""
+        with self._lock:
+            if len(self) and time.time() - self.refreshed_at <= max_age:
+                return None
+            return self.refresh()
+
+    def select(self, author_name: Optional[str] = None, since: Optional[str] = None,
+               until: Optional[str] = None) -> np.ndarray:
+        """조건에 맞는 행의 배열 위치 (since/until은 금요일 날짜 YYYY-MM-DD, 양끝 포함, 빈 행 제외)"""
+        with self._lock:
+            authors = self.columns['author_name']
+            dates = self.columns['friday_date']
+        mask = authors != ''
+        if author_name is not None:
+            mask &= authors == author_name
+        if since:
+            mask &= dates >= since
+        if until:
+            mask &= dates <= until
+        return np.flatnonzero(mask)
+
+    def index_rows(self) -> List[tuple]:
+        """(행 번호, 작성자, 금요일 날짜) 목록 (SheetsService.read_index_rows와 같은 형식)"""
+        with self._lock:
+            positions = self.select()
+            return [(int(position) + FIRST_DATA_ROW, str(self.columns['author_name'][position]).strip(),
+                     str(self.columns['friday_date'][position]).strip()) for position in positions]
+
+    def _fetch(self, start_row: int) -> Dict[str, np.ndarray]:
+        """start_row부터 시트 끝까지 필요한 열만 한 번의 요청으로 읽기"""
+        ranges = [f"A{start_row}:B", f"I{start_row}:I", f"L{start_row}:L", f"N{start_row}:N",
+                  f"{MESSAGE_COLUMN}{start_row}:{MESSAGE_COLUMN}"]
+        value_ranges = self.scheduler.call('sheets:read', self.worksheet.batch_get, ranges,
+                                           major_dimension='COLUMNS')
+
+        # 범위마다 열 목록이 오며, 각 열은 마지막 값 이후의 빈 칸이 잘려 있음
+        column_values = []
+        for value_range in value_ranges:
+            width = 2 if len(column_values) == 0 else 1
+            lines = list(value_range) + [[]] * width
+            column_values.extend(lines[:width])
+        length = max((len(values) for values in column_values), default=0)
+
+        columns = {}
+        for (name, _), values in zip(SNAPSHOT_COLUMNS, column_values):
+            columns[name] = [str(value) for value in values] + [''] * (length - len(values))
+        messages = column_values[-1]
+        columns['message_hash'] = [message_hash(str(value)) for value in messages] + [0] * (length - len(messages))
+        return _to_arrays(columns)
+
+    def _matches(self, fetched: Dict[str, np.ndarray], start_index: int, overlap: int) -> bool:
+        """새로 읽은 앞부분이 저장된 끝부분과 같은지 확인"""
+        if len(fetched['message_hash']) < overlap:
+            return False
+        return all(np.array_equal(values[start_index:start_index + overlap], fetched[name][:overlap])
+                   for name, values in self.columns.items())
+
+def _column_names() -> List[str]:
+    return [name for name, _ in SNAPSHOT_COLUMNS] + ['message_hash']
+
+def _empty_columns(length: int = 0) -> Dict[str, np.ndarray]:
+    columns = {name: np.full(length, '', dtype=str) for name, _ in SNAPSHOT_COLUMNS}
+    columns['message_hash'] = np.zeros(length, dtype=np.uint64)
+    return columns
+
+def _to_arrays(columns: Dict[str, list]) -> Dict[str, np.ndarray]:
+    arrays = {name: np.array(columns[name], dtype=str) for name, _ in SNAPSHOT_COLUMNS}
+    arrays['message_hash'] = np.array(columns['message_hash'], dtype=np.uint64)
+    return arrays
@@ -0,0 +1,247 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+import gspread
+from google.auth.transport.requests import AuthorizedSession
+from google.oauth2.service_account import Credentials
+from requests import Session
+from requests.adapters import HTTPAdapter
+from services.rate_limiter import RateLimitScheduler, get_scheduler
+
+SCOPES = [
+    'https://spreadsheets.google.com/feeds',
+    'https://www.googleapis.com/auth/drive'
+]
+
+# 만료 직전 토큰은 재사용하지 않음 (요청 도중 만료 방지)
+TOKEN_EXPIRY_MARGIN = timedelta(minutes=5)
+
+# 저장된 워크시트 메타데이터가 실제 시트와 맞지 않을 때(이름 변경·삭제) Sheets API 오류 메시지
+STALE_WORKSHEET_MESSAGES = ('Unable to parse range', 'No grid with id', 'gridId')
+
+def is_stale_worksheet_error(error: Exception) -> bool:
+    """저장된 워크시트 메타데이터가 맞지 않아 생긴 오류인지 (워크시트 없음, 범위·그리드 ID 오류)"""
+    if isinstance(error, gspread.exceptions.WorksheetNotFound):
+        return True
+    if isinstance(error, gspread.exceptions.APIError):
+        status_code = getattr(error.response, 'status_code', None)
+        return status_code in (400, 404) and any(text in str(error) for text in STALE_WORKSHEET_MESSAGES)
+    return False
+
+class CachedSpreadsheet(gspread.Spreadsheet):
+    """저장된 메타데이터로 만드는 Spreadsheet (생성 시 메타데이터를 다시 조회하지 않음)"""
+
+    def __init__(self, client, properties):
+        self.client = client
+        self._properties = dict(properties)
+
+class BaseUrlSession(Session):
+    """Google API 주소를 다른 서버 주소로 바꿔 보내는 인증 없는 세션 (가짜 Sheets 서버용)"""
+
+    GOOGLE_API_BASE_URL = 'https://sheets.googleapis.com'
+
+    def __init__(self, base_url: str):
+        super().__init__()
+        self.base_url = base_url.rstrip('/')
+
+    def request(self, method, url, *args, **kwargs):
+        if url.startswith(self.GOOGLE_API_BASE_URL):
+            url = self.base_url + url[len(self.GOOGLE_API_BASE_URL):]
+        return super().request(method, url, *args, **kwargs)
+
+class SheetsClientFactory:
+    """Google Sheets 클라이언트 공용 생성기
+
+    - 서비스 계정 인증 정보와 gspread 클라이언트를 한 번만 만들어 재사용합니다.
+    - 발급받은 액세스 토큰을 만료 전까지 파일에 저장하여 다음 실행에서 OAuth 교환을 생략합니다.
+    - 하나의 keep-alive HTTP 세션(연결 풀)으로 모든 요청을 보냅니다.
+    - 스프레드시트/워크시트 메타데이터(id, 제목, gid)를 저장하여 open_by_key/worksheet() 왕복을 생략합니다.
+    - stats()로 실제 발생한 토큰 갱신, 메타데이터 조회, 새 연결 수를 확인할 수 있습니다.
+    - api_base_url을 지정하면 인증 없이 해당 서버(예: 가짜 Sheets 서버)로 요청을 보냅니다.
+    """
+
+    def __init__(self, credentials_path: Optional[str], token_cache_path: Optional[str] = None,
+                 metadata_cache_path: Optional[str] = None, metadata_ttl_seconds: float = 24 * 3600,
+                 pool_maxsize: int = 10, scheduler: Optional[RateLimitScheduler] = None,
+                 api_base_url: Optional[str] = None):
+        self.credentials_path = credentials_path
+        self.api_base_url = api_base_url
+        self.token_cache_path = token_cache_path
+        self.metadata_cache_path = metadata_cache_path
+        self.metadata_ttl_seconds = metadata_ttl_seconds
+        self.pool_maxsize = pool_maxsize
+        self.scheduler = scheduler or get_scheduler()
+        self._lock = threading.RLock()
+        self._credentials: Optional[Credentials] = None
+        self._session: Optional[AuthorizedSession] = None
+        self._client: Optional[gspread.Client] = None
+        self._worksheets: Dict[str, gspread.Worksheet] = {}
+        self._metadata = self._load_json(metadata_cache_path)
+        self._stats = {'token_refreshes': 0, 'token_cache_hits': 0, 'metadata_fetches': 0, 'metadata_cache_hits': 0}
+
+    def credentials(self) -> Credentials:
+        """서비스 계정 인증 정보 (저장된 토큰이 유효하면 함께 불러옴)"""
+        with self._lock:
+            if self._credentials is None:
+                credentials = Credentials.from_service_account_file(self.credentials_path, scopes=SCOPES)
+                self._restore_token(credentials)
+                self._track_refresh(credentials)
+                self._credentials = credentials
+            return self._credentials
+
+    def session(self) -> AuthorizedSession:
+        """연결 풀을 쓰는 keep-alive 인증 세션"""
+        with self._lock:
+            if self._session is None:
+                if self.api_base_url:
+                    session = BaseUrlSession(self.api_base_url)
+                else:
+                    session = AuthorizedSession(self.credentials())
+                # 재시도는 RateLimitScheduler가 담당하므로 어댑터 재시도는 끔
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_maxsize, max_retries=0)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._session = session
+            return self._session
+
+    def client(self) -> gspread.Client:
+        """공유 gspread 클라이언트"""
+        with self._lock:
+            if self._client is None:
+                credentials = None if self.api_base_url else self.credentials()
+                self._client = gspread.Client(credentials, session=self.session())
+            return self._client
+
+    def open_worksheet(self, spreadsheet_id: str, sheet_name: str) -> gspread.Worksheet:
+        """워크시트 열기 (메타데이터가 저장되어 있으면 API 호출 없음)"""
+        key = f"{spreadsheet_id}/{sheet_name}"
+        with self._lock:
+            if key in self._worksheets:
+                return self._worksheets[key]
+
+            client = self.client()
+            cached = self._metadata.get(key)
+            if cached and time.time() - cached.get('fetched_at', 0) < self.metadata_ttl_seconds:
+                spreadsheet = CachedSpreadsheet(client, cached['spreadsheet'])
+                worksheet = gspread.Worksheet(spreadsheet, dict(cached['worksheet']))
+                self._stats['metadata_cache_hits'] += 1
+            else:
+                spreadsheet = self.scheduler.call('sheets:read', client.open_by_key, spreadsheet_id)
+                worksheet = self.scheduler.call('sheets:read', spreadsheet.worksheet, sheet_name)
+                self._stats['metadata_fetches'] += 1
+                self._metadata[key] = {
+                    'spreadsheet': dict(spreadsheet._properties),
+                    'worksheet': dict(worksheet._properties),
+                    'fetched_at': time.time()
+                }
+                self._save_json(self.metadata_cache_path, self._metadata)
+
+            self._worksheets[key] = worksheet
+            return worksheet
+
+    def invalidate_metadata(self, spreadsheet_id: str, sheet_name: str):
+        """저장된 워크시트 메타데이터 삭제 (시트 이름 변경/삭제 시 다음 open_worksheet에서 다시 조회)"""
+        key = f"{spreadsheet_id}/{sheet_name}"
+        with self._lock:
+            self._worksheets.pop(key, None)
+            if self._metadata.pop(key, None) is not None:
+                self._save_json(self.metadata_cache_path, self._metadata)
+
+    def stats(self) -> Dict[str, int]:
+        """토큰 갱신/재사용, 메타데이터 조회/재사용, 실제 HTTP 연결 및 요청 수"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['connections'] = 0
+            stats['http_requests'] = 0
+            if self._session is not None:
+                # 같은 어댑터가 https://, http:// 양쪽에 연결되어 있으므로 한 번씩만 셈
+                adapters = {id(adapter): adapter for adapter in self._session.adapters.values()}
+                for adapter in adapters.values():
+                    pools = adapter.poolmanager.pools
+                    for pool_key in pools.keys():
+                        pool = pools[pool_key]
+                        stats['connections'] += pool.num_connections
+                        stats['http_requests'] += pool.num_requests
+            return stats
+
+    def close(self):
+        """HTTP 세션 종료"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+                self._client = None
+                self._worksheets.clear()
+
+    def _restore_token(self, credentials: Credentials):
+        """저장된 토큰이 만료 전이면 인증 정보에 채워 OAuth 교환 생략"""
+        cached = self._load_json(self.token_cache_path).get(credentials.service_account_email)
+        if not cached:
+            return
+
+        expiry = datetime.fromisoformat(cached['expiry'])
+        # google-auth는 만료 시각을 시간대 없는 UTC로 다룸
+        if expiry - TOKEN_EXPIRY_MARGIN <= datetime.now(timezone.utc).replace(tzinfo=None):
+            return
+
+        credentials.token = cached['token']
+        credentials.expiry = expiry
+        self._stats['token_cache_hits'] += 1
+
+    def _track_refresh(self, credentials: Credentials):
+        """토큰 갱신 시 횟수를 세고 새 토큰을 파일에 저장"""
+        refresh = credentials.refresh
+
+        def refresh_and_save(request):
+            refresh(request)
+            with self._lock:
+                self._stats['token_refreshes'] += 1
+                if self.token_cache_path and credentials.expiry:
+                    tokens = self._load_json(self.token_cache_path)
+                    tokens[credentials.service_account_email] = {
+                        'token': credentials.token,
+                        'expiry': credentials.expiry.isoformat()
+                    }
+                    self._save_json(self.token_cache_path, tokens, private=True)
+
+        credentials.refresh = refresh_and_save
+
+    @staticmethod
+    def _load_json(path: Optional[str]) -> Dict:
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_json(path: Optional[str], data: Dict, private: bool = False):
+        """임시 파일에 쓴 뒤 교체 (private=True면 소유자만 읽을 수 있게 저장)"""
+        if not path:
+            return
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                if private:
+                    os.chmod(temp_path, 0o600)
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"⚠️ 캐시 파일 저장 실패: {str(e)}")
+
+_factories: Dict[str, SheetsClientFactory] = {}
+_factories_lock = threading.Lock()
+
+def get_client_factory(credentials_path: str, **kwargs) -> SheetsClientFactory:
+    """인증 파일별로 프로세스 전체에서 공유하는 클라이언트 생성기"""
+    with _factories_lock:
+        factory = _factories.get(credentials_path)
+        if factory is None:
+            factory = SheetsClientFactory(credentials_path, **kwargs)
+            _factories[credentials_path] = factory
+        return factory
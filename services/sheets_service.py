@@ -1,46 +1,73 @@
-import gspread
 import re
 from datetime import datetime, timedelta
-from google.oauth2.service_account import Credentials
-from typing import List
+from typing import List, Optional
 from models.spreadsheet_row import SpreadsheetRow
+from services.row_locator import RowLocator
+from services.rate_limiter import RateLimitScheduler, get_scheduler
+from services.sheets_client_factory import SheetsClientFactory, get_client_factory, is_stale_worksheet_error
+from services.instrumentation import get_instrumentation
+
+# 작성자·주 행 찾기에서 스냅샷을 다시 갱신하지 않고 쓰는 시간(초) (이 프로그램이 기록한 행은 즉시 반영됨)
+SNAPSHOT_LOOKUP_MAX_AGE = 60
 
 class SheetsService:
     """Google Sheets API 처리 서비스"""
     
-    def __init__(self, credentials_path: str, spreadsheet_id: str, sheet_name: str):
+    def __init__(self, credentials_path: str, spreadsheet_id: str, sheet_name: str,
+                 row_cursor_path: Optional[str] = None, scheduler: Optional[RateLimitScheduler] = None,
+                 client_factory: Optional[SheetsClientFactory] = None, snapshot_path: Optional[str] = None,
+                 revalidate_rows: bool = False):
         self.credentials_path = credentials_path
         self.spreadsheet_id = spreadsheet_id
         self.sheet_name = sheet_name
+        self.row_cursor_path = row_cursor_path
+        self.snapshot_path = snapshot_path  # 지정 시 A/B/I/L/N열과 O열 해시를 로컬 스냅샷으로 조회
+        self.snapshot = None
+        self.revalidate_rows = revalidate_rows  # 오래 실행되는 경우 기록 전마다 빈 행 캐시를 시트와 다시 확인
+        self.write_request_count = 0  # 값 쓰기 API 요청 횟수
+        self.scheduler = scheduler or get_scheduler()  # 모든 Sheets 호출은 요청 한도를 거침
+        self.client_factory = client_factory  # 지정하지 않으면 인증 파일별 공용 생성기 사용
         self._setup_client()
     
     def _setup_client(self):
-        """Google Sheets 클라이언트 설정"""
-        scope = [
-            'https://spreadsheets.google.com/feeds',
-            'https://www.googleapis.com/auth/drive'
-        ]
-        
-        creds = Credentials.from_service_account_file(
-            self.credentials_path, 
-            scopes=scope
+        """Google Sheets 클라이언트 설정 (인증 정보, HTTP 세션, 워크시트 메타데이터는 생성기에서 재사용)"""
+        if self.client_factory is None:
+            self.client_factory = get_client_factory(self.credentials_path, scheduler=self.scheduler)
+        
+        self.client = self.client_factory.client()
+        self.worksheet = self.client_factory.open_worksheet(self.spreadsheet_id, self.sheet_name)
+        self.spreadsheet = self.worksheet.spreadsheet
+        if self.snapshot_path:
+            # numpy는 스냅샷을 쓸 때만 불러옴
+            from services.sheet_snapshot import SheetSnapshot
+            self.snapshot = SheetSnapshot(self.snapshot_path, self.worksheet, self.scheduler)
+        self.row_locator = RowLocator(
+            self.worksheet,
+            cursor_path=self.row_cursor_path,
+            cursor_key=f"{self.spreadsheet_id}/{self.sheet_name}",
+            scheduler=self.scheduler,
+            revalidate=self.revalidate_rows,
+            snapshot=self.snapshot
         )
+    
+    def _retry_on_stale_worksheet(self, operation):
+        """operation 실행 (저장된 워크시트 메타데이터가 맞지 않으면 지우고 워크시트를 다시 열어 한 번만 재시도)
         
-        self.client = gspread.authorize(creds)
-        self.spreadsheet = self.client.open_by_key(self.spreadsheet_id)
-        self.worksheet = self.spreadsheet.worksheet(self.sheet_name)
+        시트 이름이 바뀌거나 삭제된 경우 메타데이터 캐시 유효 시간(24시간)이 지날 때까지 모든 기록이 실패하지 않도록 합니다.
+        """
+        try:
+            return operation()
+        except Exception as e:
+            if not is_stale_worksheet_error(e):
+                raise
+            print(f"⚠️ 워크시트 정보가 바뀌어 다시 조회합니다: {self.sheet_name} ({str(e)})")
+            self.client_factory.invalidate_metadata(self.spreadsheet_id, self.sheet_name)
+            self._setup_client()
+            return operation()
     
     def find_first_empty_row(self) -> int:
-        """첫 번째 빈 행 찾기"""
-        all_values = self.worksheet.get_all_values()
-        
-        for i, row in enumerate(all_values, 1):
-            # A열이 비어있으면 빈 행으로 판단
-            if not row or not row[0].strip():
-                return i
-        
-        # 모든 행이 차있으면 다음 행 반환
-        return len(all_values) + 1
+        """첫 번째 빈 행 찾기 (A열이 비어있으면 빈 행으로 판단)"""
+        return self.row_locator.find_empty_rows(1)[0]
     
     def _get_friday_of_week(self) -> str:
         """해당 주의 금요일 날짜를 YYYY-MM-DD 형식으로 반환"""
@@ -72,42 +99,158 @@ class SheetsService:
         title = f"-{year} {month}월 {week_number}주차({user_name})"
         return f"{title}\n{cleaned_message}"
     
-    def append_row(self, data):
-        """빈 행에 필요한 열만 데이터 입력 (A, B, I, L, N, O열)"""
+    def find_empty_rows(self, count: int) -> List[int]:
+        """A열이 비어있는 행 번호를 위에서부터 count개 찾기"""
+        with get_instrumentation().stage('sheets_scan'):
+            return self.row_locator.find_empty_rows(count)
+    
+    def _build_column_data(self, data) -> dict:
+        """SpreadsheetRow 또는 dict를 열별 데이터로 변환"""
+        # SpreadsheetRow 객체인지 dict인지 확인하여 처리
+        if isinstance(data, SpreadsheetRow):
+            # SpreadsheetRow 객체인 경우
+            return data.get_column_data()
+        
+        # dict인 경우 (기존 방식 호환)
+        return {
+            'A': data["slack_user_name"],                    # A열: 사용자명
+            'B': self._get_friday_of_week(),                 # B열: 해당 주 금요일
+            'I': data["onleaf_simple_ratio"],                # I열: 온리프/심플 비율
+            'L': data["leshine_ratio"],                      # L열: 르샤인 비율
+            'N': data["oblible_ratio"],                      # N열: 오블리브 비율
+            'O': self._format_message_content(               # O열: 제목 + 원본 메시지
+                data["slack_user_name"], 
+                data["slack_message_content"]
+            )
+        }
+    
+    def _build_value_ranges(self, target_rows: List[int], rows: List) -> List[dict]:
+        """행 번호별 열 데이터를 batch_update 요청 범위 목록으로 변환
+        
+        모든 행의 데이터를 먼저 만든 뒤 요청을 보내므로, 변환 중 오류가 나면 아무것도 기록되지 않습니다.
+        """
+        value_ranges = []
+        for target_row, data in zip(target_rows, rows):
+            for column, value in self._build_column_data(data).items():
+                if value:  # 값이 있는 경우만 업데이트
+                    value_ranges.append({
+                        'range': f"{column}{target_row}",
+                        'values': [[value]]
+                    })
+        return value_ranges
+    
+    def _write_value_ranges(self, value_ranges: List[dict]):
+        """떨어져 있는 셀들을 한 번의 values.batchUpdate 요청으로 기록 (요청 단위로 전부 반영되거나 전부 실패)"""
+        if not value_ranges:
+            return
+        with get_instrumentation().stage('sheets_write'):
+            self.scheduler.call('sheets:write', self.worksheet.batch_update, value_ranges)
+        self.write_request_count += 1
+    
+    def append_rows(self, rows: List) -> List[int]:
+        """여러 행을 빈 행에 한 번의 batch_update 요청으로 입력
+        
+        Returns:
+            각 행이 기록된 행 번호 목록 (입력 순서와 동일)
+        """
+        if not rows:
+            return []
+        
+        def append():
+            target_rows = self.find_empty_rows(len(rows))
+            self._write_value_ranges(self._build_value_ranges(target_rows, rows))
+            return target_rows
+        
         try:
-            # 첫 번째 빈 행 찾기
-            target_row = self.find_first_empty_row()
+            target_rows = self._retry_on_stale_worksheet(append)
+            self.row_locator.mark_written(target_rows)
+            self._record_snapshot(target_rows, rows)
             
-            # SpreadsheetRow 객체인지 dict인지 확인하여 처리
-            if isinstance(data, SpreadsheetRow):
-                # SpreadsheetRow 객체인 경우
-                column_data = data.get_column_data()
-            else:
-                # dict인 경우 (기존 방식 호환)
-                column_data = {
-                    'A': data["slack_user_name"],                    # A열: 사용자명
-                    'B': self._get_friday_of_week(),                 # B열: 해당 주 금요일
-                    'I': data["onleaf_simple_ratio"],                # I열: 온리프/심플 비율
-                    'L': data["leshine_ratio"],                      # L열: 르샤인 비율
-                    'N': data["oblible_ratio"],                      # N열: 오블리브 비율
-                    'O': self._format_message_content(               # O열: 제목 + 원본 메시지
-                        data["slack_user_name"], 
-                        data["slack_message_content"]
-                    )
-                }
+            print(f"{len(rows)}개 행이 {target_rows[0]}~{target_rows[-1]}행 범위에 추가되었습니다.")
+            return target_rows
             
-            # 각 열별로 개별 업데이트
-            for column, value in column_data.items():
-                if value:  # 값이 있는 경우만 업데이트
-                    range_name = f"{column}{target_row}"
-                    self.worksheet.update(range_name, [[value]])
+        except Exception as e:
+            raise Exception(f"Google Sheets 업데이트 오류: {str(e)}")
+    
+    def append_row(self, data) -> int:
+        """빈 행에 필요한 열만 데이터 입력 (A, B, I, L, N, O열)
+        
+        모든 열을 한 번의 요청으로 기록하므로 행이 일부만 입력되는 일이 없습니다.
+        """
+        def append():
+            # 첫 번째 빈 행 찾기
+            target_row = self.find_first_empty_row()
+            self._write_value_ranges(self._build_value_ranges([target_row], [data]))
+            return target_row
+        
+        try:
+            column_data = self._build_column_data(data)
+            target_row = self._retry_on_stale_worksheet(append)
+            self.row_locator.mark_written([target_row])
+            self._record_snapshot([target_row], [data])
             
             print(f"데이터가 {target_row}행에 성공적으로 추가되었습니다.")
             print(f"업데이트된 열: {', '.join(column_data.keys())}")
+            return target_row
+            
+        except Exception as e:
+            raise Exception(f"Google Sheets 업데이트 오류: {str(e)}")
+    
+    def update_rows(self, row_numbers: List[int], rows: List):
+        """이미 기록된 행들을 한 번의 batch_update 요청으로 덮어쓰기 (값이 있는 열만)"""
+        if not rows:
+            return
+        
+        try:
+            value_ranges = self._build_value_ranges(row_numbers, rows)
+            self._retry_on_stale_worksheet(lambda: self._write_value_ranges(value_ranges))
+            self._record_snapshot(row_numbers, rows)
+            print(f"{len(rows)}개 행이 갱신되었습니다: {', '.join(map(str, row_numbers))}행")
             
         except Exception as e:
             raise Exception(f"Google Sheets 업데이트 오류: {str(e)}")
     
+    def update_row(self, row_number: int, data):
+        """이미 기록된 행 하나를 덮어쓰기"""
+        self.update_rows([row_number], [data])
+    
+    def _record_snapshot(self, row_numbers: List[int], rows: List):
+        """기록한 행을 로컬 스냅샷에 반영 (스냅샷을 쓰는 경우)"""
+        if self.snapshot is not None:
+            self.snapshot.record_rows(row_numbers, [self._build_column_data(data) for data in rows])
+    
+    def find_row(self, author_name: str, friday_date: str) -> Optional[int]:
+        """작성자·주(금요일 날짜) 보고서가 기록된 행 번호
+        
+        스냅샷을 쓰는 경우 마지막 갱신 후 SNAPSHOT_LOOKUP_MAX_AGE초가 지났을 때만 끝부분을 읽어 갱신하고 스냅샷에서 찾습니다.
+        """
+        if self.snapshot is not None:
+            self.snapshot.ensure_fresh(SNAPSHOT_LOOKUP_MAX_AGE)
+            return self.snapshot.find(author_name, friday_date)
+        for row_number, row_author, row_date in self.read_index_rows():
+            if (row_author, row_date) == (author_name, friday_date):
+                return row_number
+        return None
+    
+    def read_index_rows(self) -> List[tuple]:
+        """A(작성자), B(금요일 날짜)열만 읽어 (행 번호, 작성자, 금요일 날짜) 목록 반환 (머리글 행 제외)
+        
+        스냅샷을 쓰는 경우 끝부분만 읽어 스냅샷을 갱신한 뒤 스냅샷에서 반환합니다.
+        """
+        if self.snapshot is not None:
+            def read_snapshot():
+                self.snapshot.refresh()
+                return self.snapshot.index_rows()
+            return self._retry_on_stale_worksheet(read_snapshot)
+        values = self._retry_on_stale_worksheet(lambda: self.scheduler.call('sheets:read', self.worksheet.get, 'A2:B'))
+        rows = []
+        for row_number, cells in enumerate(values, start=2):
+            author_name = cells[0].strip() if cells else ''
+            friday_date = cells[1].strip() if len(cells) > 1 else ''
+            if author_name:
+                rows.append((row_number, author_name, friday_date))
+        return rows
+    
     def get_last_row_number(self) -> int:
-        """마지막 행 번호 반환"""
-        return len(self.worksheet.get_all_values())
+        """마지막 행 번호 반환 (A열 기준)"""
+        return self.row_locator.last_row_number()
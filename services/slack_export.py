@@ -0,0 +1,335 @@
+import io
+import json
+import os
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+from models.spreadsheet_row import SpreadsheetRow
+from services.batch_processor import BatchProcessor, BatchResult, ThreadRef
+from services.message_parser import WeeklyReportParser
+
+# 스트리밍 JSON 파서가 한 번에 읽는 글자 수
+READ_CHUNK_SIZE = 64 * 1024
+
+# 작성자를 users.json에서 찾지 못했을 때의 이름 (SlackService.get_user_name과 동일)
+UNKNOWN_AUTHOR = '홍길동'
+
+# 보고서가 아닌 시스템 메시지 (입장/퇴장, 채널 설정 변경 등)로 건너뛸 subtype 접두어
+SYSTEM_SUBTYPE_PREFIXES = ('channel_', 'group_', 'bot_add', 'bot_remove', 'pinned_item', 'tombstone')
+
+def iter_json_array(stream: TextIO, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Any]:
+    """JSON 배열 파일을 전체를 읽지 않고 원소 하나씩 반환
+
+    READ_CHUNK_SIZE 글자씩 읽어 json.JSONDecoder.raw_decode로 원소를 하나씩 해석하므로
+    메모리 사용량은 파일 크기가 아니라 가장 큰 원소 크기에 비례합니다.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    eof = False
+    expect = '['  # 다음에 올 수 있는 구분자: '[' (시작), 'value' (원소 또는 ']'), ',' (쉼표 또는 ']')
+
+    while True:
+        while position < len(buffer) and buffer[position] in ' \t\r\n':
+            position += 1
+
+        if position < len(buffer):
+            char = buffer[position]
+            if expect == '[':
+                if char != '[':
+                    raise ValueError("JSON 배열이 아닙니다.")
+                position += 1
+                expect = 'value'
+                continue
+            if char == ']':
+                return
+            if expect == ',':
+                if char != ',':
+                    raise ValueError(f"{position}번째 글자 근처에 쉼표가 필요합니다.")
+                position += 1
+                expect = 'value'
+                continue
+
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+            # 버퍼 끝에서 끝난 값은 잘렸을 수 있으므로 (예: 숫자) 다음 조각을 읽은 뒤 다시 해석
+            if end is not None and (end < len(buffer) or eof):
+                yield value
+                position = end
+                expect = ','
+                continue
+        elif eof:
+            raise ValueError("JSON 배열이 아닙니다." if expect == '[' else "JSON 배열이 닫히지 않았습니다.")
+
+        # 해석한 앞부분은 버리고 다음 조각 읽기
+        chunk = stream.read(chunk_size)
+        buffer = buffer[position:] + chunk
+        position = 0
+        eof = not chunk
+
+class SlackExport:
+    """Slack 워크스페이스 내보내기 (ZIP 파일 또는 압축을 푼 폴더)
+
+    내보내기는 users.json, channels.json(비공개 채널은 groups.json)과
+    `채널이름/YYYY-MM-DD.json` 형식의 날짜별 메시지 파일로 구성됩니다.
+    모든 파일은 iter_json_array로 스트리밍하여 읽습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.isdir(path):
+            self._zip = None
+        elif zipfile.is_zipfile(path):
+            self._zip = zipfile.ZipFile(path)
+        else:
+            raise Exception(f"Slack 내보내기 파일을 찾을 수 없습니다: {path}")
+        self._names = self._list_names()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._zip:
+            self._zip.close()
+
+    def open(self, name: str) -> TextIO:
+        """내보내기 안의 파일을 텍스트 스트림으로 열기 (ZIP은 압축을 풀면서 읽음)"""
+        if self._zip:
+            return io.TextIOWrapper(self._zip.open(self._prefix + name), encoding='utf-8')
+        return open(os.path.join(self.path, name), encoding='utf-8')
+
+    def iter_file(self, name: str) -> Iterator[Any]:
+        """JSON 배열 파일의 원소를 하나씩 반환 (파일이 없으면 빈 목록)"""
+        if name not in self._names:
+            return
+        with self.open(name) as stream:
+            yield from iter_json_array(stream)
+
+    def users(self) -> Dict[str, str]:
+        """users.json의 사용자 ID → 실명 (삭제된 사용자 포함, 지난 보고서 작성자일 수 있음)"""
+        names = {}
+        for member in self.iter_file('users.json'):
+            real_name = member.get('real_name') or (member.get('profile') or {}).get('real_name')
+            if real_name:
+                names[member['id']] = real_name
+        return names
+
+    def channels(self) -> Dict[str, str]:
+        """채널 폴더 이름 → 채널 ID (channels.json, groups.json)"""
+        channels = {}
+        for name in ('channels.json', 'groups.json'):
+            for channel in self.iter_file(name):
+                channels[channel['name']] = channel['id']
+        return channels
+
+    def day_files(self, channels: Optional[Sequence[str]] = None, oldest: Optional[str] = None,
+                  latest: Optional[str] = None) -> List[Tuple[str, str]]:
+        """(채널 폴더 이름, 파일 이름) 목록을 채널·날짜순으로 반환
+
+        oldest/latest(YYYY-MM-DD)를 지정하면 기간 밖 날짜 파일은 열지 않습니다.
+        """
+        files = []
+        for name in self._names:
+            folder, _, file_name = name.rpartition('/')
+            if not folder or '/' in folder or not file_name.endswith('.json'):
+                continue
+            date = file_name[:-len('.json')]
+            if channels and folder not in channels:
+                continue
+            if (oldest and date < oldest) or (latest and date > latest):
+                continue
+            files.append((folder, name))
+        files.sort()
+        return files
+
+    def _list_names(self) -> set:
+        """내보내기 루트 기준 파일 경로 집합 (ZIP 안에 최상위 폴더가 하나 더 있는 경우도 처리)"""
+        if not self._zip:
+            names = set()
+            for root, _, files in os.walk(self.path):
+                relative = os.path.relpath(root, self.path)
+                for file_name in files:
+                    names.add(file_name if relative == '.' else f"{relative.replace(os.sep, '/')}/{file_name}")
+            self._prefix = ''
+            return names
+
+        names = [name for name in self._zip.namelist() if not name.endswith('/')]
+        self._prefix = ''
+        if 'users.json' not in names:
+            prefixed = [name for name in names if name.endswith('/users.json') and name.count('/') == 1]
+            if prefixed:
+                self._prefix = prefixed[0][:-len('users.json')]
+        return {name[len(self._prefix):] for name in names if name.startswith(self._prefix)}
+
+@dataclass
+class ImportResult:
+    """내보내기 가져오기 결과 (보고서별 결과는 실패한 것만 보관)"""
+
+    files: int = 0                          # 읽은 날짜별 메시지 파일 수
+    messages: int = 0                       # 확인한 메시지 수
+    reports: int = 0                        # 주간업무 현황 메시지 수
+    written: int = 0
+    skipped: int = 0                        # 이미 기록되어 건너뛴 보고서
+    failures: List[BatchResult] = field(default_factory=list)
+    bad_files: List[str] = field(default_factory=list)  # 형식 오류로 읽지 못한 파일
+    elapsed: float = 0.0
+
+# 프로세스 풀 워커마다 한 번 만드는 파서
+_worker_parser: Optional[WeeklyReportParser] = None
+
+def _init_worker(hospitals: Sequence[str]):
+    global _worker_parser
+    _worker_parser = WeeklyReportParser(hospitals)
+
+def _parse_chunk(items: List[Tuple[str, str]],
+                 parser: Optional[WeeklyReportParser] = None) -> List[Tuple[Optional[Dict], str]]:
+    """(메시지 본문, 작성자) 목록을 파싱하여 (파싱 결과, 오류 메시지) 목록 반환 (워커에서는 워커 파서 사용)"""
+    parser = parser or _worker_parser
+    parsed = []
+    for message, author_name in items:
+        try:
+            parsed.append((parser.parse_message(message, author_name), ''))
+        except Exception as e:
+            parsed.append((None, str(e)))
+    return parsed
+
+class ExportImporter:
+    """Slack 내보내기의 주간업무 현황을 Slack API 없이 시트에 기록하는 과거 데이터 가져오기
+
+    - 날짜별 메시지 파일을 스트리밍으로 읽고, 작성자는 users.json으로 찾습니다 (users_info 호출 없음).
+    - 보고서를 chunk_size개씩 묶어 프로세스 풀(workers개)에서 파싱하고, 묶음마다
+      BatchProcessor.write_built로 한 번에 기록합니다. (색인 중복 확인과 쓰기 대기열 포함)
+    - 풀에 넣어 둔 묶음은 workers * 2개까지만 유지하므로 메시지가 많아도 메모리 사용량이 일정합니다.
+    - workers=0이면 현재 프로세스에서 파싱합니다.
+    """
+
+    def __init__(self, processor: BatchProcessor, workers: Optional[int] = None, chunk_size: int = 500):
+        self.processor = processor
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.chunk_size = chunk_size
+
+    def run(self, export: SlackExport, channels: Optional[Sequence[str]] = None,
+            oldest: Optional[str] = None, latest: Optional[str] = None) -> ImportResult:
+        """내보내기의 보고서 기록 (channels는 채널 폴더 이름, oldest/latest는 YYYY-MM-DD)"""
+        start = time.perf_counter()
+        result = ImportResult()
+        users = export.users()
+        channel_ids = export.channels()
+        refs = self._iter_reports(export, export.day_files(channels, oldest, latest), users, channel_ids, result)
+
+        seen = set()
+        if self.workers <= 0:
+            for chunk in _chunks(refs, self.chunk_size):
+                self._write_chunk(chunk, _parse_chunk(self._parse_items(chunk), self.processor.parser), seen, result)
+        else:
+            with ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                     initargs=(self.processor.parser.hospitals,)) as pool:
+                pending = deque()
+                for chunk in _chunks(refs, self.chunk_size):
+                    pending.append((chunk, pool.submit(_parse_chunk, self._parse_items(chunk))))
+                    if len(pending) >= self.workers * 2:
+                        chunk, future = pending.popleft()
+                        self._write_chunk(chunk, future.result(), seen, result)
+                while pending:
+                    chunk, future = pending.popleft()
+                    self._write_chunk(chunk, future.result(), seen, result)
+
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    def _iter_reports(self, export: SlackExport, files: Iterable[Tuple[str, str]], users: Dict[str, str],
+                      channel_ids: Dict[str, str], result: ImportResult) -> Iterator[ThreadRef]:
+        """날짜별 파일의 최상위 메시지 중 주간업무 현황을 ThreadRef로 하나씩 반환 (작성자 이름 포함)"""
+        for folder, name in files:
+            channel_id = channel_ids.get(folder, folder)
+            result.files += 1
+            try:
+                for message in export.iter_file(name):
+                    result.messages += 1
+                    if not _is_top_level(message):
+                        continue
+                    ref = self.processor.report_ref(channel_id, message)
+                    if not ref:
+                        continue
+                    ref.author_name = users.get(ref.user_id) or _profile_name(message)
+                    result.reports += 1
+                    # 색인상 이미 기록한 보고서는 파싱하지 않음
+                    skipped = self.processor.skip_known(ref)
+                    if skipped:
+                        result.skipped += 1
+                        continue
+                    yield ref
+            except ValueError as e:
+                print(f"⚠️ {name} 읽기 실패, 건너뜀: {e}")
+                result.bad_files.append(name)
+
+    def _parse_items(self, chunk: List[ThreadRef]) -> List[Tuple[str, str]]:
+        return [(ref.message, ref.author_name) for ref in chunk]
+
+    def _write_chunk(self, chunk: List[ThreadRef], parsed: List[Tuple[Optional[Dict], str]], seen: set,
+                     result: ImportResult):
+        """파싱한 묶음을 한 번에 기록하고 결과 집계"""
+        built = []
+        for ref, (parsed_data, error) in zip(chunk, parsed):
+            if parsed_data is None:
+                result.failures.append(BatchResult(ref=ref, success=False, error=error))
+                continue
+            batch_result = BatchResult(ref=ref, success=True, author_name=parsed_data['author_name'],
+                                       parsed_data=parsed_data)
+            built.append((batch_result, SpreadsheetRow.from_parsed_data(parsed_data)))
+
+        self.processor.write_built(built, seen)
+        for batch_result, _ in built:
+            if not batch_result.success:
+                result.failures.append(batch_result)
+            elif batch_result.duplicate == 'skipped':
+                result.skipped += 1
+            else:
+                result.written += 1
+
+def _is_top_level(message: Dict) -> bool:
+    """스레드 답글과 시스템 메시지를 제외한 최상위 메시지인지 확인"""
+    if message.get('type', 'message') != 'message' or 'ts' not in message:
+        return False
+    if str(message.get('subtype', '')).startswith(SYSTEM_SUBTYPE_PREFIXES):
+        return False
+    thread_ts = message.get('thread_ts')
+    return thread_ts is None or thread_ts == message['ts']
+
+def _profile_name(message: Dict) -> str:
+    """users.json에 없는 작성자는 메시지에 포함된 프로필 이름 사용"""
+    profile = message.get('user_profile') or {}
+    return profile.get('real_name') or UNKNOWN_AUTHOR
+
+def _chunks(items: Iterable, size: int) -> Iterator[List]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def format_import_result(result: ImportResult) -> str:
+    """가져오기 결과 요약 문자열"""
+    rate = result.messages / result.elapsed if result.elapsed else 0.0
+    lines = [
+        f"📦 내보내기 가져오기: 파일 {result.files}개 / 메시지 {result.messages:,}개 확인 ({rate:,.0f}개/초)",
+        f"   보고서 {result.reports}건 (기록 {result.written}, 건너뜀 {result.skipped}, 실패 {len(result.failures)})"
+    ]
+    for failure in result.failures:
+        lines.append(f"❌ {failure.ref.channel_id} {failure.ref.thread_ts} → {failure.error}")
+    for name in result.bad_files:
+        lines.append(f"⚠️ {name} → JSON 형식 오류로 건너뜀")
+    return "\n".join(lines)
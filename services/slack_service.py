@@ -1,48 +1,207 @@
+import threading
+import time
+from collections import OrderedDict
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
+from services.user_cache import UserDirectoryCache
+from services.rate_limiter import RateLimitScheduler, get_scheduler, slack_bucket
+from services.instrumentation import get_instrumentation
 
 class SlackService:
-    """Slack API 처리 서비스"""
+    """Slack API 처리 서비스
     
-    def __init__(self, token: str):
-        self.client = WebClient(token=token)
+    부모 메시지는 본문과 작성자 조회가 한 번의 조회를 공유하도록 잠깐만 캐시합니다.
+    (최대 parent_cache_size개, parent_cache_ttl초 - 수정·재제출된 보고서의 옛 본문을 쓰지 않도록)
+    """
     
-    def get_thread_messages(self, channel_id: str, thread_ts: str) -> List[Dict]:
-        """스레드의 모든 메시지 가져오기"""
+    def __init__(self, token: str, user_cache: Optional[UserDirectoryCache] = None,
+                 scheduler: Optional[RateLimitScheduler] = None, base_url: Optional[str] = None,
+                 parent_cache_size: int = 128, parent_cache_ttl: float = 60.0):
+        client_kwargs = {'token': token}
+        if base_url:
+            client_kwargs['base_url'] = base_url  # 예: 부하 시험용 가짜 Slack 서버
+        self.client = WebClient(**client_kwargs)
+        self.user_cache = user_cache
+        self.scheduler = scheduler or get_scheduler()
+        self.parent_cache_size = parent_cache_size
+        self.parent_cache_ttl = parent_cache_ttl
+        self._parent_messages: "OrderedDict[tuple, tuple]" = OrderedDict()  # (채널, 스레드TS) → (부모 메시지, 저장 시각)
+        self._parent_lock = threading.Lock()  # 상주 서비스의 여러 워커가 함께 사용
+    
+    def _call(self, method: str, **kwargs):
+        """메서드 등급별 요청 한도와 재시도를 적용해 Slack API 호출"""
+        return self.scheduler.call(slack_bucket(method), getattr(self.client, method), **kwargs)
+    
+    def get_parent_message(self, channel_id: str, thread_ts: str) -> Optional[Dict]:
+        """스레드의 부모 메시지만 가져오기 (캐시 유효 시간 안의 같은 스레드는 한 번만 조회)"""
+        key = (channel_id, thread_ts)
+        with self._parent_lock:
+            cached = self._parent_messages.get(key)
+            if cached is not None and time.monotonic() - cached[1] <= self.parent_cache_ttl:
+                self._parent_messages.move_to_end(key)
+                return cached[0]
+        
         try:
-            response = self.client.conversations_replies(
+            # limit=1이면 답글 없이 부모 메시지만 반환됨
+            response = self._call(
+                'conversations_replies',
                 channel=channel_id,
-                ts=thread_ts
+                ts=thread_ts,
+                limit=1
             )
-            return response['messages']
         except SlackApiError as e:
             raise Exception(f"Slack API 오류: {e.response['error']}")
+        messages = response['messages']
+        message = messages[0] if messages else None
+        self._remember_parent(key, message)
+        return message
+    
+    def forget_parent_message(self, channel_id: str, thread_ts: str):
+        """캐시된 부모 메시지 삭제 (보고서 처리가 끝났거나 메시지가 수정·재제출된 경우)"""
+        with self._parent_lock:
+            self._parent_messages.pop((channel_id, thread_ts), None)
+    
+    def _remember_parent(self, key: tuple, message: Optional[Dict]):
+        """부모 메시지 캐시 (최대 개수를 넘으면 가장 오래 사용하지 않은 항목 제거)"""
+        with self._parent_lock:
+            self._parent_messages[key] = (message, time.monotonic())
+            self._parent_messages.move_to_end(key)
+            while len(self._parent_messages) > self.parent_cache_size:
+                self._parent_messages.popitem(last=False)
+    
+    def get_thread_messages(self, channel_id: str, thread_ts: str) -> List[Dict]:
+        """스레드의 모든 메시지 가져오기 (답글이 많으면 커서로 페이지 순회)"""
+        messages = []
+        cursor = None
+        while True:
+            kwargs = {'channel': channel_id, 'ts': thread_ts, 'limit': 200}
+            if cursor:
+                kwargs['cursor'] = cursor
+            
+            try:
+                response = self._call('conversations_replies', **kwargs)
+            except SlackApiError as e:
+                raise Exception(f"Slack API 오류: {e.response['error']}")
+            
+            messages.extend(response['messages'])
+            
+            cursor = (response.get('response_metadata') or {}).get('next_cursor')
+            if not response.get('has_more') or not cursor:
+                break
+        
+        if messages:
+            self._remember_parent((channel_id, thread_ts), messages[0])
+        return messages
     
     def get_message_content(self, channel_id: str, thread_ts: str) -> str:
         """스레드의 첫 번째 메시지 내용 가져오기"""
-        messages = self.get_thread_messages(channel_id, thread_ts)
-        if messages:
-            return messages[0].get('text', '')
+        with get_instrumentation().stage('slack_fetch'):
+            message = self.get_parent_message(channel_id, thread_ts)
+        if message:
+            return message.get('text', '')
         return ""
     
     def get_message_author(self, channel_id: str, thread_ts: str) -> str:
         """메시지 작성자 이름 가져오기"""
         try:
-            messages = self.get_thread_messages(channel_id, thread_ts)
-            if messages:
-                user_id = messages[0].get('user')
-                if user_id:
-                    user_info = self.client.users_info(user=user_id)
-                    return user_info['user'].get('real_name', '홍길동')
+            with get_instrumentation().stage('slack_author'):
+                message = self.get_parent_message(channel_id, thread_ts)
+                if message:
+                    user_id = message.get('user')
+                    if user_id:
+                        return self.get_user_name(user_id)
             return '홍길동'
         except SlackApiError:
             return '홍길동'
     
+    def get_user_name(self, user_id: str) -> str:
+        """사용자 ID로 실명 가져오기 (캐시에 없거나 만료된 경우에만 users_info 호출)"""
+        if self.user_cache:
+            cached_name = self.user_cache.get(user_id)
+            if cached_name:
+                return cached_name
+        
+        try:
+            user_info = self._call('users_info', user=user_id)
+        except SlackApiError:
+            return '홍길동'
+        
+        real_name = user_info['user'].get('real_name')
+        if not real_name:
+            return '홍길동'
+        
+        if self.user_cache:
+            self.user_cache.put(user_id, real_name)
+        return real_name
+    
+    def warm_user_cache(self) -> int:
+        """users_list를 페이지 단위로 한 번 순회하여 사용자 캐시를 미리 채우기
+        
+        Returns:
+            캐시에 저장한 사용자 수
+        """
+        if not self.user_cache:
+            return 0
+        
+        names = {}
+        cursor = None
+        while True:
+            kwargs = {'limit': 200}
+            if cursor:
+                kwargs['cursor'] = cursor
+            
+            try:
+                response = self._call('users_list', **kwargs)
+            except SlackApiError as e:
+                raise Exception(f"Slack API 오류: {e.response['error']}")
+            
+            for member in response['members']:
+                real_name = member.get('real_name') or (member.get('profile') or {}).get('real_name')
+                if real_name and not member.get('deleted'):
+                    names[member['id']] = real_name
+            
+            cursor = (response.get('response_metadata') or {}).get('next_cursor')
+            if not cursor:
+                break
+        
+        self.user_cache.update(names)
+        return len(names)
+    
+    def iter_channel_messages(self, channel_id: str, oldest: Optional[str] = None,
+                              latest: Optional[str] = None) -> Iterator[Dict]:
+        """채널 기록(conversations_history)을 페이지 단위로 순회하며 메시지 반환"""
+        cursor = None
+        while True:
+            kwargs = {'channel': channel_id, 'limit': 200}
+            if oldest:
+                kwargs['oldest'] = oldest
+            if latest:
+                kwargs['latest'] = latest
+            if cursor:
+                kwargs['cursor'] = cursor
+            
+            try:
+                response = self._call('conversations_history', **kwargs)
+            except SlackApiError as e:
+                raise Exception(f"Slack API 오류: {e.response['error']}")
+            
+            for message in response['messages']:
+                yield message
+            
+            cursor = (response.get('response_metadata') or {}).get('next_cursor')
+            if not response.get('has_more') or not cursor:
+                break
+    
+    def post_message(self, channel_id: str, text: str):
+        """채널에 메시지 전송 (실패 시 SlackApiError)"""
+        return self._call('chat_postMessage', channel=channel_id, text=text)
+    
     def send_error_notification(self, channel_id: str, error_message: str):
         """에러 알림 전송"""
         try:
-            self.client.chat_postMessage(
+            self._call(
+                'chat_postMessage',
                 channel=channel_id,
                 text=f"⚠️ 오류 발생: {error_message}"
             )
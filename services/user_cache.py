@@ -0,0 +1,91 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+class UserDirectoryCache:
+    """Slack 사용자 ID → 실명 캐시 (TTL + LRU, 로컬 파일에 저장)"""
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: float = 7 * 24 * 3600, max_entries: int = 1000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # 사용자 ID → (실명, 저장 시각)
+        self._lock = threading.RLock()  # 상주 서비스의 여러 워커가 함께 사용
+        self._load()
+
+    def get(self, user_id: str) -> Optional[str]:
+        """캐시된 실명 반환 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            name, stored_at = entry
+            if time.time() - stored_at > self.ttl_seconds:
+                del self._entries[user_id]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return name
+
+    def put(self, user_id: str, name: str, save: bool = True):
+        """실명 저장 (최대 개수를 넘으면 가장 오래 사용하지 않은 항목 제거)"""
+        with self._lock:
+            self._entries[user_id] = (name, time.time())
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if save:
+                self.save()
+
+    def update(self, names: Dict[str, str]):
+        """여러 사용자를 한 번에 저장"""
+        with self._lock:
+            for user_id, name in names.items():
+                self.put(user_id, name, save=False)
+            self.save()
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 적중/실패 횟수"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+    def save(self):
+        """캐시를 파일에 저장 (가장 오래 사용하지 않은 항목부터 LRU 순서대로, 저장 실패는 경고만 출력)"""
+        if not self.path:
+            return
+
+        with self._lock:
+            data = {user_id: [name, stored_at] for user_id, (name, stored_at) in self._entries.items()}
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"⚠️ 사용자 캐시 파일 저장 실패: {str(e)}")
+
+    def _load(self):
+        """파일에서 캐시 읽기 (손상된 파일은 무시)"""
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        # 파일에 저장된 LRU 순서 그대로 복원
+        for user_id, (name, stored_at) in data.items():
+            self._entries[user_id] = (name, stored_at)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
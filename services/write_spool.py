@@ -0,0 +1,173 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from typing import Callable, List, Optional, Tuple
+from models.spreadsheet_row import SpreadsheetRow
+
+class SpoolFlushError(Exception):
+    """대기열 기록 중 오류 (오류 전까지 기록된 행은 written에 담김)"""
+
+    def __init__(self, message: str, written: List[Tuple[Optional[str], int]]):
+        super().__init__(message)
+        self.written = written
+
+class WriteSpool:
+    """Sheets 쓰기 대기열 (write-behind)
+
+    기록할 행을 먼저 로컬 SQLite(WAL) 파일에 저장하고, 건수(max_batch) 또는 시간(flush_interval)
+    기준으로 모아서 SheetsService.append_rows 한 번으로 기록합니다.
+    기록 전에 프로세스가 종료되어도 다음 실행에서 남은 행을 다시 기록합니다. (최소 한 번 기록)
+    시트 라우터(SheetRouter)를 쓰는 경우 행마다 기록할 시트 키(route)를 함께 저장하고, 시트별로 묶어 기록합니다.
+    """
+
+    def __init__(self, path: str, sheets_service, max_batch: int = 50, flush_interval: float = 5.0,
+                 on_flushed: Optional[Callable[[List[Tuple[Optional[str], int]]], None]] = None):
+        self.path = path
+        self.sheets_service = sheets_service
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.on_flushed = on_flushed  # 기록 완료 시 [(키, 행 번호), ...]로 호출
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS pending_rows (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT,
+                row_json TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT
+            )
+        """)
+        columns = [column[1] for column in self._conn.execute("PRAGMA table_info(pending_rows)")]
+        if 'route' not in columns:
+            # 이전 버전에서 만든 대기열 파일 (route가 없는 행은 기본 시트에 기록)
+            self._conn.execute("ALTER TABLE pending_rows ADD COLUMN route TEXT")
+        self._conn.commit()
+
+    def enqueue(self, row: SpreadsheetRow, key: Optional[str] = None, route: Optional[str] = None) -> int:
+        """기록할 행을 대기열에 저장 (저장 즉시 디스크에 반영)
+
+        같은 키의 행이 아직 대기 중이면 새 행으로 교체하여 중복 기록을 막습니다.
+        """
+        with self._lock:
+            if key is not None:
+                self._conn.execute("DELETE FROM pending_rows WHERE key = ?", (key,))
+            cursor = self._conn.execute(
+                "INSERT INTO pending_rows (key, row_json, created_at, route) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(asdict(row), ensure_ascii=False), time.time(), route)
+            )
+            self._conn.commit()
+            entry_id = cursor.lastrowid
+
+        if self.pending_count() >= self.max_batch:
+            self._wake.set()
+        return entry_id
+
+    def pending_count(self) -> int:
+        """기록 대기 중인 행 수"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pending_rows").fetchone()[0]
+
+    def flush(self) -> List[Tuple[Optional[str], int]]:
+        """대기 중인 행을 max_batch개씩 모아 기록 (시트가 여러 개면 시트마다 한 번의 요청)
+
+        Returns:
+            기록된 행의 (키, 행 번호) 목록
+
+        Raises:
+            SpoolFlushError: 기록 실패 시 (실패한 행은 대기열에 남음)
+        """
+        written = []
+        with self._lock:
+            while True:
+                entries = self._conn.execute(
+                    "SELECT id, key, row_json, route FROM pending_rows ORDER BY id LIMIT ?",
+                    (self.max_batch,)
+                ).fetchall()
+                if not entries:
+                    break
+
+                groups = {}
+                for entry in entries:
+                    groups.setdefault(entry[3], []).append(entry)
+                for route, group in groups.items():
+                    written.extend(self._flush_group(group, route, written))
+
+        return written
+
+    def _flush_group(self, entries: List[tuple], route: Optional[str],
+                     written: List[Tuple[Optional[str], int]]) -> List[Tuple[Optional[str], int]]:
+        """같은 시트에 기록할 행들을 한 번의 요청으로 기록하고 대기열에서 삭제"""
+        rows = [SpreadsheetRow(**json.loads(row_json)) for _, _, row_json, _ in entries]
+        ids = [(entry[0],) for entry in entries]
+
+        try:
+            if route is None:
+                row_numbers = self.sheets_service.append_rows(rows)
+            else:
+                row_numbers = self.sheets_service.append_rows(rows, route=route)
+        except Exception as e:
+            self._conn.executemany(
+                "UPDATE pending_rows SET attempts = attempts + 1, last_error = ? WHERE id = ?",
+                [(str(e), entry_id) for (entry_id,) in ids]
+            )
+            self._conn.commit()
+            raise SpoolFlushError(str(e), written) from e
+
+        self._conn.executemany("DELETE FROM pending_rows WHERE id = ?", ids)
+        self._conn.commit()
+
+        batch = [(entry[1], row_number) for entry, row_number in zip(entries, row_numbers)]
+        if self.on_flushed:
+            self.on_flushed(batch)
+        return batch
+
+    def start(self):
+        """백그라운드 기록 스레드 시작 (이전 실행에서 남은 행도 바로 기록)"""
+        if self._thread:
+            return
+        self._stopping.clear()
+        self._wake.set()
+        self._thread = threading.Thread(target=self._run, name='write-spool', daemon=True)
+        self._thread.start()
+
+    def stop(self, flush: bool = True):
+        """백그라운드 스레드 종료 (flush=True면 남은 행을 마지막으로 기록 시도)"""
+        if self._thread:
+            self._stopping.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+
+        if flush:
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"⚠️ 대기열 기록 실패, 다음 실행에서 재시도합니다: {str(e)}")
+
+    def close(self):
+        """SQLite 연결 닫기"""
+        with self._lock:
+            self._conn.close()
+
+    def _run(self):
+        """건수 또는 시간 기준으로 대기열 기록"""
+        while not self._stopping.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._stopping.is_set():
+                break
+
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"⚠️ 대기열 기록 실패 ({self.pending_count()}건 대기 중): {str(e)}")
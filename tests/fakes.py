@@ -0,0 +1,71 @@
+import threading
+
+SAMPLE_MESSAGE = """2025년 9월 1주차 주간업무 현황
+기간 : 25. 9. 1 ~ 25. 9. 5
+
+금주 완료 작업 소요시간 합계(시간)
+온리프 : 1
+르샤인 : 2.5
+오블리브 : 48.5
+심플 : 0
+
+총합 : 52 시간"""
+
+class FakeSlackService:
+    """메시지 조회와 conversations_history 페이지 조회 횟수를 기록하는 가짜 Slack 서비스
+
+    distinct_users=True면 같은 주 보고서가 중복으로 걸러지지 않도록 채널 기록의 메시지마다 다른 작성자를 돌려줍니다.
+    """
+
+    def __init__(self, messages, author="슬랙사용자", page_size=2, distinct_users=False):
+        self.messages = dict(messages)  # ts → 본문
+        self.author = author
+        self.page_size = page_size
+        self.distinct_users = distinct_users
+        self.history_calls = 0
+        self.fetched = []
+
+    def get_message_content(self, channel_id, thread_ts):
+        self.fetched.append(thread_ts)
+        return self.messages.get(thread_ts, "")
+
+    def get_message_author(self, channel_id, thread_ts):
+        return self.author
+
+    def get_user_name(self, user_id):
+        return f"사용자-{user_id}"
+
+    def iter_channel_messages(self, channel_id, oldest=None, latest=None):
+        # oldest/latest는 Slack처럼 제외 조건, 최신 메시지부터 페이지 단위로 반환
+        timestamps = sorted((ts for ts in self.messages if (oldest is None or float(ts) > float(oldest)) and
+                             (latest is None or float(ts) < float(latest))), key=float, reverse=True)
+        for start in range(0, max(len(timestamps), 1), self.page_size):
+            self.history_calls += 1
+            for ts in timestamps[start:start + self.page_size]:
+                yield {'ts': ts, 'user': f"U{ts}" if self.distinct_users else 'U1', 'text': self.messages[ts]}
+
+class FakeSheetsService:
+    """기록한 행 묶음을 보관하는 가짜 Sheets 서비스 (fail이면 장애, 행 번호는 2행부터 이어서 부여)"""
+
+    def __init__(self, fail=False, error="Google Sheets 업데이트 오류: quota"):
+        self.fail = fail
+        self.error = error
+        self.append_calls = []
+        self.update_calls = []
+        self.rows = []  # 기록한 모든 행 (순서대로)
+        self._lock = threading.Lock()  # 상주 서비스의 여러 워커가 함께 사용
+
+    def append_rows(self, rows):
+        with self._lock:
+            if self.fail:
+                raise Exception(self.error)
+            self.append_calls.append(rows)
+            start = 2 + len(self.rows)
+            self.rows.extend(rows)
+            return list(range(start, start + len(rows)))
+
+    def append_row(self, row):
+        return self.append_rows([row])[0]
+
+    def update_rows(self, row_numbers, rows):
+        self.update_calls.append((row_numbers, rows))
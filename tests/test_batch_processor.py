@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+from services.batch_processor import BatchProcessor, ThreadRef, load_thread_file, format_report
+from services.ingestion_index import IngestionIndex
+from services.write_spool import WriteSpool
+from tests.fakes import SAMPLE_MESSAGE, FakeSheetsService, FakeSlackService
+
+class TestBatchProcessor(unittest.TestCase):
+    """일괄 처리기 테스트"""
+
+    def test_run_writes_all_rows_in_one_call(self):
+        """성공한 스레드는 한 번의 append_rows로 기록"""
+        slack = FakeSlackService({'1.1': SAMPLE_MESSAGE, '2.2': SAMPLE_MESSAGE, '3.3': ''})
+        sheets = FakeSheetsService()
+        processor = BatchProcessor(slack, sheets)
+
+        results = processor.run([
+            ThreadRef('C1', '1.1'),
+            ThreadRef('C1', '2.2', author_name='홍길동'),
+            ThreadRef('C1', '3.3'),
+        ])
+
+        self.assertEqual(len(sheets.append_calls), 1)
+        self.assertEqual(len(sheets.append_calls[0]), 2)
+
+        self.assertTrue(results[0].success)
+        self.assertEqual(results[0].author_name, '슬랙사용자')
+        self.assertEqual(results[0].row_number, 2)
+        self.assertEqual(results[1].author_name, '홍길동')
+        self.assertEqual(results[1].row_number, 3)
+        self.assertFalse(results[2].success)
+        self.assertIn('메시지 내용', results[2].error)
+
+    def test_write_failure_marks_parsed_threads_failed(self):
+        """일괄 기록 실패 시 모든 스레드가 실패로 보고됨"""
+        processor = BatchProcessor(FakeSlackService({'1.1': SAMPLE_MESSAGE}), FakeSheetsService(fail=True))
+
+        results = processor.run([ThreadRef('C1', '1.1')])
+
+        self.assertFalse(results[0].success)
+        self.assertIn('quota', results[0].error)
+        self.assertIn('실패 1건', format_report(results))
+
+    def test_write_failure_keeps_rows_in_spool(self):
+        """대기열 사용 시 기록 실패한 행은 대기열에 남아 다음 실행에서 기록됨"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sheets = FakeSheetsService(fail=True)
+            spool = WriteSpool(os.path.join(temp_dir, 'spool.db'), sheets)
+            processor = BatchProcessor(FakeSlackService({'1.1': SAMPLE_MESSAGE}), sheets, spool=spool)
+
+            results = processor.run([ThreadRef('C1', '1.1')])
+            self.assertFalse(results[0].success)
+            self.assertIn('대기열', results[0].error)
+            self.assertEqual(spool.pending_count(), 1)
+
+            sheets.fail = False
+            results = processor.run([ThreadRef('C1', '1.1')])
+            spool.close()
+
+        # 같은 스레드를 다시 처리해도 대기 중인 행을 교체하므로 한 행만 기록됨
+        self.assertTrue(results[0].success)
+        self.assertEqual(results[0].row_number, 2)
+        self.assertEqual(len(sheets.append_calls[-1]), 1)
+
+    def test_duplicates_skipped_with_index(self):
+        """색인에 있는 스레드는 Slack 조회 없이 건너뛰고, 같은 작성자·주의 다른 스레드도 건너뜀"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index = IngestionIndex(os.path.join(temp_dir, 'index.db'))
+            slack = FakeSlackService({'1.1': SAMPLE_MESSAGE, '2.2': SAMPLE_MESSAGE})
+            sheets = FakeSheetsService()
+            processor = BatchProcessor(slack, sheets, index=index)
+
+            first = processor.run([ThreadRef('C1', '1.1')])
+            slack.fetched.clear()
+            second = processor.run([ThreadRef('C1', '1.1'), ThreadRef('C1', '2.2')])
+            index.close()
+
+        self.assertEqual(first[0].row_number, 2)
+        self.assertEqual(len(sheets.append_calls), 1)
+        self.assertEqual([result.duplicate for result in second], ['skipped', 'skipped'])
+        self.assertEqual([result.row_number for result in second], [2, 2])
+        self.assertEqual(slack.fetched, ['2.2'])
+        self.assertIn('건너뜀', format_report(second))
+
+    def test_duplicates_updated_in_place(self):
+        """update 방식이면 기존 행을 한 번의 요청으로 갱신"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index = IngestionIndex(os.path.join(temp_dir, 'index.db'))
+            sheets = FakeSheetsService()
+            processor = BatchProcessor(FakeSlackService({'1.1': SAMPLE_MESSAGE}), sheets,
+                                       index=index, on_duplicate='update')
+
+            processor.run([ThreadRef('C1', '1.1')])
+            results = processor.run([ThreadRef('C1', '1.1'), ThreadRef('C1', '1.1')])
+            index.close()
+
+        self.assertEqual(len(sheets.append_calls), 1)
+        self.assertEqual(sheets.update_calls[0][0], [2])
+        self.assertEqual([result.duplicate for result in results], ['updated', 'skipped'])
+
+    def test_find_report_threads(self):
+        """채널 기록에서 주간업무 현황 메시지만 시간순으로 선택"""
+        slack = FakeSlackService({'2.0': SAMPLE_MESSAGE, '1.0': SAMPLE_MESSAGE, '3.0': '점심 뭐 먹나요'})
+        processor = BatchProcessor(slack, FakeSheetsService())
+
+        refs = processor.find_report_threads('C1')
+
+        self.assertEqual([ref.thread_ts for ref in refs], ['1.0', '2.0'])
+        self.assertEqual(refs[0].user_id, 'U1')
+        self.assertEqual(refs[0].message, SAMPLE_MESSAGE)
+
+    def test_load_thread_file(self):
+        """스레드 목록 파일 읽기"""
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write("# 3분기 백필\nC1 1.1\n\nC2 2.2 홍길동\n")
+            path = f.name
+
+        try:
+            refs = load_thread_file(path)
+        finally:
+            os.remove(path)
+
+        self.assertEqual(len(refs), 2)
+        self.assertEqual((refs[0].channel_id, refs[0].thread_ts, refs[0].author_name), ('C1', '1.1', None))
+        self.assertEqual(refs[1].author_name, '홍길동')
+
+if __name__ == '__main__':
+    unittest.main()
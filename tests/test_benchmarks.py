@@ -0,0 +1,49 @@
+import json
+import random
+import unittest
+from benchmarks.corpus import MALFORMED_KINDS, generate_corpus, generate_report
+from benchmarks.fakes import FakeWorksheet, InMemorySheetsService
+from benchmarks.run_benchmarks import BENCHMARKS, run_suite
+from models.spreadsheet_row import SpreadsheetRow
+from services.message_parser import WeeklyReportParser
+
+class TestBenchmarks(unittest.TestCase):
+    """벤치마크 말뭉치/실행기 테스트"""
+
+    def test_corpus_is_deterministic(self):
+        """같은 시드는 같은 말뭉치를 생성"""
+        self.assertEqual(generate_corpus(20, seed=3), generate_corpus(20, seed=3))
+        self.assertNotEqual(generate_corpus(20, seed=3), generate_corpus(20, seed=4))
+
+    def test_generated_report_parses(self):
+        """정상 메시지는 총합과 병원별 시간 합계가 일치"""
+        parser = WeeklyReportParser()
+        for message in generate_corpus(50, seed=1, malformed_ratio=0):
+            time_data = parser.parse_message(message)['time_data']
+            self.assertTrue(parser.is_weekly_report(message))
+            self.assertIn('총합', time_data)
+
+        # 깨진 메시지도 파서가 예외 없이 처리
+        rng = random.Random(0)
+        for kind in MALFORMED_KINDS:
+            parser.parse_message(generate_report(rng, kind))
+
+    def test_in_memory_sheets_service(self):
+        """메모리 워크시트에 행이 기록됨"""
+        worksheet = FakeWorksheet()
+        service = InMemorySheetsService(worksheet)
+        rows = [SpreadsheetRow(author_name=name, friday_date='2025-09-05') for name in ['가', '나']]
+
+        self.assertEqual(service.append_rows(rows), [2, 3])
+        self.assertEqual(worksheet.col_values(1), ['이름', '가', '나'])
+
+    def test_run_suite_returns_json_results(self):
+        """결과는 벤치마크·크기별로 JSON으로 저장 가능"""
+        report = run_suite([3], repeat=1)
+
+        self.assertEqual({item['name'] for item in report['results']}, set(BENCHMARKS))
+        self.assertTrue(all(item['size'] == 3 for item in report['results']))
+        json.dumps(report)
+
+if __name__ == '__main__':
+    unittest.main()
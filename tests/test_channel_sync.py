@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+from services.batch_processor import BatchProcessor
+from services.channel_sync import MAX_SYNC_RETRIES, ChannelSync, SyncCheckpoint
+from tests.fakes import SAMPLE_MESSAGE, FakeSheetsService, FakeSlackService
+
+class TestChannelSync(unittest.TestCase):
+    """채널 증분 동기화 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint = SyncCheckpoint(os.path.join(self.temp_dir.name, 'sync.json'))
+        self.slack = FakeSlackService({
+            '100.0': SAMPLE_MESSAGE, '101.0': '점심 메뉴', '102.0': SAMPLE_MESSAGE, '103.0': '회의록'
+        }, distinct_users=True)
+        self.sheets = FakeSheetsService()
+        self.sync = ChannelSync(BatchProcessor(self.slack, self.sheets), self.checkpoint)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_first_sync_writes_reports_and_saves_newest_ts(self):
+        """주간업무 현황만 시간순으로 기록하고 마지막 메시지 TS를 저장"""
+        result = self.sync.sync('C1')
+
+        self.assertEqual((result.scanned, result.reports, result.written), (4, 2, 2))
+        self.assertEqual(len(self.sheets.append_calls), 1)
+        self.assertEqual(result.oldest_after, '103.0')
+        self.assertEqual(self.checkpoint.get('C1'), {'oldest': '103.0', 'retry': {}, 'pending': None})
+        self.assertEqual(self.slack.fetched, [])  # 채널 기록의 본문을 그대로 사용
+
+    def test_rerun_without_new_messages_costs_one_call(self):
+        """새 메시지가 없으면 conversations_history 한 번만 호출"""
+        self.sync.sync('C1')
+        self.slack.history_calls = 0
+
+        result = self.sync.sync('C1')
+
+        self.assertEqual(self.slack.history_calls, 1)
+        self.assertEqual((result.scanned, result.reports), (0, 0))
+        self.assertEqual(len(self.sheets.append_calls), 1)
+
+    def test_checkpoint_without_path_is_kept_in_memory(self):
+        """저장 파일이 없어도 같은 프로세스 안에서는 위치를 기억"""
+        sync = ChannelSync(BatchProcessor(self.slack, self.sheets), SyncCheckpoint())
+        sync.sync('C1')
+        self.slack.history_calls = 0
+
+        result = sync.sync('C1')
+
+        self.assertEqual((self.slack.history_calls, result.reports), (1, 0))
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_only_new_reports_are_ingested(self):
+        """저장된 위치 이후 메시지만 기록"""
+        self.sync.sync('C1')
+        self.slack.messages['104.0'] = SAMPLE_MESSAGE
+
+        result = self.sync.sync('C1')
+
+        self.assertEqual((result.scanned, result.written), (1, 1))
+        self.assertEqual(result.oldest_before, '103.0')
+        self.assertEqual(result.oldest_after, '104.0')
+
+    def test_streams_in_chunks(self):
+        """chunk_size개씩 나누어 처리"""
+        for index in range(7):
+            self.slack.messages[f"{200 + index}.0"] = SAMPLE_MESSAGE
+        sync = ChannelSync(BatchProcessor(self.slack, self.sheets), self.checkpoint, chunk_size=3)
+
+        result = sync.sync('C1')
+
+        self.assertEqual(result.written, 9)
+        self.assertEqual([len(rows) for rows in self.sheets.append_calls], [3, 3, 3])
+
+    def test_interrupted_sync_resumes_after_committed_chunks(self):
+        """묶음을 기록할 때마다 위치를 남겨, 중단 후 다시 실행하면 기록하지 않은 오래된 메시지만 읽음"""
+        for index in range(5):
+            self.slack.messages[f"{200 + index}.0"] = SAMPLE_MESSAGE
+        processor = BatchProcessor(self.slack, self.sheets)
+        processor.build_row = _interrupting_for('102.0', processor.build_row)
+        sync = ChannelSync(processor, self.checkpoint, chunk_size=3)
+
+        with self.assertRaises(KeyboardInterrupt):
+            sync.sync('C1')
+        self.assertEqual(self.checkpoint.get('C1')['pending'], {'newest': '204.0', 'latest': '202.0'})
+
+        result = ChannelSync(BatchProcessor(self.slack, self.sheets), self.checkpoint, chunk_size=3).sync('C1')
+
+        self.assertEqual((result.scanned, result.written), (6, 4))
+        self.assertEqual([len(rows) for rows in self.sheets.append_calls], [3, 3, 1])
+        self.assertEqual(self.checkpoint.get('C1'), {'oldest': '204.0', 'retry': {}, 'pending': None})
+
+    def test_failed_reports_are_retried_then_dropped(self):
+        """실패한 보고서는 다음 동기화에서 다시 시도하고, 정해진 횟수를 넘기면 포기"""
+        processor = BatchProcessor(self.slack, self.sheets)
+        processor.build_row = _failing_for('102.0', processor.build_row)
+        sync = ChannelSync(processor, self.checkpoint)
+
+        result = sync.sync('C1')
+        self.assertEqual(len(result.failures), 1)
+        self.assertEqual(self.checkpoint.get('C1')['retry'], {'102.0': 1})
+
+        for _ in range(2, MAX_SYNC_RETRIES + 1):
+            result = sync.sync('C1')
+            self.assertEqual(result.retried, 1)
+
+        self.assertEqual(result.dropped, ['102.0'])
+        self.assertEqual(self.checkpoint.get('C1')['retry'], {})
+
+def _failing_for(thread_ts, build_row):
+    def wrapper(ref):
+        if ref.thread_ts == thread_ts:
+            raise Exception("파싱 실패")
+        return build_row(ref)
+    return wrapper
+
+def _interrupting_for(thread_ts, build_row):
+    def wrapper(ref):
+        if ref.thread_ts == thread_ts:
+            raise KeyboardInterrupt()  # 프로세스 중단
+        return build_row(ref)
+    return wrapper
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import os
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+from services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, create_breakers
+from services.rate_limiter import RateLimitScheduler
+
+class FakeApiError(Exception):
+    """status_code를 가진 응답을 담은 가짜 API 오류"""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.response = SimpleNamespace(status_code=status_code, headers={})
+
+class CountingCall:
+    """호출 횟수를 세고 error가 있으면 매번 오류를 내는 호출"""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return 'ok'
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Slack/Sheets 차단기 테스트"""
+
+    def test_opens_after_consecutive_failures_then_probes(self):
+        """연속 실패 후 열리고, 시간이 지나면 시험 호출 하나만 통과시킨 뒤 성공하면 닫힘"""
+        breaker = CircuitBreaker('sheets', failure_threshold=2, reset_timeout=0.05)
+        breaker.record_failure()
+        breaker.allow()
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.allow()
+
+        time.sleep(0.06)
+        self.assertEqual(breaker.state, HALF_OPEN)
+        breaker.allow()
+        with self.assertRaises(CircuitOpenError):
+            breaker.allow()  # 시험 호출 중에는 나머지를 바로 실패
+        breaker.record_success()
+
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertEqual(breaker.stats(), {'state': CLOSED, 'failures': 0, 'rejected': 2, 'opened': 1})
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker('slack', failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        breaker.allow()
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, OPEN)
+        self.assertEqual(breaker.stats()['opened'], 2)
+
+    def test_probe_interrupted_before_outcome_is_released(self):
+        """시험 호출이 결과를 기록하기 전에 끝나도 (대기 중 오류 등) 다음 호출이 다시 시험할 수 있음"""
+        breakers = create_breakers(failure_threshold=1, reset_timeout=0.05)
+        scheduler = RateLimitScheduler(limits={}, breakers=breakers)
+        breakers['sheets'].record_failure()
+        time.sleep(0.06)
+
+        def interrupted():
+            raise KeyboardInterrupt()
+
+        with self.assertRaises(KeyboardInterrupt):
+            scheduler.call('sheets:read', interrupted)
+        self.assertEqual(breakers['sheets'].state, HALF_OPEN)
+
+        self.assertEqual(scheduler.call('sheets:read', CountingCall()), 'ok')
+        self.assertEqual(breakers['sheets'].state, CLOSED)
+
+    def test_scheduler_fails_fast_while_open(self):
+        """5xx가 이어지면 재시도 중에 차단되고, 이후 호출은 함수를 부르지 않고 바로 실패"""
+        breakers = create_breakers(failure_threshold=3, reset_timeout=60)
+        scheduler = RateLimitScheduler(limits={}, max_retries=5, base_delay=0.001, breakers=breakers)
+        failing = CountingCall(FakeApiError(503))
+
+        with self.assertRaises(CircuitOpenError):
+            scheduler.call('sheets:write', failing)
+        self.assertEqual(failing.calls, 3)
+
+        healthy = CountingCall()
+        with self.assertRaises(CircuitOpenError):
+            scheduler.call('sheets:read', healthy)
+        self.assertEqual(healthy.calls, 0)
+        # 다른 백엔드는 영향 없음
+        self.assertEqual(scheduler.call('slack:tier3', healthy), 'ok')
+        self.assertEqual(scheduler.breaker_stats()['sheets']['state'], OPEN)
+
+    def test_client_errors_do_not_open(self):
+        """백엔드가 응답한 4xx와 연결 오류는 구분 (4xx는 실패로 세지 않음)"""
+        scheduler = RateLimitScheduler(limits={}, max_retries=0, breakers=create_breakers(failure_threshold=2))
+
+        for _ in range(3):
+            with self.assertRaises(FakeApiError):
+                scheduler.call('slack:tier3', CountingCall(FakeApiError(403)))
+        self.assertEqual(scheduler.breakers['slack'].state, CLOSED)
+
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                scheduler.call('slack:tier3', CountingCall(ConnectionError("연결 거부")))
+        self.assertEqual(scheduler.breakers['slack'].state, OPEN)
+
+    def test_open_state_is_shared_between_runs(self):
+        """상태 파일을 쓰면 다음 실행도 열린 상태로 시작하고, 닫히면 파일에서 지움"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'circuit.json')
+            breaker = CircuitBreaker('sheets', failure_threshold=1, reset_timeout=60, state_path=path)
+            breaker.record_failure()
+
+            restarted = CircuitBreaker('sheets', failure_threshold=1, reset_timeout=60, state_path=path)
+            self.assertEqual(restarted.state, OPEN)
+            self.assertEqual(CircuitBreaker('slack', state_path=path).state, CLOSED)
+
+            restarted.record_success()
+            self.assertEqual(CircuitBreaker('sheets', state_path=path).state, CLOSED)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from services.batch_processor import BatchProcessor, ThreadRef
+from services.dead_letter import DeadLetterStore, replay_dead_letters
+from services.write_spool import WriteSpool
+from tests.fakes import SAMPLE_MESSAGE, FakeSheetsService, FakeSlackService
+
+class TestDeadLetter(unittest.TestCase):
+    """실패 보고서 보관과 재처리 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = DeadLetterStore(os.path.join(self.temp_dir.name, 'dead_letters.db'))
+        self.slack = FakeSlackService({'1.1': SAMPLE_MESSAGE, '2.2': SAMPLE_MESSAGE})
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def fail_batch(self):
+        """Sheets 장애 중 일괄 처리 (두 보고서 모두 기록 실패)"""
+        processor = BatchProcessor(self.slack, FakeSheetsService(fail=True), dead_letters=self.store)
+        results = processor.run([ThreadRef('C1', '1.1', author_name='홍길동'), ThreadRef('C1', '2.2')])
+        return processor.record_failures(results)
+
+    def test_failures_are_stored_with_message_and_parsed_data(self):
+        self.assertEqual(self.fail_batch(), 2)
+
+        entries = self.store.entries()
+        self.assertEqual([entry.ref.thread_ts for entry in entries], ['1.1', '2.2'])
+        self.assertEqual(entries[1].ref.message, SAMPLE_MESSAGE)
+        self.assertEqual(entries[1].ref.author_name, '슬랙사용자')
+        self.assertEqual(entries[0].parsed_data['friday_date'], '2025-09-05')
+        self.assertIn('quota', entries[0].error)
+
+        # 같은 스레드가 다시 실패하면 교체하고 실패 횟수 증가
+        self.fail_batch()
+        self.assertEqual([entry.attempts for entry in self.store.entries()], [2, 2])
+
+    def test_replay_writes_in_one_call_without_slack(self):
+        """보관된 원문과 파싱 결과로 묶어서 다시 기록하고 보관소에서 삭제"""
+        self.fail_batch()
+        self.slack.fetched.clear()
+        sheets = FakeSheetsService()
+
+        result = replay_dead_letters(self.store, BatchProcessor(self.slack, sheets), batch_size=10)
+
+        self.assertEqual(len(result.replayed), 2)
+        self.assertEqual((result.failures, result.remaining), ([], 0))
+        self.assertEqual([len(rows) for rows in sheets.append_calls], [2])
+        self.assertEqual(self.slack.fetched, [])
+
+    def test_replay_keeps_failures_and_fetches_missing_messages(self):
+        """원문이 없는 보고서만 Slack에서 가져오고, 다시 실패하면 남겨 둠"""
+        self.store.add(ThreadRef('C1', '2.2'), "Slack 연결 차단 중")
+
+        result = replay_dead_letters(self.store, BatchProcessor(self.slack, FakeSheetsService(fail=True)))
+
+        self.assertEqual(self.slack.fetched, ['2.2'])
+        self.assertEqual((len(result.failures), result.remaining), (1, 1))
+        entry = self.store.entries()[0]
+        self.assertEqual(entry.attempts, 2)
+        self.assertIn('quota', entry.error)
+
+    def test_spooled_failures_are_not_stored(self):
+        """쓰기 대기열에 남은 보고서는 대기열이 다시 기록하므로 보관하지 않음"""
+        sheets = FakeSheetsService(fail=True)
+        spool = WriteSpool(os.path.join(self.temp_dir.name, 'spool.db'), sheets)
+        processor = BatchProcessor(self.slack, sheets, spool=spool, dead_letters=self.store)
+
+        results = processor.run([ThreadRef('C1', '1.1')])
+
+        self.assertTrue(results[0].spooled)
+        self.assertEqual(processor.record_failures(results), 0)
+        self.assertEqual(self.store.count(), 0)
+        spool.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from services.error_notifier import ErrorNotifier, error_class, has_deferred_errors
+
+class FakeSlackService:
+    """post_message 호출을 기록하는 가짜 Slack 서비스"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.posts = []
+        self.posted = threading.Event()
+
+    def post_message(self, channel_id, text):
+        if self.fail:
+            raise Exception("Slack 호출 차단 중")
+        self.posts.append((channel_id, text))
+        self.posted.set()
+
+class TestErrorNotifier(unittest.TestCase):
+    """오류 요약 알림 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.state_path = os.path.join(self.temp_dir.name, 'digest.json')
+        self.slack = FakeSlackService()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_errors_are_grouped_per_channel_and_class(self):
+        """같은 채널의 오류는 메시지 하나로, 같은 원인의 오류는 건수와 링크 예시로 묶음"""
+        notifier = ErrorNotifier(self.slack, max_samples=2)
+        for index in range(5):
+            notifier.notify('C1', Exception(f"Google Sheets 업데이트 오류: 503 (행 {1000 + index})"), f"17000000{index}.0001")
+        notifier.notify('C1', "메시지 내용을 가져올 수 없습니다.", '1700000009.0001')
+        notifier.notify('C2', "메시지 내용을 가져올 수 없습니다.")
+
+        self.assertEqual(notifier.pending_count(), 7)
+        self.assertEqual(self.slack.posts, [])  # notify는 전송하지 않음
+
+        self.assertEqual(notifier.flush(), 2)
+
+        channel, text = self.slack.posts[0]
+        self.assertEqual(channel, 'C1')
+        self.assertIn("오류 6건", text)
+        self.assertIn("• 5건 — Google Sheets 업데이트 오류: 503", text)
+        self.assertEqual(text.count('slack.com/archives/C1/p'), 3)
+        self.assertEqual(notifier.stats()['pending'], 0)
+
+    def test_error_class_ignores_volatile_numbers(self):
+        self.assertEqual(error_class(Exception("2025-09-05 보고서 12행 기록 실패")),
+                         error_class(Exception("2025-10-03 보고서 12행 기록 실패")))
+        self.assertNotEqual(error_class(ValueError("실패")), error_class(KeyError("실패")))
+
+    def test_posts_are_rate_limited(self):
+        """분당 전송 한도를 넘는 채널의 요약은 다음 전송으로 미룸"""
+        notifier = ErrorNotifier(self.slack, max_posts_per_minute=2)
+        for channel in ('C1', 'C2', 'C3'):
+            notifier.notify(channel, "실패")
+
+        self.assertEqual(notifier.flush(), 2)
+        self.assertEqual(notifier.pending_count(), 1)
+
+    def test_failed_post_keeps_errors(self):
+        notifier = ErrorNotifier(FakeSlackService(fail=True))
+        notifier.notify('C1', "실패")
+
+        self.assertEqual(notifier.flush(), 0)
+        self.assertEqual(notifier.stats()['failed_posts'], 1)
+        self.assertEqual(notifier.pending_count(), 1)
+
+    def test_runs_within_interval_are_merged(self):
+        """따로 실행해도 마지막 요약 후 interval 안의 오류는 파일에 모았다가 다음 요약에 합침"""
+        for _ in range(3):
+            notifier = ErrorNotifier(self.slack, interval=60, state_path=self.state_path)
+            notifier.notify('C1', Exception("Google Sheets 업데이트 오류: 503"))
+            notifier.close()
+
+        self.assertEqual(len(self.slack.posts), 1)
+        ErrorNotifier(self.slack, interval=60, state_path=self.state_path).close(force=True)
+        self.assertEqual(len(self.slack.posts), 2)
+        self.assertIn("• 2건", self.slack.posts[-1][1])
+
+    def test_deferred_digest_is_sent_by_later_successful_run(self):
+        """interval 안에 연속으로 실패한 뒤 성공한 실행도 끝날 때 미룬 요약을 보냄"""
+        for _ in range(2):
+            notifier = ErrorNotifier(self.slack, interval=0.3, state_path=self.state_path)
+            notifier.notify('C1', Exception("Google Sheets 업데이트 오류: 503"), '1700000000.0001')
+            notifier.close()
+        self.assertEqual(len(self.slack.posts), 1)
+        self.assertTrue(has_deferred_errors(self.state_path))
+
+        time.sleep(0.35)
+        ErrorNotifier(self.slack, interval=0.3, state_path=self.state_path).close()  # 실패 없는 실행
+
+        self.assertEqual(len(self.slack.posts), 2)
+        self.assertIn("• 1건", self.slack.posts[-1][1])
+        self.assertFalse(has_deferred_errors(self.state_path))
+
+    def test_concurrent_runs_do_not_overwrite_deferred_errors(self):
+        """동시에 실행된 두 실행이 끝나도 양쪽에서 미룬 오류가 모두 남음"""
+        first = ErrorNotifier(self.slack, interval=60, state_path=self.state_path)
+        second = ErrorNotifier(self.slack, interval=60, state_path=self.state_path)
+        first.notify('C1', Exception("Google Sheets 업데이트 오류: 503"))
+        first.close()  # 첫 요약 전송
+        first = ErrorNotifier(self.slack, interval=60, state_path=self.state_path)
+        first.notify('C1', Exception("Google Sheets 업데이트 오류: 503"))
+        second.notify('C1', Exception("Google Sheets 업데이트 오류: 503"))
+
+        first.close()
+        second.close()
+
+        self.assertEqual(len(self.slack.posts), 1)
+        ErrorNotifier(self.slack, interval=60, state_path=self.state_path).close(force=True)
+        self.assertEqual(len(self.slack.posts), 2)
+        self.assertIn("• 2건", self.slack.posts[-1][1])
+
+    def test_daemon_close_sends_everything(self):
+        """상주 서비스 종료 시에는 interval과 관계없이 남은 오류를 모두 보냄"""
+        notifier = ErrorNotifier(self.slack, interval=60, state_path=self.state_path)
+        notifier.notify('C1', "실패")
+        notifier.flush()
+        notifier.notify('C1', "실패")
+
+        notifier.close(force=True)
+
+        self.assertEqual(len(self.slack.posts), 2)
+
+    def test_background_flush(self):
+        """start() 후에는 interval마다 백그라운드에서 전송"""
+        notifier = ErrorNotifier(self.slack, interval=0.05)
+        notifier.start()
+        notifier.notify('C1', "실패")
+
+        self.assertTrue(self.slack.posted.wait(2))
+        notifier.close()
+        self.assertEqual(len(self.slack.posts), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from benchmarks.fake_servers import FakeSheetsServer, FakeSlackServer, FaultInjection
+from benchmarks.load_test import percentile, run_load_test
+from services.rate_limiter import RateLimitScheduler
+from services.sheets_client_factory import SheetsClientFactory
+from services.sheets_service import SheetsService
+from services.slack_service import SlackService
+
+class TestFakeSlackServer(unittest.TestCase):
+    """가짜 Slack 서버로 실제 SlackService 호출"""
+
+    def setUp(self):
+        threads = {('C1', '1.1'): {'user': 'U1', 'text': '주간업무 현황'},
+                   ('C1', '2.2'): {'user': 'U2', 'text': '두 번째'}}
+        # 첫 요청들 일부가 429를 받도록 높은 비율로 주입
+        self.server = FakeSlackServer(threads, {'U1': '홍길동', 'U2': '이은상'},
+                                      faults=FaultInjection(rate_limit_ratio=0.3, retry_after=0.01), seed=1)
+        self.server.start()
+        scheduler = RateLimitScheduler(limits={}, base_delay=0.01)
+        self.slack = SlackService('xoxb-test', scheduler=scheduler, base_url=self.server.base_url)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_replies_users_and_post(self):
+        """메시지/작성자 조회와 알림 전송이 429 재시도를 거쳐 성공"""
+        self.assertEqual(self.slack.get_message_content('C1', '1.1'), '주간업무 현황')
+        self.assertEqual(self.slack.get_message_author('C1', '1.1'), '홍길동')
+        self.slack.send_error_notification('C1', '실패')
+
+        self.assertEqual(self.server.posted, [{'channel': 'C1', 'text': '⚠️ 오류 발생: 실패'}])
+        stats = self.server.stats()
+        self.assertGreater(sum(values['rate_limited'] for values in stats.values()), 0)
+        self.assertEqual(self.slack.scheduler.stats()['slack:tier3']['calls'], 1)
+
+    def test_history_pages(self):
+        """conversations.history를 커서로 끝까지 순회"""
+        messages = list(self.slack.iter_channel_messages('C1'))
+        self.assertEqual([message['ts'] for message in messages], ['2.2', '1.1'])
+
+class TestFakeSheetsServer(unittest.TestCase):
+    """가짜 Sheets 서버로 실제 SheetsService(gspread) 호출"""
+
+    def setUp(self):
+        self.server = FakeSheetsServer(sheet_names=('주간',), faults=FaultInjection(error_ratio=0.2), seed=3)
+        self.server.start()
+        scheduler = RateLimitScheduler(limits={}, base_delay=0.01)
+        self.sheets = SheetsService(
+            None, self.server.spreadsheet_id, '주간', scheduler=scheduler,
+            client_factory=SheetsClientFactory(None, scheduler=scheduler, api_base_url=self.server.url)
+        )
+
+    def tearDown(self):
+        self.sheets.client_factory.close()
+        self.server.stop()
+
+    def test_append_and_read_rows(self):
+        """빈 행 탐색, batch_update 기록, A:B열 읽기가 서버에 저장된 값과 일치"""
+        rows = [{'slack_user_name': name, 'onleaf_simple_ratio': '10.00%', 'leshine_ratio': '20.00%',
+                 'oblible_ratio': '70.00%', 'slack_message_content': '내용'} for name in ('홍길동', '이은상')]
+
+        self.assertEqual(self.sheets.append_rows(rows), [2, 3])
+        self.assertEqual([row[:2] for row in self.sheets.read_index_rows()], [(2, '홍길동'), (3, '이은상')])
+
+        values = self.server.values('주간')
+        self.assertEqual(values[(2, 9)], '10.00%')
+        self.assertEqual(values[(3, 1)], '이은상')
+
+    def test_a1_ranges(self):
+        """열 전체, 열린 끝, 시트 이름이 붙은 범위 해석"""
+        self.assertEqual(self.server._parse_range("'주간'!A:A"), ('주간', 1, 1, None, 1))
+        self.assertEqual(self.server._parse_range('A2:B'), ('주간', 2, 1, None, 2))
+        self.assertEqual(self.server._parse_range('O5'), ('주간', 5, 15, 5, 15))
+
+class TestLoadTest(unittest.TestCase):
+    """부하 시험 실행"""
+
+    def test_small_run(self):
+        """깨진 메시지를 제외한 모든 보고서가 시트에 기록되고 백분위수가 계산됨"""
+        result = run_load_test(reports=30, workers=4, malformed_ratio=0.0,
+                               sheets_faults=FaultInjection(rate_limit_ratio=0.1, retry_after=0.01))
+
+        self.assertEqual(result['succeeded'], 30)
+        self.assertEqual(result['rows_written'], 30)
+        self.assertLessEqual(result['latency_ms']['p50'], result['latency_ms']['p99'])
+        self.assertEqual(result['slack_server']['conversations.replies']['requests'], 30)
+
+    def test_percentile(self):
+        self.assertEqual(percentile([1.0, 2.0, 3.0, 4.0, 5.0], 50), 3.0)
+        self.assertAlmostEqual(percentile([1.0, 2.0], 90), 1.9)
+        self.assertIsNone(percentile([], 50))
+
+if __name__ == '__main__':
+    unittest.main()
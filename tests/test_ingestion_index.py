@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+from services.ingestion_index import IngestionIndex
+
+class TestIngestionIndex(unittest.TestCase):
+    """기록한 보고서 색인 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'index.db')
+        self.index = IngestionIndex(self.path)
+
+    def tearDown(self):
+        self.index.close()
+        self.temp_dir.cleanup()
+
+    def test_find_by_thread_and_week(self):
+        """thread_ts 또는 (작성자, 주)로 기록한 행 찾기"""
+        self.index.record('1.1', '홍길동', '2025-09-05', 7)
+
+        self.assertEqual(self.index.find(thread_ts='1.1').row_number, 7)
+        self.assertEqual(self.index.find('9.9', '홍길동', '2025-09-05').thread_ts, '1.1')
+        self.assertIsNone(self.index.find('9.9', '홍길동', '2025-09-12'))
+
+    def test_rerecorded_thread_drops_previous_week(self):
+        """같은 스레드를 다른 주로 다시 기록하면 이전 작성자·주 항목은 남지 않음"""
+        self.index.record('1.1', '홍길동', '2025-09-05', 7)
+        self.index.record('1.1', '홍길동', '2025-09-12', 7)
+
+        self.assertIsNone(self.index.find(author_name='홍길동', week='2025-09-05'))
+        self.assertEqual(self.index.find(author_name='홍길동', week='2025-09-12').thread_ts, '1.1')
+        self.assertEqual(self.index.find(thread_ts='1.1').week, '2025-09-12')
+
+    def test_pending_rows_filled_on_flush(self):
+        """대기열 기록 완료 시 행 번호가 채워지고 재시작 후에도 유지됨"""
+        self.index.record('1.1', '홍길동', '2025-09-05', None)
+        self.assertIsNone(self.index.find(thread_ts='1.1').row_number)
+
+        self.index.on_flushed([('1.1', 12), (None, 13)])
+        self.index.close()
+
+        self.index = IngestionIndex(self.path)
+        self.assertEqual(self.index.find(thread_ts='1.1').row_number, 12)
+        self.assertEqual(self.index.find(author_name='홍길동', week='2025-09-05').row_number, 12)
+
+    def test_rebuild_from_sheet_rows(self):
+        """시트 A:B열 기준으로 색인을 다시 맞춤 (어긋난 스레드 제거)"""
+        self.index.record('1.1', '홍길동', '2025-09-05', 2)
+        self.index.record('2.2', '김철수', '2025-09-05', 3)  # 시트에서 지워진 행
+        self.index.record('3.3', '박영희', '2025-09-12', None)  # 대기열에 있는 행
+
+        stats = self.index.rebuild([(2, '홍길동', '2025-09-05'), (3, '이은상', '2025-09-05'),
+                                    (4, '홍길동', '2025-09-05')])
+
+        self.assertEqual(stats, {'rows': 3, 'weeks': 2, 'threads_kept': 2, 'threads_dropped': 1})
+        self.assertIsNone(self.index.find(thread_ts='2.2'))
+        self.assertEqual(self.index.find(author_name='이은상', week='2025-09-05').row_number, 3)
+        self.assertEqual(self.index.find(author_name='홍길동', week='2025-09-05').thread_ts, '1.1')
+        self.assertIsNone(self.index.find(author_name='박영희', week='2025-09-12').row_number)
+
+if __name__ == '__main__':
+    unittest.main()
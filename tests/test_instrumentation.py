@@ -0,0 +1,119 @@
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from services.instrumentation import Instrumentation, payload_size
+from services.message_parser import WeeklyReportParser
+from services.rate_limiter import RateLimitScheduler
+
+class FakeApiError(Exception):
+    """status_code/headers를 가진 응답을 담은 가짜 API 오류"""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.response = SimpleNamespace(status_code=status_code, headers={'Retry-After': '0'})
+
+class TestInstrumentation(unittest.TestCase):
+    """단계별 시간/API 호출 계측 테스트"""
+
+    def setUp(self):
+        self.instrumentation = Instrumentation()
+
+    def test_stage_counts_runs_and_time(self):
+        """with 블록마다 실행 횟수와 시간이 누적되고 예외가 나도 기록됨"""
+        with self.instrumentation.stage('parse'):
+            pass
+        with self.assertRaises(ValueError):
+            with self.instrumentation.stage('parse'):
+                raise ValueError('boom')
+
+        stage = self.instrumentation.summary()['stages']['parse']
+        self.assertEqual(stage['count'], 2)
+        self.assertGreaterEqual(stage['seconds'], stage['max_seconds'])
+
+    def test_record_call_aggregates_by_api_and_method(self):
+        """API·메서드별로 호출/오류/재시도/바이트가 합산됨"""
+        self.instrumentation.record_call('slack:tier3', 'conversations_replies', 0.1, 100, retries=1)
+        self.instrumentation.record_call('slack:tier3', 'conversations_replies', 0.2, 50, error=True)
+        self.instrumentation.record_call('sheets:write', 'batch_update', 0.3, 10)
+
+        summary = self.instrumentation.summary()
+        replies = summary['api_calls']['slack:tier3/conversations_replies']
+        self.assertEqual((replies['calls'], replies['errors'], replies['retries'], replies['bytes']), (2, 1, 1, 150))
+        self.assertEqual(summary['totals'], {'calls': 3, 'errors': 1, 'retries': 1, 'bytes': 160})
+
+    def test_hooks_receive_every_record(self):
+        """등록한 훅은 기록마다 호출되고, 훅 오류는 기록을 막지 않음"""
+        events = []
+        self.instrumentation.add_hook(lambda kind, name, values: events.append((kind, name)))
+        self.instrumentation.add_hook(lambda kind, name, values: 1 / 0)
+
+        self.instrumentation.record_stage('parse', 0.01)
+        self.instrumentation.record_call('sheets:read', 'col_values', 0.02)
+
+        self.assertEqual(events, [('stage', 'parse'), ('api_call', 'sheets:read/col_values')])
+        self.assertEqual(self.instrumentation.summary()['totals']['calls'], 1)
+
+    def test_prometheus_text_and_json_files(self):
+        """Prometheus 텍스트와 JSON 파일로 저장"""
+        self.instrumentation.record_stage('parse', 0.5)
+        self.instrumentation.record_call('sheets:write', 'batch_update', 0.25, 42)
+
+        text = self.instrumentation.prometheus_text()
+        self.assertIn('# TYPE weekly_report_stage_seconds_total counter', text)
+        self.assertIn('weekly_report_stage_runs_total{stage="parse"} 1', text)
+        self.assertIn('weekly_report_api_received_bytes_total{api="sheets:write",method="batch_update"} 42', text)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = os.path.join(temp_dir, 'metrics.json')
+            prom_path = os.path.join(temp_dir, 'metrics.prom')
+            self.instrumentation.write_json(json_path)
+            self.instrumentation.write_prometheus(prom_path)
+
+            with open(json_path, encoding='utf-8') as f:
+                self.assertEqual(json.load(f)['stages']['parse']['count'], 1)
+            with open(prom_path, encoding='utf-8') as f:
+                self.assertEqual(f.read(), text)
+            self.assertEqual(sorted(os.listdir(temp_dir)), ['metrics.json', 'metrics.prom'])
+
+    def test_payload_size(self):
+        """SlackResponse(data), 문자열, 값 목록의 크기 추정"""
+        self.assertEqual(payload_size(SimpleNamespace(data={'ok': True})), len('{"ok": true}'))
+        self.assertEqual(payload_size('홍길동'), 9)
+        self.assertEqual(payload_size([['a']]), len('[["a"]]'))
+        self.assertEqual(payload_size(None), 0)
+
+    def test_scheduler_records_calls_and_retries(self):
+        """요청 한도 스케줄러를 거친 호출이 메서드 이름으로 기록됨"""
+        scheduler = RateLimitScheduler(limits={}, base_delay=0, instrumentation=self.instrumentation)
+        errors = [FakeApiError(429)]
+
+        def conversations_replies():
+            if errors:
+                raise errors.pop(0)
+            return {'messages': []}
+
+        def users_info():
+            raise FakeApiError(404)
+
+        scheduler.call('slack:tier3', conversations_replies)
+        with self.assertRaises(FakeApiError):
+            scheduler.call('slack:tier4', users_info)
+
+        calls = self.instrumentation.summary()['api_calls']
+        self.assertEqual(calls['slack:tier3/conversations_replies']['retries'], 1)
+        self.assertEqual(calls['slack:tier3/conversations_replies']['bytes'], len('{"messages": []}'))
+        self.assertEqual(calls['slack:tier4/users_info']['errors'], 1)
+
+    def test_parser_records_parse_stage(self):
+        """파서는 기본 수집기에 parse 단계를 기록"""
+        from services.instrumentation import get_instrumentation
+
+        before = get_instrumentation().summary()['stages'].get('parse', {}).get('count', 0)
+        WeeklyReportParser().parse_message("2025년 9월 1주차 주간업무 현황")
+
+        self.assertEqual(get_instrumentation().summary()['stages']['parse']['count'], before + 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -99,6 +99,37 @@ class TestWeeklyReportParser(unittest.TestCase):
         self.assertEqual(ratios['onlief_simple_ratio'], '00.00%')
         self.assertEqual(ratios['leshaen_ratio'], '00.00%')
         self.assertEqual(ratios['oblive_ratio'], '00.00%')
+    
+    def test_time_section_stops_at_first_total(self):
+        """소요시간은 섹션 제목부터 첫 총합 줄까지만 읽음 (수가 산정 섹션 무시)"""
+        time_data = self.parser._extract_completion_times(self.sample_message)
+        
+        self.assertEqual(list(time_data), ['온리프', '르샤인', '오블리브', '심플', '총합'])
+        self.assertEqual(time_data['총합'], 52.0)
+    
+    def test_repeated_header_and_duplicate_hospital(self):
+        """반복된 섹션 제목은 건너뛰고, 한 줄에 같은 병원이 여러 번 나오면 첫 값만 사용"""
+        message = """금주 완료 작업 소요시간 합계(시간)
+금주 완료 작업 소요시간 합계(시간) 심플 : 9
+온리프 : 1 온리프 : 7
+르샤인 : 2
+총합 : 3 시간"""
+        
+        time_data = self.parser._extract_completion_times(message)
+        
+        self.assertEqual(time_data, {'온리프': 1.0, '르샤인': 2.0, '총합': 3.0})
+    
+    def test_custom_hospitals(self):
+        """병원 목록을 지정하면 해당 병원의 소요시간도 추출"""
+        parser = WeeklyReportParser(hospitals=['온리프', '심플', '심플치과'])
+        message = """금주 완료 작업 소요시간 합계(시간)
+온리프 : 1
+심플치과 : 4
+총합 : 5 시간"""
+        
+        time_data = parser._extract_completion_times(message)
+        
+        self.assertEqual(time_data, {'온리프': 1.0, '심플치과': 4.0, '총합': 5.0})
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,130 @@
+import threading
+import time
+import unittest
+from services.batch_processor import BatchProcessor, ThreadRef
+from services.pipeline import ReportPipeline
+
+REPORT = """2025년 9월 {week}주차 주간업무 현황
+기간 : 25. 9. 1 ~ 25. 9. 5
+
+금주 완료 작업 소요시간 합계(시간)
+온리프 : 1
+르샤인 : 2.5
+오블리브 : 48.5
+심플 : 0
+
+총합 : 52 시간"""
+
+class SlowSlackService:
+    """조회마다 지연이 있는 가짜 Slack 서비스 (동시 조회 수 기록)"""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get_message_content(self, channel_id, thread_ts):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if thread_ts.startswith('empty'):
+            return ""
+        return REPORT
+
+    def get_message_author(self, channel_id, thread_ts):
+        return f"작성자-{thread_ts}"
+
+class SlowSheetsService:
+    """기록마다 지연이 있는 가짜 Sheets 서비스"""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.append_calls = []
+        self.next_row = 2
+
+    def append_rows(self, rows):
+        time.sleep(self.delay)
+        self.append_calls.append(len(rows))
+        row_numbers = list(range(self.next_row, self.next_row + len(rows)))
+        self.next_row += len(rows)
+        return row_numbers
+
+class TestReportPipeline(unittest.TestCase):
+    """스트리밍 파이프라인 테스트"""
+
+    def test_results_in_input_order_with_per_item_errors(self):
+        """실패한 스레드만 실패로 처리하고 나머지는 기록, 결과는 입력 순서"""
+        slack = SlowSlackService()
+        sheets = SlowSheetsService()
+        refs = [ThreadRef('C1', f"{i}.0") for i in range(10)]
+        refs.insert(3, ThreadRef('C1', 'empty.0'))
+
+        results = ReportPipeline(BatchProcessor(slack, sheets), fetch_workers=4, write_batch=4).run(refs)
+
+        self.assertEqual([result.ref.thread_ts for result in results], [ref.thread_ts for ref in refs])
+        self.assertFalse(results[3].success)
+        self.assertIn('메시지 내용', results[3].error)
+        self.assertEqual(sum(result.success for result in results), 10)
+        self.assertEqual(sorted(result.row_number for result in results if result.success), list(range(2, 12)))
+        self.assertTrue(all(size <= 4 for size in sheets.append_calls))
+
+    def test_fetches_overlap_and_queues_are_bounded(self):
+        """여러 스레드를 동시에 가져오고, 큐 길이는 queue_size를 넘지 않음"""
+        slack = SlowSlackService(delay=0.02)
+        pipeline = ReportPipeline(BatchProcessor(slack, SlowSheetsService()), fetch_workers=4, queue_size=3,
+                                  write_batch=5)
+
+        start = time.perf_counter()
+        results = pipeline.run(ThreadRef('C1', f"{i}.0") for i in range(20))
+        elapsed = time.perf_counter() - start
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertGreater(slack.max_active, 1)
+        self.assertLess(elapsed, 20 * 0.02)  # 순차 조회보다 빠름
+        stats = pipeline.stats()
+        self.assertTrue(all(values['max_queue'] <= 3 for values in stats.values()))
+        self.assertEqual(stats['write']['processed'], 20)
+
+    def test_duplicates_across_batches_are_written_once(self):
+        """다른 묶음에 들어간 같은 작성자·주 보고서도 처음 것만 기록"""
+        slack = SlowSlackService(delay=0)
+        slack.get_message_author = lambda channel_id, thread_ts: '홍길동'
+        sheets = SlowSheetsService(delay=0)
+
+        results = ReportPipeline(BatchProcessor(slack, sheets), fetch_workers=1, write_batch=1).run(
+            [ThreadRef('C1', '1.0'), ThreadRef('C1', '2.0')]
+        )
+
+        self.assertEqual(sheets.append_calls, [1])
+        self.assertEqual(results[1].duplicate, 'skipped')
+
+    def test_input_error_is_raised_after_draining(self):
+        """입력 제너레이터 오류는 이미 넣은 스레드를 처리한 뒤 전달"""
+        sheets = SlowSheetsService(delay=0)
+
+        def refs():
+            yield ThreadRef('C1', '1.0')
+            raise Exception("Slack API 오류: ratelimited")
+
+        with self.assertRaises(Exception) as context:
+            ReportPipeline(BatchProcessor(SlowSlackService(delay=0), sheets)).run(refs())
+
+        self.assertIn('ratelimited', str(context.exception))
+        self.assertEqual(sheets.append_calls, [1])
+
+    def test_iter_results_streams(self):
+        """처리가 끝나는 대로 결과를 받을 수 있음"""
+        pipeline = ReportPipeline(BatchProcessor(SlowSlackService(delay=0), SlowSheetsService(delay=0)),
+                                  write_batch=2, write_interval=0.05)
+
+        results = list(pipeline.iter_results(ThreadRef('C1', f"{i}.0") for i in range(5)))
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(result.success for result in results))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import time
+import unittest
+from types import SimpleNamespace
+from services.rate_limiter import RateLimitScheduler, TokenBucket, slack_bucket
+
+class FakeApiError(Exception):
+    """status_code/headers를 가진 응답을 담은 가짜 API 오류"""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+class FlakyCall:
+    """정해진 오류를 차례로 낸 뒤 성공하는 호출"""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return value
+
+class TestRateLimiter(unittest.TestCase):
+    """요청 한도 스케줄러 테스트"""
+
+    def test_bucket_allows_burst_then_spaces_requests(self):
+        """버스트 한도까지는 바로 통과하고 이후에는 간격을 둠"""
+        bucket = TokenBucket(rate_per_minute=600, burst=3)  # 0.1초 간격
+
+        waits = [bucket.reserve() for _ in range(5)]
+
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(waits[3], 0.1, delta=0.02)
+        self.assertAlmostEqual(waits[4], 0.2, delta=0.02)
+
+    def test_retry_after_is_honored(self):
+        """429 응답의 Retry-After만큼 기다린 뒤 재시도"""
+        scheduler = RateLimitScheduler(limits={'sheets:write': 6000})
+        call = FlakyCall([FakeApiError(429, {'Retry-After': '0.05'})])
+
+        started = time.monotonic()
+        self.assertEqual(scheduler.call('sheets:write', call, 'ok'), 'ok')
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        self.assertEqual(call.calls, 2)
+        stats = scheduler.stats()['sheets:write']
+        self.assertEqual(stats['retries'], 1)
+        self.assertEqual(stats['calls'], 1)
+        self.assertGreaterEqual(stats['throttle_seconds'], 0.05)
+        self.assertEqual(stats['queue_depth'], 0)
+
+    def test_server_errors_retry_with_backoff(self):
+        """Retry-After가 없는 5xx는 지수 백오프로 재시도하고, 한도를 넘으면 오류 전달"""
+        scheduler = RateLimitScheduler(limits={}, max_retries=2, base_delay=0.01)
+
+        call = FlakyCall([FakeApiError(503), FakeApiError(500)])
+        self.assertEqual(scheduler.call('slack:tier3', call, 'ok'), 'ok')
+
+        call = FlakyCall([FakeApiError(503)] * 3)
+        with self.assertRaises(FakeApiError):
+            scheduler.call('slack:tier3', call, 'ok')
+        self.assertEqual(call.calls, 3)
+
+    def test_message_posts_retry_only_rate_limits(self):
+        """메시지 전송은 5xx면 이미 게시됐을 수 있으므로 재시도하지 않고, 429만 재시도"""
+        scheduler = RateLimitScheduler(limits={}, max_retries=2, base_delay=0.01)
+
+        call = FlakyCall([FakeApiError(503)])
+        with self.assertRaises(FakeApiError):
+            scheduler.call(slack_bucket('chat_postMessage'), call, 'ok')
+        self.assertEqual(call.calls, 1)
+
+        call = FlakyCall([FakeApiError(429, {'Retry-After': '0.01'})])
+        self.assertEqual(scheduler.call(slack_bucket('chat_postMessage'), call, 'ok'), 'ok')
+        self.assertEqual(call.calls, 2)
+
+    def test_client_errors_are_not_retried(self):
+        """400대 오류(429 제외)는 바로 전달"""
+        scheduler = RateLimitScheduler(limits={})
+        call = FlakyCall([FakeApiError(403)])
+
+        with self.assertRaises(FakeApiError):
+            scheduler.call('sheets:read', call, 'ok')
+        self.assertEqual(call.calls, 1)
+
+    def test_slack_method_tiers(self):
+        """Slack 메서드별 버킷"""
+        self.assertEqual(slack_bucket('conversations_replies'), 'slack:tier3')
+        self.assertEqual(slack_bucket('users_info'), 'slack:tier4')
+        self.assertEqual(slack_bucket('chat_postMessage'), 'slack:post')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from services.ratio_history import HistoryCache, RatioHistory, parse_ratio_strings
+
+def make_report(author_name, friday_date, onlief=0, simple=0, leshaen=0, oblive=0):
+    total = onlief + simple + leshaen + oblive
+    return {'author_name': author_name, 'friday_date': friday_date,
+            'time_data': {'온리프': onlief, '심플': simple, '르샤인': leshaen, '오블리브': oblive, '총합': total}}
+
+class FakeSnapshot:
+    """SheetSnapshot과 같은 columns 구조의 가짜 스냅샷"""
+
+    def __init__(self, rows):
+        self.columns = {name: np.array([row[index] for row in rows], dtype=str) for index, name in enumerate(
+            ('author_name', 'friday_date', 'onleaf_simple_ratio', 'leshine_ratio', 'oblible_ratio'))}
+
+    def __len__(self):
+        return len(self.columns['author_name'])
+
+class TestRatioHistory(unittest.TestCase):
+    """비율 기록 질의 API 테스트"""
+
+    def setUp(self):
+        self.history = RatioHistory.from_parsed([
+            make_report('홍길동', '2025-09-19', onlief=2, leshaen=2),
+            make_report('홍길동', '2025-09-05', onlief=5, oblive=5),
+            make_report('김철수', '2025-09-12', simple=1, leshaen=3),
+            make_report('홍길동', '2025-10-03', oblive=4),
+        ])
+
+    def test_select_uses_sorted_author_ranges(self):
+        """작성자·기간 조회는 날짜순 위치 반환"""
+        positions = self.history.select('홍길동', since='2025-09-06')
+
+        self.assertEqual([str(date) for date in self.history.dates[positions]], ['2025-09-19', '2025-10-03'])
+        self.assertEqual(len(self.history.select('없는사람')), 0)
+        self.assertEqual(len(self.history.select(until='2025-09-12')), 2)
+
+    def test_aggregate_by_author_and_month(self):
+        """그룹별 보고서 수, 평균 비율, 시간 합계"""
+        rows = self.history.aggregate(('author', 'month'))
+
+        self.assertEqual([(row['author'], row['month'], row['reports']) for row in rows], [
+            ('김철수', '2025-09', 1), ('홍길동', '2025-09', 2), ('홍길동', '2025-10', 1)])
+        september = rows[1]
+        self.assertEqual(september['onlief_simple_ratio'], 50.0)
+        self.assertEqual(september['leshaen_ratio'], 25.0)
+        self.assertEqual((september['total_hours'], september['온리프'], september['오블리브']), (14.0, 7.0, 5.0))
+
+    def test_missing_weeks_start_at_first_report(self):
+        """작성자의 첫 보고서 이전 주는 빠진 것으로 보지 않음"""
+        missing = self.history.missing_weeks(until='2025-10-03')
+
+        self.assertEqual(missing['홍길동'], ['2025-09-12', '2025-09-26'])
+        self.assertEqual(missing['김철수'], ['2025-09-19', '2025-09-26', '2025-10-03'])
+        self.assertEqual(self.history.missing_weeks(since='2025-09-15', authors=['홍길동']),
+                         {'홍길동': ['2025-09-26']})
+
+    def test_from_snapshot_parses_ratio_strings(self):
+        """시트 비율 문자열을 읽고 시간은 알 수 없음(None)으로 집계, 빈 행은 제외"""
+        history = RatioHistory.from_snapshot(FakeSnapshot([
+            ('홍길동', '2025-09-05', '40.00%', '60.00%', '00.00%'),
+            ('홍길동', '2025-09-12', '20.00%', '', '10.00%'),
+            ('', '', '', '', ''),
+            ('김철수', '날짜 오류', '50.00%', '50.00%', '00.00%'),
+        ]))
+
+        rows = history.aggregate()
+
+        self.assertEqual(len(history), 2)
+        self.assertEqual(rows[0]['reports'], 2)
+        self.assertEqual(rows[0]['onlief_simple_ratio'], 30.0)
+        self.assertEqual(rows[0]['leshaen_ratio'], 60.0)
+        self.assertIsNone(rows[0]['total_hours'])
+        np.testing.assert_array_equal(parse_ratio_strings(['1.50%', '', 'x']), [1.5, np.nan, np.nan])
+
+    def test_results_cached_until_data_changes(self):
+        """같은 데이터의 질의는 파일 캐시에서 읽고 데이터가 바뀌면 다시 계산"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'history.json')
+            reports = [make_report('홍길동', '2025-09-05', onlief=1)]
+            first = RatioHistory.from_parsed(reports, cache=HistoryCache(path)).aggregate()
+
+            cached = RatioHistory.from_parsed(reports, cache=HistoryCache(path))
+            cached._aggregate = None  # 다시 계산하면 실패
+            self.assertEqual(cached.aggregate(), first)
+
+            changed = RatioHistory.from_parsed(reports + [make_report('홍길동', '2025-09-12', oblive=1)],
+                                               cache=HistoryCache(path))
+            self.assertEqual(changed.aggregate()[0]['reports'], 2)
+            self.assertEqual(HistoryCache(path).fingerprint, changed.fingerprint)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from benchmarks.corpus import generate_authors, generate_corpus
+from services.message_parser import WeeklyReportParser
+from services.ratio_rollup import RatioBatch
+
+def make_report(author_name, friday_date, time_data):
+    return {'author_name': author_name, 'friday_date': friday_date, 'time_data': time_data}
+
+class TestRatioBatch(unittest.TestCase):
+    """배치 비율 계산/집계 테스트"""
+
+    def test_matches_scalar_ratios(self):
+        """보고서별 비율은 parse_message 결과와 같음 (총합 0, 병원 누락, 깨진 메시지 포함)"""
+        parser = WeeklyReportParser()
+        corpus = generate_corpus(300, seed=5, malformed_ratio=0.3)
+        parsed = [parser.parse_message(message, author)
+                  for message, author in zip(corpus, generate_authors(300, seed=5))]
+        parsed.append(parser.parse_message("금주 완료 작업 소요시간 합계(시간)\n온리프 : 0\n총합 : 0 시간"))
+
+        batch = RatioBatch.from_parsed(parsed)
+
+        self.assertEqual(batch.ratio_strings(), [parsed_data['ratios'] for parsed_data in parsed])
+
+    def test_rollup_by_author_and_month(self):
+        """작성자·월별로 시간을 합산한 뒤 비율 계산"""
+        batch = RatioBatch.from_parsed([
+            make_report('가', '2025-09-05', {'온리프': 1, '심플': 1, '르샤인': 2, '총합': 4}),
+            make_report('가', '2025-09-12', {'오블리브': 4, '총합': 4}),
+            make_report('나', '2025-09-05', {'총합': 0}),
+            make_report('가', '2025-10-03', {'르샤인': 1, '총합': 2}),
+        ])
+
+        rows = batch.rollup('author', 'month').to_dicts()
+
+        self.assertEqual([(row['author'], row['month'], row['reports']) for row in rows],
+                         [('가', '2025-09', 2), ('가', '2025-10', 1), ('나', '2025-09', 1)])
+        self.assertEqual(rows[0]['total_hours'], 8.0)
+        self.assertEqual(
+            (rows[0]['onlief_simple_ratio'], rows[0]['leshaen_ratio'], rows[0]['oblive_ratio']),
+            ('25.00%', '25.00%', '50.00%')
+        )
+        self.assertEqual(rows[2]['oblive_ratio'], '00.00%')
+
+    def test_rollup_by_week(self):
+        """주(금요일 날짜)별 집계"""
+        batch = RatioBatch.from_parsed([
+            make_report('가', '2025-09-05', {'르샤인': 1, '총합': 2}),
+            make_report('나', '2025-09-05', {'르샤인': 1, '총합': 2}),
+        ])
+
+        rows = batch.rollup('week').to_dicts()
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['week'], '2025-09-05')
+        self.assertEqual(rows[0]['leshaen_ratio'], '50.00%')
+
+    def test_invalid_rollup_key(self):
+        """지원하지 않는 기준은 오류"""
+        with self.assertRaises(ValueError):
+            RatioBatch.from_parsed([make_report('가', '2025-09-05', {})]).rollup('hospital')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import unittest
+import urllib.error
+import urllib.request
+from services.batch_processor import BatchProcessor, ThreadRef
+from services.report_daemon import ReportDaemon
+from tests.fakes import SAMPLE_MESSAGE, FakeSheetsService, FakeSlackService
+
+class TestReportDaemon(unittest.TestCase):
+    """상주 서비스 테스트"""
+
+    def setUp(self):
+        messages = {'1.1': SAMPLE_MESSAGE, **{f"{i}.0": SAMPLE_MESSAGE for i in range(20)}}
+        self.slack = FakeSlackService(messages, author="홍길동")
+        self.sheets = FakeSheetsService()
+        self.daemon = ReportDaemon(BatchProcessor(self.slack, self.sheets), workers=4)
+        self.port = self.daemon.start(port=0)
+
+    def tearDown(self):
+        self.daemon.stop()
+
+    def post(self, payload, query=''):
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{self.port}/reports{query}",
+            data=json.dumps(payload).encode('utf-8'),
+            method='POST'
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_http_event_runs_pipeline(self):
+        """HTTP 이벤트로 받은 보고서를 파싱해 시트에 기록"""
+        status, body = self.post({'channel_id': 'C1', 'thread_ts': '1.1'}, '?wait=1')
+
+        self.assertEqual(status, 200)
+        self.assertTrue(body['success'])
+        self.assertEqual(body['row_number'], 2)
+        self.assertEqual(self.sheets.rows[0].author_name, '홍길동')
+
+    def test_failure_and_bad_request(self):
+        """처리 실패와 잘못된 요청은 각각 500/400으로 응답"""
+        status, body = self.post({'channel_id': 'C1', 'thread_ts': 'missing'}, '?wait=1')
+        self.assertEqual(status, 500)
+        self.assertIn('메시지 내용', body['error'])
+
+        status, _ = self.post({'channel_id': 'C1'})
+        self.assertEqual(status, 400)
+
+    def test_non_object_payload_is_bad_request(self):
+        """JSON 객체가 아닌 요청 본문은 400으로 응답"""
+        for payload in (['C1', '1.1'], 'C1', 1, None):
+            status, body = self.post(payload)
+            self.assertEqual(status, 400)
+            self.assertIn('잘못된 요청', body['error'])
+        self.assertEqual(self.daemon.stats()['accepted'], 0)
+
+    def test_concurrent_submissions(self):
+        """워커 풀로 여러 보고서를 동시에 처리해도 모두 기록됨"""
+        futures = [self.daemon.submit(ThreadRef('C1', f"{i}.0")) for i in range(20)]
+        results = [future.result() for future in futures]
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(sorted(result.row_number for result in results), list(range(2, 22)))
+        self.assertEqual(self.daemon.stats(), {'accepted': 20, 'succeeded': 20, 'failed': 0})
+
+    def test_metrics_endpoint(self):
+        """처리한 보고서의 단계별 시간이 /metrics와 /health에 나타남"""
+        self.post({'channel_id': 'C1', 'thread_ts': '1.1'}, '?wait=1')
+
+        with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/metrics") as response:
+            self.assertTrue(response.headers['Content-Type'].startswith('text/plain'))
+            text = response.read().decode('utf-8')
+        self.assertIn('weekly_report_stage_runs_total{stage="report"}', text)
+        self.assertIn('weekly_report_stage_runs_total{stage="parse"}', text)
+
+        with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/health") as response:
+            health = json.loads(response.read())
+        self.assertIn('report', health['instrumentation']['stages'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from services.row_locator import RowLocator
+
+class FakeSnapshot:
+    """마지막 행 번호만 알려주는 가짜 시트 스냅샷"""
+
+    def __init__(self, last_row):
+        self.last_row = last_row
+
+    def __len__(self):
+        return self.last_row - 1
+
+    def last_row_number(self):
+        return self.last_row
+
+class TestRowLocator(unittest.TestCase):
+    """행 위치 탐색기 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cursor_path = os.path.join(self.temp_dir.name, 'cursor.json')
+        self.worksheet = MagicMock()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_scans_column_a_only(self):
+        """A열만 읽어 첫 번째 빈 행을 찾음"""
+        self.worksheet.col_values.return_value = ['이름', '홍길동', '', '김철수']
+        locator = RowLocator(self.worksheet)
+
+        self.assertEqual(locator.find_empty_rows(2), [3, 5])
+        self.worksheet.col_values.assert_called_once_with(1)
+        self.worksheet.get_all_values.assert_not_called()
+
+    def test_persisted_cursor_checked_with_narrow_read(self):
+        """저장된 커서는 주변 좁은 범위만 읽어 확인 후 사용"""
+        with open(self.cursor_path, 'w') as f:
+            json.dump({'sheet': 120}, f)
+        self.worksheet.get.return_value = [['홍길동']]
+        locator = RowLocator(self.worksheet, cursor_path=self.cursor_path, cursor_key='sheet')
+
+        self.assertEqual(locator.find_empty_rows(1), [120])
+        self.worksheet.get.assert_called_once_with('A119:A120')
+        self.worksheet.col_values.assert_not_called()
+
+        # 검증된 커서는 같은 프로세스에서 추가 조회 없이 이어서 사용
+        locator.mark_written([120])
+        self.assertEqual(locator.find_empty_rows(1), [121])
+        self.assertEqual(self.worksheet.get.call_count, 1)
+
+        with open(self.cursor_path) as f:
+            self.assertEqual(json.load(f), {'sheet': 121})
+
+    def test_stale_cursor_falls_back_to_scan(self):
+        """커서 위치가 이미 채워져 있으면 A열 전체를 다시 읽음"""
+        with open(self.cursor_path, 'w') as f:
+            json.dump({'sheet': 3}, f)
+        self.worksheet.get.return_value = [['홍길동'], ['다른 사람이 입력']]
+        self.worksheet.col_values.return_value = ['이름', '홍길동', '다른 사람이 입력']
+        locator = RowLocator(self.worksheet, cursor_path=self.cursor_path, cursor_key='sheet')
+
+        self.assertEqual(locator.find_empty_rows(1), [4])
+        self.worksheet.col_values.assert_called_once_with(1)
+
+    def test_snapshot_hint_avoids_column_scan(self):
+        """저장된 커서가 없으면 스냅샷의 마지막 행 다음을 좁은 범위로 확인해 사용"""
+        self.worksheet.get.return_value = [['홍길동']]
+        locator = RowLocator(self.worksheet, snapshot=FakeSnapshot(40))
+
+        self.assertEqual(locator.find_empty_rows(2), [41, 42])
+        self.worksheet.get.assert_called_once_with('A40:A42')
+        self.worksheet.col_values.assert_not_called()
+
+    def test_revalidate_detects_rows_appended_elsewhere(self):
+        """revalidate=True면 캐시가 있어도 기록 전마다 확인해, 다른 곳에서 추가된 행을 덮어쓰지 않음"""
+        self.worksheet.col_values.return_value = ['이름', '홍길동']
+        locator = RowLocator(self.worksheet, revalidate=True)
+        self.assertEqual(locator.find_empty_rows(1), [3])
+        locator.mark_written([3])
+
+        # 그사이 다른 사람이 4행에 입력
+        self.worksheet.get.return_value = [['홍길동'], ['외부 입력']]
+        self.worksheet.col_values.return_value = ['이름', '홍길동', '홍길동', '외부 입력']
+
+        self.assertEqual(locator.find_empty_rows(1), [5])
+        self.worksheet.get.assert_called_with('A3:A4')
+        self.assertEqual(self.worksheet.col_values.call_count, 2)
+
+    def test_revalidate_uses_narrow_read_when_unchanged(self):
+        """시트가 그대로면 좁은 범위만 읽고 A열 전체는 다시 읽지 않음"""
+        self.worksheet.col_values.return_value = ['이름', '홍길동']
+        locator = RowLocator(self.worksheet, revalidate=True)
+        locator.mark_written(locator.find_empty_rows(1))
+
+        self.worksheet.get.return_value = [['홍길동']]
+        self.assertEqual(locator.find_empty_rows(2), [4, 5])
+        self.worksheet.get.assert_called_once_with('A3:A5')
+        self.worksheet.col_values.assert_called_once_with(1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from benchmarks.fake_servers import FakeSheetsServer
+from models.spreadsheet_row import SpreadsheetRow
+from services.batch_processor import BatchProcessor, BatchResult, ThreadRef
+from services.rate_limiter import RateLimitScheduler
+from services.sheet_router import SheetRouter, SheetTarget, load_routing_rules
+from services.sheets_client_factory import SheetsClientFactory
+from services.write_spool import WriteSpool
+
+TEAM_A = SheetTarget('fake-spreadsheet', '팀A')
+TEAM_B = SheetTarget('fake-spreadsheet', '팀B')
+DEFAULT = SheetTarget('fake-spreadsheet', '기본')
+
+def make_row(author_name, friday_date='2025-09-05'):
+    return SpreadsheetRow(author_name=author_name, friday_date=friday_date, onleaf_simple_ratio='10.00%',
+                          full_message='-2025 9월 1주차(테스트)\n본문')
+
+class RecordingRouter:
+    """route 인자별 호출을 기록하는 가짜 라우터 (SheetRouter와 같은 인터페이스)"""
+
+    def __init__(self, routes):
+        self.routes = routes  # 채널 ID → SheetTarget
+        self.calls = []
+        self.next_row = {}
+
+    def route(self, channel_id, author_name):
+        return self.routes.get(channel_id, DEFAULT)
+
+    def append_rows(self, rows, route=None):
+        self.calls.append(('append_rows', route, [row.author_name for row in rows]))
+        start = self.next_row.get(route, 2)
+        self.next_row[route] = start + len(rows)
+        return list(range(start, start + len(rows)))
+
+class TestSheetRouter(unittest.TestCase):
+    """채널·작성자별 시트 라우팅 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.server = FakeSheetsServer(sheet_names=('기본', '팀A', '팀B'))
+        self.server.start()
+        scheduler = RateLimitScheduler(limits={}, base_delay=0.01)
+        self.factory = SheetsClientFactory(None, scheduler=scheduler, api_base_url=self.server.url)
+
+        routes_path = os.path.join(self.temp_dir.name, 'routes.json')
+        with open(routes_path, 'w', encoding='utf-8') as f:
+            json.dump({'routes': [
+                {'spreadsheet_id': TEAM_A.spreadsheet_id, 'sheet_name': '팀A', 'channels': ['CA']},
+                {'spreadsheet_id': TEAM_B.spreadsheet_id, 'sheet_name': '팀B', 'authors': ['김철수'],
+                 'channels': ['CB']},
+            ]}, f, ensure_ascii=False)
+        self.router = SheetRouter(DEFAULT, load_routing_rules(routes_path), self.factory, scheduler=scheduler)
+
+    def tearDown(self):
+        self.factory.close()
+        self.server.stop()
+        self.temp_dir.cleanup()
+
+    def test_first_matching_rule_wins(self):
+        """규칙 순서대로 채널 또는 작성자가 일치하는 시트, 없으면 기본 시트"""
+        self.assertEqual(self.router.route('CA', '김철수'), TEAM_A)
+        self.assertEqual(self.router.route('CX', '김철수'), TEAM_B)
+        self.assertEqual(self.router.route('CB', '홍길동'), TEAM_B)
+        self.assertEqual(self.router.route('CX', '홍길동'), DEFAULT)
+        self.assertEqual(self.router.targets(), [DEFAULT, TEAM_A, TEAM_B])
+
+    def test_targets_share_one_client_and_connection(self):
+        """시트마다 서비스를 하나씩 만들지만 클라이언트와 연결은 공유"""
+        self.assertEqual(self.router.append_rows([make_row('홍길동')], route=TEAM_A.key), [2])
+        self.assertEqual(self.router.append_rows([make_row('김철수')], route=TEAM_B), [2])
+        self.assertEqual(self.router.append_rows([make_row('이영희')]), [2])
+
+        self.assertIs(self.router.service(TEAM_A.key), self.router.service(TEAM_A))
+        self.assertIs(self.router.service(TEAM_A).client, self.router.service(TEAM_B).client)
+        self.assertEqual(self.factory.stats()['connections'], 1)
+        self.assertEqual(self.factory.stats()['metadata_fetches'], 3)
+        self.assertEqual(self.server.values('팀B')[(2, 1)], '김철수')
+        self.assertEqual(self.router.stats(), {TEAM_A.key: 1, TEAM_B.key: 1, DEFAULT.key: 1})
+
+    def test_invalid_rule_is_rejected(self):
+        path = os.path.join(self.temp_dir.name, 'bad.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'routes': [{'sheet_name': '팀A'}]}, f)
+
+        with self.assertRaises(ValueError):
+            load_routing_rules(path)
+
+class TestRoutedWrites(unittest.TestCase):
+    """라우팅된 일괄 기록과 쓰기 대기열 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.router = RecordingRouter({'CA': TEAM_A, 'CB': TEAM_B})
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def built(self, *pairs):
+        return [(BatchResult(ref=ThreadRef(channel, f"{index}.0"), success=True, author_name=author),
+                 make_row(author)) for index, (channel, author) in enumerate(pairs)]
+
+    def test_batch_writes_once_per_target(self):
+        """행을 시트별로 묶어 시트마다 한 번씩 기록하고 행 번호는 각 시트 기준"""
+        built = self.built(('CA', '가'), ('CB', '나'), ('CA', '다'), ('CX', '라'))
+
+        BatchProcessor(None, self.router).write_built(built, set())
+
+        self.assertEqual(self.router.calls, [
+            ('append_rows', TEAM_A.key, ['가', '다']),
+            ('append_rows', TEAM_B.key, ['나']),
+            ('append_rows', DEFAULT.key, ['라']),
+        ])
+        self.assertEqual([result.row_number for result, _ in built], [2, 2, 3, 2])
+
+    def test_failed_target_does_not_fail_others(self):
+        """한 시트 기록이 실패해도 다른 시트의 행은 성공"""
+        append_rows = self.router.append_rows
+
+        def failing(rows, route=None):
+            if route == TEAM_B.key:
+                raise Exception("Google Sheets 업데이트 오류: 403")
+            return append_rows(rows, route)
+
+        self.router.append_rows = failing
+        built = self.built(('CA', '가'), ('CB', '나'))
+
+        BatchProcessor(None, self.router).write_built(built, set())
+
+        self.assertEqual([result.success for result, _ in built], [True, False])
+
+    def test_spool_flushes_once_per_route(self):
+        """대기열은 행마다 시트 키를 저장하고 시트별로 묶어 기록"""
+        spool = WriteSpool(os.path.join(self.temp_dir.name, 'spool.db'), self.router)
+        processor = BatchProcessor(None, self.router, spool=spool)
+
+        processor.write_built(self.built(('CA', '가'), ('CB', '나'), ('CA', '다')), set())
+        spool.close()
+
+        self.assertEqual(self.router.calls, [
+            ('append_rows', TEAM_A.key, ['가', '다']),
+            ('append_rows', TEAM_B.key, ['나']),
+        ])
+
+    def test_spool_upgrades_old_database(self):
+        """route 열이 없는 이전 대기열 파일도 열어서 기본 시트로 기록"""
+        path = os.path.join(self.temp_dir.name, 'old.db')
+        conn = sqlite3.connect(path)
+        conn.execute("""CREATE TABLE pending_rows (id INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT,
+                        row_json TEXT NOT NULL, created_at REAL NOT NULL,
+                        attempts INTEGER NOT NULL DEFAULT 0, last_error TEXT)""")
+        conn.execute("INSERT INTO pending_rows (key, row_json, created_at) VALUES ('1.0', ?, 0)",
+                     (json.dumps({'author_name': '가', 'friday_date': '2025-09-05'}),))
+        conn.commit()
+        conn.close()
+
+        spool = WriteSpool(path, self.router)
+        self.assertEqual(spool.flush(), [('1.0', 2)])
+        spool.close()
+
+        self.assertEqual(self.router.calls, [('append_rows', None, ['가'])])
+
+if __name__ == '__main__':
+    unittest.main()
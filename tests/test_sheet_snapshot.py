@@ -0,0 +1,159 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from benchmarks.fake_servers import FakeSheetsServer
+from models.spreadsheet_row import SpreadsheetRow
+from services.batch_processor import BatchProcessor, ThreadRef
+from services.rate_limiter import RateLimitScheduler
+from services.sheet_snapshot import SheetSnapshot, message_hash
+from services.sheets_client_factory import SheetsClientFactory
+from services.sheets_service import SheetsService
+
+def make_row(author_name, friday_date, ratio='10.00%', message='본문'):
+    return SpreadsheetRow(author_name=author_name, friday_date=friday_date, onleaf_simple_ratio=ratio,
+                          leshine_ratio='20.00%', oblible_ratio='70.00%', full_message=f"-제목\n{message}")
+
+class TestSheetSnapshot(unittest.TestCase):
+    """시트 로컬 스냅샷 테스트 (가짜 Sheets 서버)"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'snapshot.npz')
+        self.server = FakeSheetsServer(sheet_names=('주간',))
+        self.server.start()
+        self.scheduler = RateLimitScheduler(limits={}, base_delay=0.01)
+        self.factory = SheetsClientFactory(None, scheduler=self.scheduler, api_base_url=self.server.url)
+        self.sheets = self.make_service(snapshot_path=None)
+        self.sheets.append_rows([make_row(f"작성자{i}", f"2025-09-{i + 1:02d}") for i in range(10)])
+
+    def tearDown(self):
+        self.factory.close()
+        self.server.stop()
+        self.temp_dir.cleanup()
+
+    def make_service(self, snapshot_path):
+        return SheetsService(None, self.server.spreadsheet_id, '주간', scheduler=self.scheduler,
+                             client_factory=self.factory, snapshot_path=snapshot_path)
+
+    def make_snapshot(self, **kwargs):
+        return SheetSnapshot(self.path, self.sheets.worksheet, self.scheduler, **kwargs)
+
+    def requests(self, method):
+        return self.server.stats().get(method, {}).get('requests', 0)
+
+    def test_full_then_delta_refresh(self):
+        """처음에는 전체, 이후에는 끝부분부터 새 행만 읽음"""
+        snapshot = self.make_snapshot()
+        self.assertEqual(snapshot.refresh()['mode'], 'full')
+        self.assertEqual(len(snapshot), 10)
+
+        self.sheets.append_rows([make_row('새작성자', '2025-09-26')])
+        stats = self.make_snapshot().refresh()
+
+        self.assertEqual((stats['mode'], stats['fetched_rows'], stats['added_rows'], stats['rows']),
+                         ('delta', 4, 1, 11))
+        self.assertEqual(self.requests('values.batchGet'), 2)
+
+    def test_lookups_match_sheet(self):
+        """색인 행과 열 값이 시트 값과 일치"""
+        snapshot = self.make_snapshot()
+        snapshot.refresh()
+
+        self.assertEqual(snapshot.find('작성자3', '2025-09-04'), 5)
+        self.assertIsNone(snapshot.find('작성자3', '2025-09-05'))
+        self.assertEqual(snapshot.last_row_number(), 11)
+        self.assertEqual(snapshot.index_rows()[:2], [(2, '작성자0', '2025-09-01'), (3, '작성자1', '2025-09-02')])
+        self.assertEqual(snapshot.columns['onleaf_simple_ratio'][0], '10.00%')
+        self.assertEqual(snapshot.columns['message_hash'][0], message_hash(self.server.values('주간')[(2, 15)]))
+        self.assertEqual(len(snapshot.select(since='2025-09-03', until='2025-09-05')), 3)
+
+    def test_changed_tail_triggers_full_reload(self):
+        """끝부분 행이 바뀌면 (삭제·수정) 전체를 다시 읽음"""
+        snapshot = self.make_snapshot()
+        snapshot.refresh()
+        self.sheets.update_rows([11], [make_row('수정됨', '2025-09-10', message='다른 본문')])
+
+        stats = snapshot.refresh()
+
+        self.assertEqual(stats['mode'], 'full')
+        self.assertEqual(snapshot.index_rows()[-1], (11, '수정됨', '2025-09-10'))
+
+    def test_stale_snapshot_is_fully_reloaded(self):
+        """전체 읽기 후 오래 지나면 전체를 다시 읽음"""
+        snapshot = self.make_snapshot(full_refresh_seconds=60)
+        snapshot.refresh()
+        snapshot.full_at = time.time() - 120
+
+        self.assertEqual(snapshot.refresh()['mode'], 'full')
+
+    def test_service_writes_update_snapshot_without_reads(self):
+        """SheetsService가 기록한 행은 다시 읽지 않고 스냅샷에 바로 반영"""
+        sheets = self.make_service(self.path)
+        self.assertEqual(sheets.read_index_rows()[0], (2, '작성자0', '2025-09-01'))
+        reads = self.requests('values.batchGet')
+
+        row_number = sheets.append_rows([make_row('홍길동', '2025-10-03')])[0]
+
+        self.assertEqual(sheets.snapshot.index_rows()[-1], (row_number, '홍길동', '2025-10-03'))
+        self.assertEqual(self.requests('values.batchGet'), reads)
+        # 파일에 저장되어 다음 실행에서도 사용
+        self.assertEqual(self.make_snapshot().index_rows()[-1], (row_number, '홍길동', '2025-10-03'))
+        self.assertEqual(self.make_snapshot().refresh()['mode'], 'delta')
+
+    def test_writes_append_to_log_instead_of_rewriting_npz(self):
+        """기록한 행은 npz를 다시 쓰지 않고 변경분 로그에 덧붙이고, 로그가 길어지면 npz에 합침"""
+        snapshot = self.make_snapshot(compact_rows=3)
+        snapshot.refresh()
+        saved_at = os.stat(self.path).st_mtime_ns
+
+        snapshot.record_rows([12, 13], [{'A': '홍길동', 'B': '2025-10-03', 'O': '본문'}, {'A': '김철수', 'B': '2025-10-03'}])
+
+        self.assertEqual(os.stat(self.path).st_mtime_ns, saved_at)
+        self.assertTrue(os.path.exists(snapshot.log_path))
+        reloaded = self.make_snapshot()
+        self.assertEqual(reloaded.find('김철수', '2025-10-03'), 13)
+        self.assertEqual(reloaded.columns['message_hash'][10], message_hash('본문'))
+
+        snapshot.record_rows([14], [{'A': '이영희', 'B': '2025-10-03'}])  # 로그 3행 - npz에 합침
+        self.assertFalse(os.path.exists(snapshot.log_path))
+        self.assertEqual(self.make_snapshot().last_row_number(), 14)
+
+    def test_lookups_served_from_snapshot(self):
+        """스냅샷을 쓰면 마지막 행, 작성자·주 중복 찾기를 O열 없이 스냅샷에서 처리"""
+        sheets = self.make_service(self.path)
+        self.assertEqual(sheets.get_last_row_number(), 11)
+        reads = self.server.stats()
+
+        processor = BatchProcessor(None, sheets)
+        entry = processor.find_duplicate(ThreadRef('C1', '9.9'), make_row('작성자3', '2025-09-04'))
+
+        self.assertEqual(entry.row_number, 5)
+        self.assertIsNone(processor.find_duplicate(ThreadRef('C1', '9.9'), make_row('작성자3', '2025-10-03')))
+        self.assertEqual(self.server.stats(), reads)
+
+        # 새 실행은 A열 전체 대신 스냅샷의 마지막 행 다음을 좁은 범위로 확인해 기록
+        self.assertEqual(self.make_service(self.path).append_rows([make_row('홍길동', '2025-10-03')]), [12])
+
+    def test_concurrent_records_are_all_saved(self):
+        """쓰기 대기열과 워커가 동시에 기록해도 배열과 파일이 깨지지 않음"""
+        snapshot = self.make_snapshot()
+        snapshot.refresh()
+
+        def record(worker):
+            for offset in range(5):
+                row_number = 12 + worker * 5 + offset
+                snapshot.record_rows([row_number], [{'A': f"작성자{row_number}", 'B': '2025-10-03', 'O': '본문'}])
+
+        threads = [threading.Thread(target=record, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(snapshot.index_rows()), 30)
+        self.assertEqual(self.make_snapshot().index_rows(), snapshot.index_rows())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+import gspread
+from services.rate_limiter import RateLimitScheduler
+from services.sheets_client_factory import SheetsClientFactory
+
+class FakeCredentials:
+    """토큰 발급만 흉내내는 서비스 계정 인증 정보"""
+
+    service_account_email = 'bot@example.iam.gserviceaccount.com'
+
+    def __init__(self):
+        self.token = None
+        self.expiry = None
+        self.issued = 0
+
+    def refresh(self, request):
+        self.issued += 1
+        self.token = f"token-{self.issued}"
+        self.expiry = datetime.utcnow() + timedelta(hours=1)
+
+class TestSheetsClientFactory(unittest.TestCase):
+    """Sheets 클라이언트 생성기 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.token_path = os.path.join(self.temp_dir.name, 'token.json')
+        self.metadata_path = os.path.join(self.temp_dir.name, 'metadata.json')
+        patcher = patch('services.sheets_client_factory.Credentials.from_service_account_file',
+                        side_effect=lambda *args, **kwargs: FakeCredentials())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_factory(self):
+        return SheetsClientFactory('credentials.json', token_cache_path=self.token_path,
+                                   metadata_cache_path=self.metadata_path, scheduler=RateLimitScheduler(limits={}))
+
+    def test_token_reused_across_runs(self):
+        """갱신한 토큰은 저장되어 다음 실행에서 OAuth 교환 없이 재사용"""
+        first = self.make_factory()
+        first.credentials().refresh(None)
+        self.assertEqual(first.stats()['token_refreshes'], 1)
+
+        second = self.make_factory()
+        credentials = second.credentials()
+
+        self.assertEqual(credentials.token, 'token-1')
+        self.assertEqual(credentials.issued, 0)
+        self.assertEqual(second.stats()['token_cache_hits'], 1)
+
+    def test_expired_token_not_reused(self):
+        """만료가 임박한 토큰은 불러오지 않음"""
+        with open(self.token_path, 'w', encoding='utf-8') as f:
+            json.dump({FakeCredentials.service_account_email: {
+                'token': 'old', 'expiry': (datetime.utcnow() + timedelta(minutes=1)).isoformat()
+            }}, f)
+
+        self.assertIsNone(self.make_factory().credentials().token)
+
+    def test_worksheet_metadata_cached(self):
+        """워크시트 메타데이터는 저장되어 같은 실행과 다음 실행에서 조회를 생략"""
+        client = MagicMock()
+        spreadsheet = MagicMock()
+        spreadsheet._properties = {'id': 'spreadsheet-id', 'title': '주간업무'}
+        spreadsheet.worksheet.side_effect = lambda title: gspread.Worksheet(
+            spreadsheet, {'sheetId': 7, 'title': title, 'index': 0}
+        )
+        client.open_by_key.return_value = spreadsheet
+
+        first = self.make_factory()
+        with patch.object(first, 'client', return_value=client):
+            worksheet = first.open_worksheet('spreadsheet-id', 'sheet')
+            self.assertIs(first.open_worksheet('spreadsheet-id', 'sheet'), worksheet)
+        self.assertEqual(first.stats()['metadata_fetches'], 1)
+
+        second = self.make_factory()
+        with patch.object(second, 'client', return_value=MagicMock()) as cached_client:
+            cached = second.open_worksheet('spreadsheet-id', 'sheet')
+
+        cached_client.return_value.open_by_key.assert_not_called()
+        self.assertEqual((cached.id, cached.title), (7, 'sheet'))
+        self.assertEqual(cached.spreadsheet.id, 'spreadsheet-id')
+        self.assertEqual(second.stats()['metadata_cache_hits'], 1)
+
+    def test_session_uses_tuned_pool(self):
+        """HTTPS 요청은 하나의 연결 풀 어댑터로 처리"""
+        factory = self.make_factory()
+        factory.pool_maxsize = 16
+
+        adapter = factory.session().get_adapter('https://sheets.googleapis.com')
+
+        self.assertEqual(adapter._pool_maxsize, 16)
+        self.assertIs(factory.session(), factory.session())
+        self.assertEqual(factory.stats()['connections'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
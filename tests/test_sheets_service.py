@@ -0,0 +1,136 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+import gspread
+from models.spreadsheet_row import SpreadsheetRow
+from services.row_locator import RowLocator
+from services.sheets_service import SheetsService
+
+def make_service(column_a):
+    """실제 인증 없이 가짜 워크시트를 가진 SheetsService 생성"""
+    with patch.object(SheetsService, '_setup_client'):
+        service = SheetsService('credentials.json', 'spreadsheet-id', 'sheet')
+    service.worksheet = MagicMock()
+    service.worksheet.col_values.return_value = column_a
+    service.row_locator = RowLocator(service.worksheet)
+    return service
+
+def make_row(author_name="테스트사용자"):
+    return SpreadsheetRow(
+        author_name=author_name,
+        friday_date="2025-09-05",
+        onleaf_simple_ratio="1.92%",
+        leshine_ratio="4.81%",
+        oblible_ratio="93.27%",
+        full_message="- 2025 9월 1주차(테스트사용자)\n테스트 메시지"
+    )
+
+class TestSheetsService(unittest.TestCase):
+    """SheetsService 쓰기 경로 테스트"""
+
+    def test_append_row_costs_one_write_request(self):
+        """한 행 입력은 batch_update 한 번으로 끝나야 함"""
+        service = make_service(['이름', '홍길동'])
+
+        row_number = service.append_row(make_row())
+
+        self.assertEqual(row_number, 3)
+        self.assertEqual(service.write_request_count, 1)
+        service.worksheet.update.assert_not_called()
+        service.worksheet.batch_update.assert_called_once()
+
+        value_ranges = service.worksheet.batch_update.call_args[0][0]
+        self.assertEqual(
+            [value_range['range'] for value_range in value_ranges],
+            ['A3', 'B3', 'I3', 'L3', 'N3', 'O3']
+        )
+
+    def test_empty_values_are_skipped(self):
+        """값이 없는 열은 요청에 포함하지 않음"""
+        service = make_service([])
+        row = make_row()
+        row.leshine_ratio = ""
+
+        service.append_row(row)
+
+        value_ranges = service.worksheet.batch_update.call_args[0][0]
+        self.assertNotIn('L1', [value_range['range'] for value_range in value_ranges])
+
+    def test_append_rows_fills_gaps_first(self):
+        """여러 행 입력 시 중간의 빈 행을 먼저 채우고 한 번에 기록"""
+        service = make_service(['이름', '', '홍길동'])
+
+        row_numbers = service.append_rows([make_row("가"), make_row("나")])
+
+        self.assertEqual(row_numbers, [2, 4])
+        self.assertEqual(service.write_request_count, 1)
+
+        value_ranges = service.worksheet.batch_update.call_args[0][0]
+        self.assertEqual(value_ranges[0], {'range': 'A2', 'values': [['가']]})
+        self.assertIn({'range': 'A4', 'values': [['나']]}, value_ranges)
+
+    def test_invalid_row_writes_nothing(self):
+        """변환 중 오류가 나면 어떤 셀도 기록되지 않음"""
+        service = make_service([])
+
+        with self.assertRaises(Exception):
+            service.append_rows([make_row(), {'slack_user_name': '누락된 필드'}])
+
+        service.worksheet.batch_update.assert_not_called()
+        self.assertEqual(service.write_request_count, 0)
+
+    def test_consecutive_appends_read_column_a_once(self):
+        """같은 프로세스 안의 연속 입력은 A열을 한 번만 읽음"""
+        service = make_service(['이름', '홍길동'])
+
+        self.assertEqual(service.append_row(make_row()), 3)
+        self.assertEqual(service.append_row(make_row()), 4)
+        self.assertEqual(service.get_last_row_number(), 4)
+
+        service.worksheet.col_values.assert_called_once_with(1)
+        service.worksheet.get_all_values.assert_not_called()
+
+    def test_update_row_overwrites_existing_row(self):
+        """기존 행 갱신은 빈 행 조회 없이 batch_update 한 번"""
+        service = make_service(['이름', '홍길동'])
+
+        service.update_row(2, make_row())
+
+        service.worksheet.col_values.assert_not_called()
+        value_ranges = service.worksheet.batch_update.call_args[0][0]
+        self.assertEqual({value_range['range'] for value_range in value_ranges},
+                         {'A2', 'B2', 'I2', 'L2', 'N2', 'O2'})
+
+    def test_read_index_rows_reads_two_columns(self):
+        """색인 재구성용으로 A:B열만 읽음 (빈 작성자 행 제외)"""
+        service = make_service([])
+        service.worksheet.get.return_value = [['홍길동', '2025-09-05'], [], ['김철수']]
+
+        rows = service.read_index_rows()
+
+        service.worksheet.get.assert_called_once_with('A2:B')
+        self.assertEqual(rows, [(2, '홍길동', '2025-09-05'), (4, '김철수', '')])
+
+    def test_stale_worksheet_reopens_and_retries_once(self):
+        """시트 이름이 바뀌어 범위 오류가 나면 메타데이터를 지우고 워크시트를 다시 열어 재시도"""
+        stale_worksheet = MagicMock()
+        stale_worksheet.col_values.return_value = ['이름']
+        stale_worksheet.batch_update.side_effect = gspread.exceptions.APIError(SimpleNamespace(
+            status_code=400,
+            json=lambda: {'error': {'code': 400, 'message': "Unable to parse range: 'sheet'!A2"}}
+        ))
+        fresh_worksheet = MagicMock()
+        fresh_worksheet.col_values.return_value = ['이름']
+        factory = MagicMock()
+        factory.open_worksheet.side_effect = [stale_worksheet, fresh_worksheet]
+
+        service = SheetsService('credentials.json', 'spreadsheet-id', 'sheet', client_factory=factory)
+        row_number = service.append_row(make_row())
+
+        self.assertEqual(row_number, 2)
+        factory.invalidate_metadata.assert_called_once_with('spreadsheet-id', 'sheet')
+        self.assertIs(service.worksheet, fresh_worksheet)
+        fresh_worksheet.batch_update.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
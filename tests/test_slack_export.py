@@ -0,0 +1,130 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+from services.batch_processor import BatchProcessor
+from services.ingestion_index import IngestionIndex
+from services.slack_export import ExportImporter, SlackExport, iter_json_array
+from tests.fakes import FakeSheetsService
+
+REPORT = """2025년 9월 {week}주차 주간업무 현황
+기간 : 25. 9. 1 ~ 25. 9. 5
+
+금주 완료 작업 소요시간 합계(시간)
+온리프 : 1
+르샤인 : 2.5
+오블리브 : 48.5
+심플 : 0
+
+총합 : 52 시간"""
+
+def write_export(path, files):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, content in files.items():
+            archive.writestr(name, json.dumps(content, ensure_ascii=False))
+
+class TestIterJsonArray(unittest.TestCase):
+    """스트리밍 JSON 배열 파서 테스트"""
+
+    def test_matches_json_load_for_any_chunk_size(self):
+        """조각 크기와 관계없이 json.loads와 같은 결과"""
+        data = [{'ts': '1.0', 'text': '가나다 ] , {'}, 12345, "문자열", [1, [2]], None, True]
+        text = json.dumps(data, ensure_ascii=False, indent=1)
+
+        for chunk_size in (1, 3, 16, 4096):
+            self.assertEqual(list(iter_json_array(io.StringIO(text), chunk_size)), data)
+
+    def test_malformed_input_raises_value_error(self):
+        """배열이 아니거나 잘린 파일은 ValueError"""
+        for text in ('{"a": 1}', '[{"a": 1}', '[1 2]', '[{"a": }]', ''):
+            with self.assertRaises(ValueError):
+                list(iter_json_array(io.StringIO(text), 4))
+
+class TestExportImporter(unittest.TestCase):
+    """Slack 내보내기 가져오기 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'export.zip')
+        write_export(self.path, {
+            'users.json': [
+                {'id': 'U1', 'real_name': '김철수'},
+                {'id': 'U2', 'profile': {'real_name': '이영희'}, 'deleted': True},
+            ],
+            'channels.json': [{'id': 'C1', 'name': 'weekly'}, {'id': 'C2', 'name': 'random'}],
+            'weekly/2025-09-05.json': [
+                {'type': 'message', 'subtype': 'channel_join', 'ts': '1.0', 'user': 'U1', 'text': '입장'},
+                {'type': 'message', 'ts': '2.0', 'user': 'U1', 'text': REPORT.format(week=1)},
+                {'type': 'message', 'ts': '3.0', 'user': 'U2', 'text': REPORT.format(week=1),
+                 'thread_ts': '3.0'},
+                {'type': 'message', 'ts': '4.0', 'user': 'U1', 'text': REPORT.format(week=1),
+                 'thread_ts': '2.0'},  # 답글
+            ],
+            'weekly/2025-09-12.json': [
+                {'type': 'message', 'ts': '5.0', 'user': 'U9', 'text': REPORT.format(week=2),
+                 'user_profile': {'real_name': '박민수'}},
+                {'type': 'message', 'ts': '6.0', 'user': 'U1', 'text': '점심 메뉴'},
+            ],
+            'random/2025-09-05.json': [
+                {'type': 'message', 'ts': '7.0', 'user': 'U1', 'text': REPORT.format(week=1)},
+            ],
+        })
+        self.sheets = FakeSheetsService()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def run_import(self, workers=0, index=None, **kwargs):
+        importer = ExportImporter(BatchProcessor(None, self.sheets, index=index), workers=workers, chunk_size=2)
+        with SlackExport(self.path) as export:
+            return importer.run(export, **kwargs)
+
+    def test_imports_top_level_reports_with_export_authors(self):
+        """답글과 시스템 메시지는 제외하고 users.json(없으면 메시지 프로필)으로 작성자 결정"""
+        result = self.run_import(channels=['weekly'])
+
+        self.assertEqual((result.files, result.messages, result.reports, result.written), (2, 6, 3, 3))
+        rows = [row for call in self.sheets.append_calls for row in call]
+        self.assertEqual([row.author_name for row in rows], ['김철수', '이영희', '박민수'])
+        self.assertEqual([len(call) for call in self.sheets.append_calls], [2, 1])
+
+    def test_date_range_skips_files(self):
+        """기간 밖 날짜 파일은 읽지 않음"""
+        result = self.run_import(oldest='2025-09-06')
+
+        self.assertEqual((result.files, result.messages, result.written), (1, 2, 1))
+
+    def test_process_pool_matches_in_process(self):
+        """프로세스 풀로 파싱해도 같은 행을 같은 순서로 기록"""
+        in_process = self.run_import()
+        rows = [row for call in self.sheets.append_calls for row in call]
+        self.sheets = FakeSheetsService()
+
+        pooled = self.run_import(workers=2)
+
+        self.assertEqual(pooled.written, in_process.written)
+        self.assertEqual([row for call in self.sheets.append_calls for row in call], rows)
+
+    def test_rerun_with_index_skips_recorded_reports(self):
+        """색인이 있으면 다시 가져와도 이미 기록한 보고서는 건너뜀"""
+        index = IngestionIndex(os.path.join(self.temp_dir.name, 'index.db'))
+        self.run_import(index=index)
+
+        result = self.run_import(index=index)
+
+        self.assertEqual((result.written, result.skipped), (0, result.reports))
+
+    def test_malformed_day_file_is_reported_and_skipped(self):
+        """형식이 잘못된 날짜 파일만 건너뛰고 나머지는 계속 처리"""
+        with zipfile.ZipFile(self.path, 'a') as archive:
+            archive.writestr('weekly/2025-09-19.json', '[{"ts": "8.0", "text": ')
+
+        result = self.run_import(channels=['weekly'])
+
+        self.assertEqual(result.bad_files, ['weekly/2025-09-19.json'])
+        self.assertEqual(result.written, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 네트워크 클라이언트와 설정 로딩에 쓰이는 무거운 라이브러리
+HEAVY_MODULES = ['slack_sdk', 'gspread', 'google.auth', 'google.oauth2', 'aiohttp', 'requests', 'dotenv', 'numpy']
+
+# 실행 방식별로 불러오면 안 되는 모듈 (import 예산)
+IMPORT_BUDGETS = {
+    'help': HEAVY_MODULES + ['services.slack_service', 'services.sheets_service'],
+    'dry_run': HEAVY_MODULES + ['services.slack_service', 'services.sheets_service', 'services.batch_processor'],
+}
+
+# main()을 실행한 뒤 불러온 모듈 중 예산을 넘은 것만 출력하는 스크립트
+PROBE = """
+import json, runpy, sys
+forbidden = json.loads(sys.argv[2])
+sys.argv = ['main.py'] + json.loads(sys.argv[1])
+sys.path.insert(0, '.')
+try:
+    runpy.run_path('main.py', run_name='__main__')
+except SystemExit:
+    pass
+sys.stderr.write(json.dumps([name for name in forbidden if name in sys.modules]))
+"""
+
+def imported_forbidden_modules(argv, forbidden):
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE, json.dumps(argv), json.dumps(forbidden)],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60
+    )
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+class TestStartupImports(unittest.TestCase):
+    """실행 방식별 import 예산 테스트"""
+
+    def test_help_imports_no_network_library(self):
+        """--help는 네트워크 클라이언트를 불러오지 않음"""
+        self.assertEqual(imported_forbidden_modules(['--help'], IMPORT_BUDGETS['help']), [])
+
+    def test_dry_run_from_file_imports_no_network_library(self):
+        """--from-file --dry-run은 파서와 행 모델만 불러옴"""
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write("2025년 9월 1주차 주간업무 현황\n금주 완료 작업 소요시간 합계(시간)\n온리프 : 1\n총합 : 1 시간")
+            path = f.name
+
+        try:
+            forbidden = imported_forbidden_modules(['--from-file', path, '--dry-run'], IMPORT_BUDGETS['dry_run'])
+        finally:
+            os.remove(path)
+
+        self.assertEqual(forbidden, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from services.user_cache import UserDirectoryCache
+
+class TestUserDirectoryCache(unittest.TestCase):
+    """사용자 이름 캐시 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'users.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_persisted_between_instances(self):
+        """파일에 저장된 캐시를 다음 실행에서 다시 사용"""
+        UserDirectoryCache(self.path).put('U1', '홍길동')
+
+        cache = UserDirectoryCache(self.path)
+
+        self.assertEqual(cache.get('U1'), '홍길동')
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 0, 'size': 1})
+
+    def test_expired_entry_is_a_miss(self):
+        """TTL이 지난 항목은 없는 것으로 취급"""
+        cache = UserDirectoryCache(ttl_seconds=60)
+        with patch('services.user_cache.time.time', return_value=1000):
+            cache.put('U1', '홍길동')
+        with patch('services.user_cache.time.time', return_value=1061):
+            self.assertIsNone(cache.get('U1'))
+
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.stats()['size'], 0)
+
+    def test_lru_eviction(self):
+        """최대 개수를 넘으면 가장 오래 사용하지 않은 항목부터 제거"""
+        cache = UserDirectoryCache(max_entries=2)
+        cache.put('U1', '가')
+        cache.put('U2', '나')
+        cache.get('U1')
+        cache.put('U3', '다')
+
+        self.assertIsNone(cache.get('U2'))
+        self.assertEqual(cache.get('U1'), '가')
+        self.assertEqual(cache.get('U3'), '다')
+
+    def test_lru_order_survives_reload(self):
+        """다시 읽어도 저장 시각이 아닌 마지막 사용 순서로 제거"""
+        cache = UserDirectoryCache(self.path, max_entries=2)
+        cache.put('U1', '가')
+        cache.put('U2', '나')
+        cache.get('U1')
+        cache.save()
+
+        reloaded = UserDirectoryCache(self.path, max_entries=2)
+        reloaded.put('U3', '다')
+
+        self.assertIsNone(reloaded.get('U2'))
+        self.assertEqual(reloaded.get('U1'), '가')
+
+    def test_save_failure_is_not_raised(self):
+        """캐시 파일을 쓸 수 없어도 예외 없이 계속 진행"""
+        cache = UserDirectoryCache(os.path.join(self.temp_dir.name, 'missing', 'users.json'))
+
+        cache.put('U1', '홍길동')
+
+        self.assertEqual(cache.get('U1'), '홍길동')
+
+if __name__ == '__main__':
+    unittest.main()
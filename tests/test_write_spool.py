@@ -0,0 +1,76 @@
+import os
+import tempfile
+import time
+import unittest
+from models.spreadsheet_row import SpreadsheetRow
+from services.write_spool import SpoolFlushError, WriteSpool
+from tests.fakes import FakeSheetsService
+
+def make_row(author_name):
+    return SpreadsheetRow(
+        author_name=author_name,
+        friday_date="2025-09-05",
+        onleaf_simple_ratio="1.92%",
+        full_message="- 2025 9월 1주차(테스트)\n본문"
+    )
+
+class TestWriteSpool(unittest.TestCase):
+    """Sheets 쓰기 대기열 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'spool.db')
+        self.sheets = FakeSheetsService()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_flush_coalesces_rows(self):
+        """대기 중인 행을 max_batch개씩 모아 기록"""
+        spool = WriteSpool(self.path, self.sheets, max_batch=2)
+        for name in ['가', '나', '다']:
+            spool.enqueue(make_row(name), key=name)
+
+        written = spool.flush()
+
+        self.assertEqual(written, [('가', 2), ('나', 3), ('다', 4)])
+        self.assertEqual([len(rows) for rows in self.sheets.append_calls], [2, 1])
+        self.assertEqual(self.sheets.append_calls[0][0], make_row('가'))
+        self.assertEqual(spool.pending_count(), 0)
+        spool.close()
+
+    def test_rows_survive_failure_and_restart(self):
+        """기록 실패 후 재시작해도 남은 행을 다시 기록"""
+        spool = WriteSpool(self.path, self.sheets)
+        spool.enqueue(make_row('가'), key='1.1')
+        self.sheets.fail = True
+
+        with self.assertRaises(SpoolFlushError):
+            spool.flush()
+        spool.close()
+
+        self.sheets.fail = False
+        restarted = WriteSpool(self.path, self.sheets)
+        self.assertEqual(restarted.pending_count(), 1)
+        self.assertEqual(restarted.flush(), [('1.1', 2)])
+        restarted.close()
+
+    def test_background_flush_on_size_threshold(self):
+        """건수 기준에 도달하면 백그라운드에서 바로 기록"""
+        spool = WriteSpool(self.path, self.sheets, max_batch=2, flush_interval=60)
+        spool.start()
+        spool.flush()  # 시작 시 남은 행 기록을 기다림
+        spool.enqueue(make_row('가'))
+        spool.enqueue(make_row('나'))
+
+        deadline = time.time() + 5
+        while spool.pending_count() and time.time() < deadline:
+            time.sleep(0.01)
+
+        spool.stop()
+        self.assertEqual(spool.pending_count(), 0)
+        self.assertEqual([len(rows) for rows in self.sheets.append_calls], [2])
+        spool.close()
+
+if __name__ == '__main__':
+    unittest.main()